@@ -11,9 +11,11 @@ Para executar:
     streamlit run exemplo_streamlit_app.py
 """
 
+import hashlib
 import streamlit as st
 import pandas as pd
 from pathlib import Path
+from indice_busca import IndiceBusca
 
 # Configuração da página
 st.set_page_config(
@@ -62,11 +64,18 @@ def carregar_dados(file):
     df = pd.read_csv(file)
     return df
 
+# Índice de busca, montado uma vez por versão do arquivo
+@st.cache_resource(max_entries=2)
+def construir_indice(versao, _df):
+    """Indexa título e texto completo de cada cláusula (posição = linha do DataFrame)"""
+    return IndiceBusca(_df['Título da Cláusula'].fillna('') + '\n' + _df['Cláusula Completa'].fillna(''))
+
 # Verifica se há arquivo carregado
 if uploaded_file is not None:
     try:
         # Carrega os dados
         df = carregar_dados(uploaded_file)
+        versao = hashlib.sha256(uploaded_file.getvalue()).hexdigest()
         
         # Verifica se o DataFrame tem as colunas esperadas
         colunas_esperadas = ['Sindicato', 'Convenção', 'Título da Cláusula', 'Resumo', 'Cláusula Completa']
@@ -123,13 +132,14 @@ if uploaded_file is not None:
         if convencao_selecionada != 'Todas':
             df_filtrado = df_filtrado[df_filtrado['Convenção'] == convencao_selecionada]
         
+        trechos = {}
         if busca:
-            # Busca em título e texto completo
-            mascara = (
-                df_filtrado['Título da Cláusula'].str.contains(busca, case=False, na=False) |
-                df_filtrado['Cláusula Completa'].str.contains(busca, case=False, na=False)
-            )
-            df_filtrado = df_filtrado[mascara]
+            # Busca em título e texto completo (sem acentos), ordenada por relevância
+            indice = construir_indice(versao, df)
+            permitidos = set(df.index.get_indexer(df_filtrado.index))
+            resultados = indice.buscar(busca, permitidos=permitidos)
+            df_filtrado = df.iloc[[posicao for posicao, _ in resultados]]
+            trechos = {df.index[posicao]: indice.trecho(posicao, busca) for posicao, _ in resultados}
         
         st.markdown("---")
         
@@ -165,6 +175,10 @@ if uploaded_file is not None:
                     # Resumo
                     st.markdown(f"**Resumo:** {row['Resumo']}")
                     
+                    # Trecho em que a busca foi encontrada
+                    if idx in trechos:
+                        st.markdown(f"**Trecho:** {trechos[idx]}")
+                    
                     # Texto completo
                     if modo_visualizacao == "Expandir uma por vez":
                         with st.expander("📖 Ver texto completo"):
@@ -210,7 +224,7 @@ else:
     ### Recursos:
     
     - ✅ Filtros por sindicato e convenção
-    - ✅ Busca por palavra-chave
+    - ✅ Busca por palavra-chave (sem acentos, ordenada por relevância, com trechos destacados)
     - ✅ Visualização de resumos e textos completos
     - ✅ Exportação de resultados filtrados
     - ✅ Interface intuitiva e responsiva
@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Índice de Busca Textual para Cláusulas de Convenções Coletivas
+
+Índice invertido sem acentos e sem diferença entre maiúsculas e minúsculas,
+com ranking BM25 e trechos destacados. É montado uma vez por versão do CSV;
+cada consulta percorre apenas as listas dos termos buscados.
+
+Uso:
+    indice = IndiceBusca(df['Título da Cláusula'] + '\\n' + df['Cláusula Completa'])
+    for posicao, pontuacao in indice.buscar("férias proporcionais"):
+        print(indice.trecho(posicao, "férias proporcionais"))
+"""
+
+import re
+import math
+import bisect
+import unicodedata
+from collections import Counter, defaultdict
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+PADRAO_PALAVRA = re.compile(r'\w+')
+
+# Parâmetros usuais do BM25
+K1 = 1.5
+B = 0.75
+
+# Sufixos de plural (do mais longo para o mais curto) e suas formas no singular
+SUFIXOS_PLURAL = (
+    ('ões', 'ão'), ('ães', 'ão'), ('ais', 'al'), ('éis', 'el'), ('eis', 'el'),
+    ('óis', 'ol'), ('is', 'il'), ('res', 'r'), ('zes', 'z'), ('ns', 'm'), ('s', ''),
+)
+
+
+@lru_cache(maxsize=4096)
+def _dobrar_caractere(caractere: str) -> str:
+    """Caractere em minúscula e sem acento, sempre com um único caractere"""
+    decomposto = unicodedata.normalize('NFKD', caractere.lower())
+    base = ''.join(c for c in decomposto if not unicodedata.combining(c))
+    return base if len(base) == 1 else caractere.lower()
+
+
+def dobrar(texto: str) -> str:
+    """
+    Texto em minúsculas e sem acentos, com o mesmo comprimento do original
+    (as posições valem para os dois, o que permite destacar o texto original)
+    """
+    return ''.join(_dobrar_caractere(c) for c in texto)
+
+
+_SUFIXOS_DOBRADOS = tuple((dobrar(s), dobrar(r)) for s, r in SUFIXOS_PLURAL)
+
+
+@lru_cache(maxsize=65536)
+def radical(palavra: str) -> str:
+    """
+    Radical simplificado de uma palavra já dobrada: remove o plural
+    ("férias" e "feria" casam; "adicionais" vira "adicional")
+    """
+    if len(palavra) <= 3 or palavra.isdigit():
+        return palavra
+    for sufixo, troca in _SUFIXOS_DOBRADOS:
+        if palavra.endswith(sufixo) and len(palavra) - len(sufixo) >= 3:
+            return palavra[:-len(sufixo)] + troca
+    return palavra
+
+
+class IndiceBusca:
+    """Índice invertido com ranking BM25"""
+
+    def __init__(self, documentos: Iterable[str], usar_radicais: bool = True):
+        """
+        Monta o índice
+
+        Args:
+            documentos: Textos a indexar; a posição de cada um é o seu identificador
+            usar_radicais: Se True, singular e plural são tratados como o mesmo termo
+        """
+        self.usar_radicais = usar_radicais
+        self.documentos: List[str] = []
+        self.tamanhos: List[int] = []
+        self.postagens: Dict[str, Dict[int, int]] = defaultdict(dict)
+
+        for posicao, texto in enumerate(documentos):
+            texto = texto if isinstance(texto, str) else ''
+            termos = self._termos(dobrar(texto))
+            self.documentos.append(texto)
+            self.tamanhos.append(len(termos))
+            for termo, frequencia in Counter(termos).items():
+                self.postagens[termo][posicao] = frequencia
+
+        self.postagens = dict(self.postagens)
+        self.vocabulario = sorted(self.postagens)
+        self.tamanho_medio = (sum(self.tamanhos) / len(self.tamanhos)) if self.tamanhos else 0.0
+
+    def __len__(self) -> int:
+        return len(self.documentos)
+
+    def _termo(self, palavra: str) -> str:
+        return radical(palavra) if self.usar_radicais else palavra
+
+    def _termos(self, texto_dobrado: str) -> List[str]:
+        return [self._termo(p) for p in PADRAO_PALAVRA.findall(texto_dobrado)]
+
+    def _expandir(self, palavra: str, prefixo: bool) -> Set[str]:
+        """Termos do índice para uma palavra da consulta (com prefixo: todos que começam por ela)"""
+        termos = {self._termo(palavra)} & self.postagens.keys()
+        if prefixo:
+            inicio = bisect.bisect_left(self.vocabulario, palavra)
+            for termo in self.vocabulario[inicio:]:
+                if not termo.startswith(palavra):
+                    break
+                termos.add(termo)
+        return termos
+
+    def termos_consulta(self, consulta: str) -> List[Set[str]]:
+        """
+        Termos do índice para cada palavra da consulta. A última palavra também
+        casa por prefixo, para a busca funcionar enquanto o usuário digita.
+        """
+        palavras = PADRAO_PALAVRA.findall(dobrar(consulta))
+        return [self._expandir(p, prefixo=(i == len(palavras) - 1)) for i, p in enumerate(palavras)]
+
+    def _idf(self, termo: str) -> float:
+        n = len(self.postagens[termo])
+        return math.log(1 + (len(self.documentos) - n + 0.5) / (n + 0.5))
+
+    def buscar(self, consulta: str, permitidos: Optional[Set[int]] = None,
+               limite: Optional[int] = None) -> List[Tuple[int, float]]:
+        """
+        Busca documentos que contêm todas as palavras da consulta
+
+        Args:
+            consulta: Texto digitado pelo usuário
+            permitidos: Se informado, só considera essas posições (filtros da tela)
+            limite: Número máximo de resultados
+
+        Returns:
+            Lista de (posição, pontuação BM25), da mais relevante para a menos
+        """
+        grupos = self.termos_consulta(consulta)
+        if not grupos or any(not termos for termos in grupos):
+            return []
+
+        # Documentos que têm ao menos um termo de cada palavra, começando pela palavra mais rara
+        candidatos = None
+        for termos in sorted(grupos, key=lambda t: sum(len(self.postagens[x]) for x in t)):
+            documentos = set()
+            for termo in termos:
+                documentos.update(self.postagens[termo])
+            candidatos = documentos if candidatos is None else candidatos & documentos
+            if not candidatos:
+                return []
+        if permitidos is not None:
+            candidatos &= permitidos
+
+        pontuacoes = dict.fromkeys(candidatos, 0.0)
+        for termo in set().union(*grupos):
+            idf = self._idf(termo)
+            for posicao, frequencia in self.postagens[termo].items():
+                if posicao in pontuacoes:
+                    normalizacao = K1 * (1 - B + B * self.tamanhos[posicao] / self.tamanho_medio)
+                    pontuacoes[posicao] += idf * frequencia * (K1 + 1) / (frequencia + normalizacao)
+
+        resultado = sorted(pontuacoes.items(), key=lambda item: (-item[1], item[0]))
+        return resultado[:limite] if limite else resultado
+
+    def trecho(self, posicao: int, consulta: str, largura: int = 240,
+               marcador: Tuple[str, str] = ('**', '**')) -> str:
+        """
+        Trecho do documento em torno da primeira ocorrência da consulta, com as
+        palavras encontradas destacadas (por padrão em negrito Markdown)
+        """
+        texto = self.documentos[posicao]
+        dobrado = dobrar(texto)
+        termos = set().union(*self.termos_consulta(consulta)) if consulta.strip() else set()
+
+        ocorrencias = [m for m in PADRAO_PALAVRA.finditer(dobrado) if self._termo(m.group()) in termos]
+        centro = ocorrencias[0].start() if ocorrencias else 0
+        inicio = max(0, centro - largura // 3)
+        fim = min(len(texto), inicio + largura)
+
+        # Não corta palavras nas pontas
+        if inicio > 0:
+            espaco = texto.find(' ', inicio)
+            inicio = espaco + 1 if 0 <= espaco < centro else inicio
+        if fim < len(texto):
+            espaco = texto.rfind(' ', inicio, fim)
+            fim = espaco if espaco > centro else fim
+
+        partes = ['…' if inicio > 0 else '']
+        cursor = inicio
+        for m in ocorrencias:
+            if m.start() < inicio:
+                continue
+            if m.end() > fim:
+                break
+            partes.append(texto[cursor:m.start()])
+            partes.append(marcador[0] + texto[m.start():m.end()] + marcador[1])
+            cursor = m.end()
+        partes.append(texto[cursor:fim])
+        partes.append('…' if fim < len(texto) else '')
+
+        return ' '.join(''.join(partes).split())
@@ -1,4 +1,5 @@
 # -*- mode: python ; coding: utf-8 -*-
+import importlib.util
 from PyInstaller.utils.hooks import collect_all
 
 datas = [('README_STANDALONE.md', '.')]
@@ -8,6 +9,11 @@ tmp_ret = collect_all('pytesseract')
 datas += tmp_ret[0]; binaries += tmp_ret[1]; hiddenimports += tmp_ret[2]
 tmp_ret = collect_all('PIL')
 datas += tmp_ret[0]; binaries += tmp_ret[1]; hiddenimports += tmp_ret[2]
+# Tesseract persistente (opcional): só quando o tesserocr está instalado
+if importlib.util.find_spec('tesserocr') is not None:
+    hiddenimports += ['tesserocr']
+    tmp_ret = collect_all('tesserocr')
+    datas += tmp_ret[0]; binaries += tmp_ret[1]; hiddenimports += tmp_ret[2]
 
 
 a = Analysis(
@@ -19,7 +25,7 @@ a = Analysis(
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
-    excludes=[],
+    excludes=['pandas'],
     noarchive=False,
     optimize=0,
 )
@@ -28,16 +34,13 @@ pyz = PYZ(a.pure)
 exe = EXE(
     pyz,
     a.scripts,
-    a.binaries,
-    a.datas,
     [],
+    exclude_binaries=True,
     name='ExtratorCCT',
     debug=False,
     bootloader_ignore_signals=False,
     strip=False,
-    upx=True,
-    upx_exclude=[],
-    runtime_tmpdir=None,
+    upx=False,
     console=False,
     disable_windowed_traceback=False,
     argv_emulation=False,
@@ -46,3 +49,12 @@ exe = EXE(
     entitlements_file=None,
     icon='NONE',
 )
+coll = COLLECT(
+    exe,
+    a.binaries,
+    a.datas,
+    strip=False,
+    upx=False,
+    upx_exclude=[],
+    name='ExtratorCCT',
+)
@@ -0,0 +1,256 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Base de cláusulas do Extrator de CCTs
+Descrição: Guarda as cláusulas da planilha mãe em SQLite com chave única
+(Sindicato, Convenção, título normalizado). A integração faz upsert em uma
+transação: cláusulas novas entram, as que mudaram são atualizadas e as iguais
+são ignoradas. Linhas apagadas à mão da planilha mãe também saem da base.
+Cada alteração fica registrada no histórico (com os valores anteriores), no
+lugar da cópia de backup da planilha inteira.
+"""
+
+import os
+import csv
+import time
+import sqlite3
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from cache_resumos import normalizar_texto
+
+
+COLUNAS = ['Sindicato', 'Convenção', 'Título da Cláusula', 'Resumo', 'Cláusula Completa']
+
+INSERIDA = 'inserida'
+ATUALIZADA = 'atualizada'
+REMOVIDA = 'removida'
+
+
+def caminho_base(csv_mae: str) -> Path:
+    """Banco mantido ao lado da planilha mãe"""
+    return Path(csv_mae).with_suffix('.sqlite')
+
+
+def _versao_arquivo(caminho: str) -> str:
+    info = os.stat(caminho)
+    return f"{info.st_mtime_ns}:{info.st_size}"
+
+
+class ResultadoIntegracao:
+    """Contagem de uma integração e as linhas que mudaram"""
+
+    def __init__(self):
+        self.inseridas: List[Dict[str, str]] = []
+        self.atualizadas = 0
+        self.iguais = 0
+        self.removidas = 0
+
+    @property
+    def total(self) -> int:
+        return len(self.inseridas) + self.atualizadas + self.iguais
+
+
+class BaseClausulas:
+    """Base SQLite de cláusulas com upsert e histórico de alterações"""
+
+    def __init__(self, caminho: str):
+        self.caminho = Path(caminho)
+        self.caminho.parent.mkdir(parents=True, exist_ok=True)
+
+        self._conn = sqlite3.connect(str(self.caminho))
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(
+            """CREATE TABLE IF NOT EXISTS clausulas (
+                   id INTEGER PRIMARY KEY,
+                   sindicato TEXT NOT NULL,
+                   convencao TEXT NOT NULL,
+                   titulo TEXT NOT NULL,
+                   titulo_normalizado TEXT NOT NULL,
+                   resumo TEXT NOT NULL,
+                   completa TEXT NOT NULL,
+                   atualizado REAL NOT NULL,
+                   UNIQUE (sindicato, convencao, titulo_normalizado)
+               );
+               CREATE TABLE IF NOT EXISTS historico (
+                   id INTEGER PRIMARY KEY,
+                   clausula_id INTEGER NOT NULL,
+                   operacao TEXT NOT NULL,
+                   titulo_anterior TEXT,
+                   resumo_anterior TEXT,
+                   completa_anterior TEXT,
+                   origem TEXT,
+                   data REAL NOT NULL,
+                   sindicato TEXT,
+                   convencao TEXT
+               );
+               CREATE INDEX IF NOT EXISTS historico_clausula ON historico (clausula_id);
+               CREATE TABLE IF NOT EXISTS metadados (
+                   chave TEXT PRIMARY KEY,
+                   valor TEXT NOT NULL
+               );"""
+        )
+        # Bases anteriores: o histórico não guardava sindicato/convenção (necessários
+        # para as cláusulas removidas, que não estão mais na tabela clausulas)
+        colunas_historico = {linha[1] for linha in self._conn.execute("PRAGMA table_info(historico)")}
+        for coluna in ('sindicato', 'convencao'):
+            if coluna not in colunas_historico:
+                self._conn.execute(f"ALTER TABLE historico ADD COLUMN {coluna} TEXT")
+        self._conn.commit()
+
+    def __enter__(self) -> 'BaseClausulas':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.fechar()
+
+    def __len__(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM clausulas").fetchone()[0]
+
+    def _metadado(self, chave: str) -> Optional[str]:
+        linha = self._conn.execute("SELECT valor FROM metadados WHERE chave = ?", (chave,)).fetchone()
+        return linha[0] if linha else None
+
+    def _guardar_metadado(self, chave: str, valor: str) -> None:
+        self._conn.execute("INSERT OR REPLACE INTO metadados (chave, valor) VALUES (?, ?)", (chave, valor))
+
+    def upsert(self, registros: Iterable[Dict[str, str]], origem: str = '') -> ResultadoIntegracao:
+        """
+        Insere ou atualiza as cláusulas em uma única transação.
+
+        registros usa as colunas do CSV (Sindicato, Convenção, Título da Cláusula,
+        Resumo, Cláusula Completa).
+        """
+        resultado = ResultadoIntegracao()
+        agora = time.time()
+
+        with self._conn:
+            for registro in registros:
+                valores = {coluna: (registro.get(coluna) or '') for coluna in COLUNAS}
+                chave = (valores['Sindicato'], valores['Convenção'],
+                         normalizar_texto(valores['Título da Cláusula']))
+
+                atual = self._conn.execute(
+                    """SELECT id, titulo, resumo, completa FROM clausulas
+                       WHERE sindicato = ? AND convencao = ? AND titulo_normalizado = ?""",
+                    chave
+                ).fetchone()
+
+                if atual is None:
+                    cursor = self._conn.execute(
+                        """INSERT INTO clausulas
+                           (sindicato, convencao, titulo, titulo_normalizado, resumo, completa, atualizado)
+                           VALUES (?, ?, ?, ?, ?, ?, ?)""",
+                        (*chave[:2], valores['Título da Cláusula'], chave[2],
+                         valores['Resumo'], valores['Cláusula Completa'], agora)
+                    )
+                    self._conn.execute(
+                        "INSERT INTO historico (clausula_id, operacao, origem, data) VALUES (?, ?, ?, ?)",
+                        (cursor.lastrowid, INSERIDA, origem, agora)
+                    )
+                    resultado.inseridas.append(valores)
+                    continue
+
+                clausula_id, titulo, resumo, completa = atual
+                novos = (valores['Título da Cláusula'], valores['Resumo'], valores['Cláusula Completa'])
+                if novos == (titulo, resumo, completa):
+                    resultado.iguais += 1
+                    continue
+
+                self._conn.execute(
+                    """INSERT INTO historico
+                       (clausula_id, operacao, titulo_anterior, resumo_anterior, completa_anterior, origem, data)
+                       VALUES (?, ?, ?, ?, ?, ?, ?)""",
+                    (clausula_id, ATUALIZADA, titulo, resumo, completa, origem, agora)
+                )
+                self._conn.execute(
+                    "UPDATE clausulas SET titulo = ?, resumo = ?, completa = ?, atualizado = ? WHERE id = ?",
+                    (*novos, agora, clausula_id)
+                )
+                resultado.atualizadas += 1
+
+        return resultado
+
+    def sincronizar_csv(self, csv_mae: str) -> Optional[ResultadoIntegracao]:
+        """
+        Importa a planilha mãe se ela mudou desde a última exportação (primeira
+        integração ou edição manual) e deixa a base igual a ela: cláusulas que
+        não estão mais na planilha (apagadas ou com o título renomeado) são
+        removidas da base. Devolve None quando já estava em dia.
+        """
+        if not os.path.exists(csv_mae) or self._metadado('versao_csv') == _versao_arquivo(csv_mae):
+            return None
+
+        origem = Path(csv_mae).name
+        with open(csv_mae, 'r', encoding='utf-8', newline='') as f:
+            registros = list(csv.DictReader(f))
+        resultado = self.upsert(registros, origem=origem)
+
+        chaves = {((r.get('Sindicato') or ''), (r.get('Convenção') or ''),
+                   normalizar_texto(r.get('Título da Cláusula') or '')) for r in registros}
+        agora = time.time()
+        with self._conn:
+            for clausula_id, *chave, titulo, resumo, completa in self._conn.execute(
+                    """SELECT id, sindicato, convencao, titulo_normalizado, titulo, resumo, completa
+                       FROM clausulas""").fetchall():
+                if tuple(chave) in chaves:
+                    continue
+                self._conn.execute(
+                    """INSERT INTO historico
+                       (clausula_id, operacao, titulo_anterior, resumo_anterior, completa_anterior,
+                        origem, data, sindicato, convencao)
+                       VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+                    (clausula_id, REMOVIDA, titulo, resumo, completa, origem, agora, chave[0], chave[1])
+                )
+                self._conn.execute("DELETE FROM clausulas WHERE id = ?", (clausula_id,))
+                resultado.removidas += 1
+            self._guardar_metadado('versao_csv', _versao_arquivo(csv_mae))
+        return resultado
+
+    def registros(self) -> Iterable[Dict[str, str]]:
+        """Cláusulas na ordem em que entraram na base"""
+        for linha in self._conn.execute(
+                "SELECT sindicato, convencao, titulo, resumo, completa FROM clausulas ORDER BY id"):
+            yield dict(zip(COLUNAS, linha))
+
+    def exportar_csv(self, csv_mae: str, resultado: Optional[ResultadoIntegracao] = None) -> None:
+        """
+        Atualiza a planilha mãe. Se a integração só inseriu cláusulas, elas são
+        acrescentadas ao fim do arquivo; se alguma foi atualizada, a planilha é
+        regravada a partir da base (arquivo temporário + renomeação).
+        """
+        if resultado is not None and not resultado.atualizadas and os.path.exists(csv_mae):
+            if resultado.inseridas:
+                with open(csv_mae, 'rb') as f:
+                    f.seek(max(0, os.path.getsize(csv_mae) - 1))
+                    termina_com_quebra = f.read() in (b'', b'\n')
+                with open(csv_mae, 'a', newline='', encoding='utf-8') as f:
+                    if not termina_com_quebra:
+                        f.write('\r\n')
+                    csv.DictWriter(f, fieldnames=COLUNAS, quoting=csv.QUOTE_ALL).writerows(resultado.inseridas)
+        else:
+            temporario = Path(csv_mae).with_suffix('.csv.tmp')
+            with open(temporario, 'w', newline='', encoding='utf-8') as f:
+                writer = csv.DictWriter(f, fieldnames=COLUNAS, quoting=csv.QUOTE_ALL)
+                writer.writeheader()
+                writer.writerows(self.registros())
+            os.replace(temporario, csv_mae)
+
+        with self._conn:
+            self._guardar_metadado('versao_csv', _versao_arquivo(csv_mae))
+
+    def historico(self, limite: int = 50) -> List[Dict]:
+        """Últimas alterações registradas"""
+        linhas = self._conn.execute(
+            """SELECT h.data, h.operacao, h.origem, COALESCE(c.sindicato, h.sindicato),
+                      COALESCE(c.convencao, h.convencao), COALESCE(c.titulo, h.titulo_anterior), h.resumo_anterior
+               FROM historico h LEFT JOIN clausulas c ON c.id = h.clausula_id
+               ORDER BY h.id DESC LIMIT ?""",
+            (limite,)
+        ).fetchall()
+        campos = ('data', 'operacao', 'origem', 'sindicato', 'convencao', 'titulo', 'resumo_anterior')
+        return [dict(zip(campos, linha)) for linha in linhas]
+
+    def fechar(self) -> None:
+        """Fecha a conexão com o banco"""
+        self._conn.close()
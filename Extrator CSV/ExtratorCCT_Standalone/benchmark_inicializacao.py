@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark da abertura do aplicativo (tempo até a primeira janela)
+Cada medição é um processo novo que executa main() até o ponto em que a
+janela da fila seria criada. Compara as importações antecipadas da versão
+anterior (fitz, PIL, pytesseract e openai no topo do módulo) com as
+importações adiadas. Com --executavel, mede executáveis gerados pelo
+build_exe.py (onefile x onedir) até a janela aparecer (só no Windows).
+
+Uso: python benchmark_inicializacao.py [--repeticoes 5]
+     python benchmark_inicializacao.py --executavel dist/ExtratorCCT/ExtratorCCT.exe antigo/ExtratorCCT.exe
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import tempfile
+import statistics
+import subprocess
+from pathlib import Path
+from typing import List
+
+PASTA = Path(__file__).resolve().parent
+MARCA = "JANELA_PRONTA"
+TITULOS_JANELA = ("Extrator de CCTs", "Configuração - Extrator de CCTs")
+
+# Importações que ficavam no topo de extrator_cct_standalone.py
+IMPORTACOES_ANTECIPADAS = ('fitz', 'PIL.Image', 'pytesseract', 'openai')
+
+MODOS = {
+    'antes': "importações no topo do módulo",
+    'depois': "importações adiadas",
+}
+
+
+def _filho(modo: str) -> None:
+    """Processo medido: roda main() e sai quando a janela da fila seria criada"""
+    if modo == 'antes':
+        import importlib
+        for nome in IMPORTACOES_ANTECIPADAS:
+            importlib.import_module(nome)
+
+    sys.path.insert(0, str(PASTA))
+    import extrator_cct_standalone as extrator
+
+    class _JanelaMedida:
+        def __init__(self, config_manager):
+            print(MARCA, flush=True)
+            raise SystemExit(0)
+
+    extrator.JanelaFila = _JanelaMedida
+    extrator.main()
+
+
+def _ambiente(pasta_config: str) -> dict:
+    """Configuração já feita (sem diálogo de primeira execução) em uma pasta temporária"""
+    for sub in ('.extrator_cct', 'ExtratorCCT'):
+        os.makedirs(os.path.join(pasta_config, sub), exist_ok=True)
+        with open(os.path.join(pasta_config, sub, 'config.json'), 'w', encoding='utf-8') as f:
+            json.dump({'configured': True, 'openai_api_key': 'sk-benchmark',
+                       'tesseract_path': sys.executable}, f)
+    env = dict(os.environ, HOME=pasta_config, APPDATA=pasta_config, PYTHONIOENCODING='utf-8')
+    env.pop('PYTHONPROFILEIMPORTTIME', None)
+    return env
+
+
+def medir_modo(modo: str, env: dict) -> float:
+    """Segundos do início do processo até a marca da janela"""
+    inicio = time.perf_counter()
+    processo = subprocess.Popen([sys.executable, __file__, '--filho', modo], env=env,
+                                stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+                                text=True, encoding='utf-8', errors='replace')
+    for linha in processo.stdout:
+        if linha.strip() == MARCA:
+            decorrido = time.perf_counter() - inicio
+            break
+    else:
+        processo.wait()
+        raise RuntimeError(f"o modo {modo} terminou sem chegar à janela (código {processo.returncode})")
+    processo.stdout.read()
+    processo.wait()
+    return decorrido
+
+
+def medir_executavel(caminho: str, env: dict, limite: float = 120.0) -> float:
+    """Segundos até uma janela do aplicativo aparecer (Windows: FindWindowW)"""
+    import ctypes
+    user32 = ctypes.windll.user32
+
+    inicio = time.perf_counter()
+    processo = subprocess.Popen([caminho], env=env)
+    try:
+        while time.perf_counter() - inicio < limite:
+            if any(user32.FindWindowW(None, titulo) for titulo in TITULOS_JANELA):
+                return time.perf_counter() - inicio
+            if processo.poll() is not None:
+                raise RuntimeError(f"{caminho} terminou sem abrir janela (código {processo.returncode})")
+            time.sleep(0.005)
+        raise RuntimeError(f"{caminho}: nenhuma janela em {limite:.0f}s")
+    finally:
+        processo.kill()
+        processo.wait()
+
+
+def _linha(nome: str, tempos: List[float], referencia: float) -> str:
+    mediana = statistics.median(tempos)
+    return (f"{nome:<44}{min(tempos) * 1000:>10.0f}{mediana * 1000:>12.0f}"
+            f"{referencia / mediana:>9.1f}x")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark do tempo até a primeira janela")
+    parser.add_argument('--repeticoes', type=int, default=5)
+    parser.add_argument('--executavel', nargs='+', help="Executáveis a comparar (o primeiro é a referência)")
+    parser.add_argument('--filho', choices=sorted(MODOS), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.filho:
+        _filho(args.filho)
+        return 1
+
+    if args.executavel and sys.platform != 'win32':
+        print("❌ --executavel só funciona no Windows")
+        return 2
+
+    with tempfile.TemporaryDirectory(prefix='benchmark_inicio_') as pasta_config:
+        env = _ambiente(pasta_config)
+        if args.executavel:
+            alvos = [(caminho, lambda c=caminho: medir_executavel(c, env)) for caminho in args.executavel]
+        else:
+            alvos = [(f"{modo} ({descricao})", lambda m=modo: medir_modo(m, env)) for modo, descricao in MODOS.items()]
+
+        # Uma rodada para aquecer o cache de disco do sistema
+        for _, medir in alvos:
+            medir()
+
+        resultados = {nome: [] for nome, _ in alvos}
+        for _ in range(args.repeticoes):
+            for nome, medir in alvos:
+                resultados[nome].append(medir())
+
+    print(f"⏱ Tempo até a primeira janela ({args.repeticoes} execuções)")
+    print()
+    print(f"{'':<44}{'Mín (ms)':>10}{'Mediana':>12}{'Ganho':>9}")
+    referencia = statistics.median(next(iter(resultados.values())))
+    for nome, tempos in resultados.items():
+        print(_linha(nome, tempos, referencia))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark da limpeza de texto para o CSV
+Compara a limpeza antiga (três replace, split/join e um gerador caractere a
+caractere) com limpeza_csv.limpar_para_csv (split/join e uma classe de regex)
+e com a forma em lote limpar_coluna (pandas), em todos os campos da planilha
+mãe.
+
+Uso: python benchmark_limpeza.py [CCTs_Extraidas.csv] [--repeticoes 5]
+"""
+
+import csv
+import sys
+import time
+import argparse
+from pathlib import Path
+from limpeza_csv import limpar_para_csv, limpar_coluna
+
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
+
+PLANILHA_PADRAO = Path(__file__).resolve().parents[2] / "CCTs_Extraidas.csv"
+
+
+def limpar_antigo(texto) -> str:
+    """Implementação anterior de _limpar_para_csv"""
+    if not isinstance(texto, str):
+        return str(texto)
+
+    texto = texto.replace('\r\n', ' ').replace('\n', ' ').replace('\r', ' ')
+    texto = ' '.join(texto.split())
+    texto = ''.join(char for char in texto if ord(char) >= 32 or char in '\t\n\r')
+
+    return texto.strip()
+
+
+def medir(funcao, repeticoes: int):
+    """Melhor tempo (ms) entre as repetições e o último resultado"""
+    melhor = float('inf')
+    resultado = None
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        resultado = funcao()
+        melhor = min(melhor, time.perf_counter() - inicio)
+    return melhor * 1000, resultado
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark da limpeza de texto para o CSV")
+    parser.add_argument('planilha', nargs='?', default=str(PLANILHA_PADRAO))
+    parser.add_argument('--repeticoes', type=int, default=5)
+    args = parser.parse_args()
+
+    with open(args.planilha, 'r', encoding='utf-8', newline='') as f:
+        linhas = list(csv.DictReader(f))
+    if not linhas:
+        print(f"❌ Planilha vazia: {args.planilha}")
+        return 1
+
+    colunas = list(linhas[0])
+    valores = [linha[coluna] for linha in linhas for coluna in colunas]
+    tamanho = sum(len(v) for v in valores)
+    print(f"📄 {args.planilha}: {len(linhas)} linhas, {len(valores)} campos, {tamanho / 1024:.0f} KB de texto")
+    print()
+
+    tempo_antigo, esperado = medir(lambda: [limpar_antigo(v) for v in valores], args.repeticoes)
+    tempo_novo, obtido = medir(lambda: [limpar_para_csv(v) for v in valores], args.repeticoes)
+    print(f"{'Implementação':<28}{'Tempo (ms)':>12}{'Ganho':>10}")
+    print(f"{'antiga (por campo)':<28}{tempo_antigo:>12.1f}{'1.0x':>10}")
+    print(f"{'nova (por campo)':<28}{tempo_novo:>12.1f}{tempo_antigo / tempo_novo:>9.1f}x")
+    iguais = obtido == esperado
+
+    if pd is not None:
+        df = pd.DataFrame(linhas, columns=colunas, dtype=object)
+        tempo_lote, limpo = medir(lambda: {c: limpar_coluna(df[c]) for c in colunas}, args.repeticoes)
+        print(f"{'limpar_coluna (pandas)':<28}{tempo_lote:>12.1f}{tempo_antigo / tempo_lote:>9.1f}x")
+        lote = [limpo[coluna].iloc[i] for i in range(len(linhas)) for coluna in colunas]
+        iguais = iguais and lote == esperado
+    else:
+        print("   (pandas não instalado: forma em lote não medida)")
+
+    print()
+    print("✓ Resultados idênticos" if iguais else "❌ Resultados diferentes!")
+    return 0 if iguais else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark da preparação de imagens para o OCR
+Compara, por página, o caminho antigo (pixmap -> PNG -> PIL -> PNG temporário)
+com o caminho direto (pix.samples -> PIL -> PPM temporário), em RGB e em cinza.
+O tempo do Tesseract em si não entra na medição (é igual nos dois caminhos).
+
+Uso: python benchmark_renderizacao.py [pdfs...] [--dpi 300] [--paginas 5]
+"""
+
+import io
+import os
+import sys
+import time
+import argparse
+import tempfile
+from pathlib import Path
+import fitz  # PyMuPDF
+from PIL import Image
+from motor_ocr import renderizar_pagina, imagem_do_pixmap, DPI_PADRAO
+
+PASTA_PDFS_PADRAO = Path(__file__).resolve().parents[2] / "pdfs"
+
+
+def caminho_png(page, dpi: int, destino: str) -> None:
+    """Caminho antigo: PNG em memória e PNG temporário para o Tesseract"""
+    pix = page.get_pixmap(dpi=dpi)
+    img = Image.open(io.BytesIO(pix.tobytes("png")))
+    img.save(destino + ".png", format="PNG")
+
+
+def caminho_direto(page, dpi: int, destino: str, cinza: bool) -> None:
+    """Caminho novo: imagem sobre pix.samples e PPM temporário"""
+    pix = renderizar_pagina(page, dpi, cinza)
+    img = imagem_do_pixmap(pix)
+    img.save(destino + ".ppm", format=img.format)
+
+
+def medir(funcao, *args) -> float:
+    """Executa a função e devolve o tempo em milissegundos"""
+    inicio = time.perf_counter()
+    funcao(*args)
+    return (time.perf_counter() - inicio) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark da preparação de imagens para OCR")
+    parser.add_argument("pdfs", nargs="*", help="PDFs a medir (padrão: pasta pdfs/ do projeto)")
+    parser.add_argument("--dpi", type=int, default=DPI_PADRAO)
+    parser.add_argument("--paginas", type=int, default=5, help="Páginas medidas por PDF")
+    args = parser.parse_args()
+
+    pdfs = [Path(p) for p in args.pdfs] or sorted(PASTA_PDFS_PADRAO.glob("*.pdf"))
+    if not pdfs:
+        print(f"❌ Nenhum PDF encontrado em {PASTA_PDFS_PADRAO}")
+        return 1
+
+    print("=" * 70)
+    print(f"BENCHMARK DE RENDERIZAÇÃO PARA OCR - {args.dpi} DPI")
+    print("=" * 70)
+    print(f"{'PDF':<40} {'PNG':>8} {'RGB':>8} {'CINZA':>8}  (ms/página)")
+
+    totais = {"png": 0.0, "rgb": 0.0, "cinza": 0.0}
+    total_paginas = 0
+
+    with tempfile.TemporaryDirectory() as pasta_tmp:
+        destino = os.path.join(pasta_tmp, "pagina")
+
+        for pdf in pdfs:
+            with fitz.open(pdf) as doc:
+                paginas = range(min(args.paginas, len(doc)))
+                tempos = {"png": 0.0, "rgb": 0.0, "cinza": 0.0}
+
+                for n in paginas:
+                    page = doc[n]
+                    tempos["png"] += medir(caminho_png, page, args.dpi, destino)
+                    tempos["rgb"] += medir(caminho_direto, page, args.dpi, destino, False)
+                    tempos["cinza"] += medir(caminho_direto, page, args.dpi, destino, True)
+
+            if not paginas:
+                continue
+
+            for chave in totais:
+                totais[chave] += tempos[chave]
+            total_paginas += len(paginas)
+
+            nome = pdf.name if len(pdf.name) <= 40 else pdf.name[:37] + "..."
+            print(f"{nome:<40} "
+                  f"{tempos['png'] / len(paginas):>8.1f} "
+                  f"{tempos['rgb'] / len(paginas):>8.1f} "
+                  f"{tempos['cinza'] / len(paginas):>8.1f}")
+
+    if not total_paginas:
+        print("❌ Nenhuma página medida")
+        return 1
+
+    media = {chave: valor / total_paginas for chave, valor in totais.items()}
+    print("-" * 70)
+    print(f"{'MÉDIA (' + str(total_paginas) + ' páginas)':<40} "
+          f"{media['png']:>8.1f} {media['rgb']:>8.1f} {media['cinza']:>8.1f}")
+    print()
+    print(f"✓ Economia por página (RGB):   {media['png'] - media['rgb']:.1f} ms "
+          f"({media['png'] / media['rgb']:.1f}x mais rápido)")
+    print(f"✓ Economia por página (cinza): {media['png'] - media['cinza']:.1f} ms "
+          f"({media['png'] / media['cinza']:.1f}x mais rápido)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
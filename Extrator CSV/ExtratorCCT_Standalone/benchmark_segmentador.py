@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark da segmentação de cláusulas
+Compara o laço antigo (para cada cabeçalho, varre as linhas seguintes até o
+próximo, aplicando re.match a cada linha) com o segmentador de passada única
+(segmentador_clausulas.segmentar). O texto de cada PDF é replicado 1x, 2x, 4x
+e 8x para mostrar como o tempo cresce com o tamanho do documento.
+
+Uso: python benchmark_segmentador.py [pdfs...] [--repeticoes 5]
+"""
+
+import re
+import sys
+import time
+import argparse
+from pathlib import Path
+import fitz  # PyMuPDF
+from segmentador_clausulas import segmentar
+
+PASTA_PDFS_PADRAO = Path(__file__).resolve().parents[2] / "pdfs"
+FATORES = (1, 2, 4, 8)
+
+
+def segmentar_antigo(texto: str):
+    """Implementação anterior (laços aninhados sobre as linhas)"""
+    linhas = texto.split('\n')
+    clausulas = []
+    i = 0
+
+    while i < len(linhas):
+        linha = linhas[i].strip()
+
+        if re.match(r'^CL[ÁA]USULA\s+', linha, re.IGNORECASE):
+            j = i + 1
+            while j < len(linhas):
+                if re.match(r'^CL[ÁA]USULA\s+', linhas[j].strip(), re.IGNORECASE):
+                    break
+                j += 1
+
+            clausulas.append((linha, '\n'.join(linhas[i + 1:j]).strip()))
+            i = j
+        else:
+            i += 1
+
+    return clausulas
+
+
+def segmentar_novo(texto: str):
+    return [(titulo, corpo) for titulo, corpo, _, _ in segmentar(texto)]
+
+
+def medir(funcao, texto: str, repeticoes: int) -> float:
+    """Melhor tempo (ms) entre as repetições"""
+    melhor = float('inf')
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        funcao(texto)
+        melhor = min(melhor, time.perf_counter() - inicio)
+    return melhor * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark da segmentação de cláusulas")
+    parser.add_argument("pdfs", nargs="*", help="PDFs a medir (padrão: pasta pdfs/ do projeto)")
+    parser.add_argument("--repeticoes", type=int, default=5)
+    args = parser.parse_args()
+
+    pdfs = [Path(p) for p in args.pdfs] or sorted(PASTA_PDFS_PADRAO.glob("*.pdf"))
+    if not pdfs:
+        print(f"❌ Nenhum PDF encontrado em {PASTA_PDFS_PADRAO}")
+        return 1
+
+    textos = []
+    for pdf in pdfs:
+        with fitz.open(pdf) as doc:
+            textos.append('\n'.join(page.get_text() for page in doc))
+
+    # Os dois caminhos precisam produzir exatamente as mesmas cláusulas
+    for pdf, texto in zip(pdfs, textos):
+        if segmentar_antigo(texto) != segmentar_novo(texto):
+            print(f"❌ Resultados diferentes em {pdf.name}")
+            return 1
+
+    print("=" * 70)
+    print(f"BENCHMARK DE SEGMENTAÇÃO - {len(pdfs)} PDFs")
+    print("=" * 70)
+    print(f"{'Tamanho':<10} {'Linhas':>9} {'Cláusulas':>10} {'Antigo':>10} {'Novo':>10} {'Ganho':>7}  (ms)")
+
+    for fator in FATORES:
+        antigo = novo = 0.0
+        linhas = clausulas = 0
+        for texto in textos:
+            texto = '\n'.join([texto] * fator)
+            linhas += texto.count('\n') + 1
+            clausulas += len(segmentar_novo(texto))
+            antigo += medir(segmentar_antigo, texto, args.repeticoes)
+            novo += medir(segmentar_novo, texto, args.repeticoes)
+
+        print(f"{str(fator) + 'x':<10} {linhas:>9} {clausulas:>10} "
+              f"{antigo:>10.1f} {novo:>10.1f} {antigo / novo:>6.1f}x")
+
+    print()
+    print("✓ Resultados idênticos ao segmentador antigo")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
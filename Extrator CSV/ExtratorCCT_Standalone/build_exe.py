@@ -3,11 +3,17 @@
 """
 Script para gerar executável do Extrator de CCTs
 Usa PyInstaller para criar um executável standalone
+
+Gera uma pasta (--onedir) em vez de um arquivo único: o --onefile extrai o
+pacote inteiro para uma pasta temporária a cada abertura, o que atrasa a
+primeira janela em alguns segundos. Pelo mesmo motivo as DLLs não são
+comprimidas com UPX (seriam descomprimidas a cada carga).
 """
 
 import os
 import sys
 import subprocess
+import importlib.util
 
 def build_exe():
     """Gera executável com PyInstaller"""
@@ -33,7 +39,8 @@ def build_exe():
     params = [
         "pyinstaller",
         "--name=ExtratorCCT",
-        "--onefile",  # Gera um único executável
+        "--onedir",  # Pasta com o executável e as bibliotecas (abre sem extrair nada)
+        "--noupx",  # DLLs sem compressão carregam direto do disco
         "--windowed",  # Sem console (comentar se quiser ver o console)
         "--icon=NONE",  # Adicione um ícone se tiver
         "--add-data=README_STANDALONE.md;.",  # Incluir README
@@ -42,9 +49,18 @@ def build_exe():
         "--hidden-import=openai",
         "--collect-all=pytesseract",
         "--collect-all=PIL",
+        "--exclude-module=pandas",  # Opcional no pytesseract; não é usado pelo aplicativo
         "extrator_cct_standalone.py"
     ]
     
+    # Tesseract persistente (opcional): entra no executável só se estiver instalado
+    if importlib.util.find_spec("tesserocr") is not None:
+        print("✓ tesserocr encontrado (Tesseract persistente incluído)")
+        params[-1:-1] = ["--hidden-import=tesserocr", "--collect-all=tesserocr"]
+    else:
+        print("⚠ tesserocr não instalado: o executável usará só o pytesseract")
+    print()
+    
     print("🔨 Gerando executável...")
     print(f"   Comando: {' '.join(params)}")
     print()
@@ -56,11 +72,11 @@ def build_exe():
         print("✅ EXECUTÁVEL GERADO COM SUCESSO!")
         print("=" * 70)
         print()
-        print("📁 Localização: dist/ExtratorCCT.exe")
+        print("📁 Localização: dist/ExtratorCCT/ExtratorCCT.exe")
         print()
         print("📝 Próximos passos:")
-        print("   1. Teste o executável: dist/ExtratorCCT.exe")
-        print("   2. Distribua o executável para outros computadores")
+        print("   1. Teste o executável: dist/ExtratorCCT/ExtratorCCT.exe")
+        print("   2. Distribua a pasta dist/ExtratorCCT inteira (compactada em .zip)")
         print("   3. Certifique-se de que o Tesseract OCR está instalado")
         print()
         
@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Cache de OCR do Extrator de CCTs
+Descrição: Guarda em disco (SQLite) o texto OCR de cada página, endereçado pelo
+hash do conteúdo da página + DPI + idioma/configuração do Tesseract, com limite
+de tamanho e descarte LRU
+
+Uso: python cache_ocr.py info | limpar | podar [--max-mb N]
+"""
+
+import sys
+import time
+import sqlite3
+import hashlib
+import argparse
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, Optional
+
+
+NOME_ARQUIVO = 'cache_ocr.sqlite'
+MAX_MB_PADRAO = 200
+
+
+def hash_conteudo_pagina(page) -> str:
+    """
+    Hash do que determina a imagem renderizada da página: fluxo de conteúdo,
+    Form XObjects (inclusive os aninhados), imagens embutidas (bytes brutos,
+    também as de dentro dos formulários), arquivos das fontes, dimensões e rotação.
+    Números de xref não entram: a mesma página em outro PDF tem o mesmo hash.
+    """
+    doc = page.parent
+    h = hashlib.sha256()
+    h.update(f"{tuple(page.rect)}|{page.rotation}".encode())
+    h.update(page.read_contents())
+
+    # Formulários desenhados com o mesmo nome podem ter conteúdos diferentes
+    for xref, nome, _invocador, bbox in page.get_xobjects():
+        matriz = doc.xref_get_key(xref, 'Matrix')[1]
+        h.update(f"|form|{nome}|{tuple(bbox)}|{matriz}|".encode())
+        h.update(doc.xref_stream_raw(xref) or b"")
+    for img in page.get_images(full=True):
+        h.update(f"|img|{img[7]}|".encode())
+        h.update(doc.xref_stream_raw(img[0]) or b"")
+        if img[1]:  # Máscara (SMask)
+            h.update(doc.xref_stream_raw(img[1]) or b"")
+    for fonte in page.get_fonts(full=True):
+        h.update(f"|fonte|{fonte[4]}|{fonte[3]}|{fonte[2]}|{fonte[5]}|".encode())
+        h.update(_bytes_fonte(doc, fonte[0]))
+
+    return h.hexdigest()
+
+
+def _bytes_fonte(doc, xref: int) -> bytes:
+    """Arquivo da fonte embutida (vazio para as 14 fontes padrão, que não têm arquivo)"""
+    if xref <= 0:
+        return b""
+    try:
+        return doc.extract_font(xref)[3] or b""
+    except Exception:
+        return b""
+
+
+class CacheOCR:
+    """Cache em disco do texto OCR por página, com limite de tamanho e descarte LRU"""
+
+    def __init__(self, caminho: str, max_mb: float = MAX_MB_PADRAO):
+        self.caminho = Path(caminho)
+        self.caminho.parent.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = int(max_mb * 1024 * 1024)
+        self.acertos = 0
+        self.faltas = 0
+        self._lock = threading.Lock()
+
+        self._conn = sqlite3.connect(str(self.caminho), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS paginas (
+                   chave TEXT PRIMARY KEY,
+                   texto TEXT NOT NULL,
+                   tamanho INTEGER NOT NULL,
+                   criado REAL NOT NULL,
+                   ultimo_acesso REAL NOT NULL
+               )"""
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_ultimo_acesso ON paginas(ultimo_acesso)")
+        self._conn.commit()
+
+    @staticmethod
+    def chave(hash_pagina: str, dpi: int, idioma: str, config: str = "", cinza: bool = False,
+              modo: str = "") -> str:
+        """
+        Monta a chave da página para uma configuração de OCR. modo distingue
+        textos obtidos de outro jeito no mesmo DPI (ex.: OCR adaptativo); vazio
+        mantém as chaves gravadas antes dele.
+        """
+        partes = f"{hash_pagina}|{dpi}|{idioma}|{config}|{'cinza' if cinza else 'rgb'}"
+        if modo:
+            partes += f"|{modo}"
+        return hashlib.sha256(partes.encode()).hexdigest()
+
+    def chave_pagina(self, page, dpi: int, idioma: str, config: str = "", cinza: bool = False,
+                     modo: str = "") -> str:
+        """Chave da página a partir do seu conteúdo"""
+        return self.chave(hash_conteudo_pagina(page), dpi, idioma, config, cinza, modo)
+
+    def obter(self, chave: str) -> Optional[str]:
+        """Devolve o texto em cache (e marca o acesso) ou None"""
+        with self._lock:
+            linha = self._conn.execute("SELECT texto FROM paginas WHERE chave = ?", (chave,)).fetchone()
+            if linha is None:
+                self.faltas += 1
+                return None
+
+            self._conn.execute("UPDATE paginas SET ultimo_acesso = ? WHERE chave = ?", (time.time(), chave))
+            self._conn.commit()
+            self.acertos += 1
+            return linha[0]
+
+    def guardar(self, chave: str, texto: str) -> None:
+        """Guarda o texto de uma página e poda o cache se passar do limite"""
+        agora = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO paginas (chave, texto, tamanho, criado, ultimo_acesso) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (chave, texto, len(texto.encode('utf-8')), agora, agora)
+            )
+            self._conn.commit()
+        self.podar()
+
+    def tamanho_total(self) -> int:
+        """Soma do tamanho dos textos em cache (bytes)"""
+        with self._lock:
+            return self._conn.execute("SELECT COALESCE(SUM(tamanho), 0) FROM paginas").fetchone()[0]
+
+    def podar(self, max_bytes: Optional[int] = None) -> int:
+        """Remove as páginas usadas há mais tempo até caber no limite; devolve quantas saíram"""
+        limite = self.max_bytes if max_bytes is None else max_bytes
+        excesso = self.tamanho_total() - limite
+        if excesso <= 0:
+            return 0
+
+        removidas = []
+        with self._lock:
+            for chave, tamanho in self._conn.execute(
+                    "SELECT chave, tamanho FROM paginas ORDER BY ultimo_acesso ASC"):
+                if excesso <= 0:
+                    break
+                removidas.append((chave,))
+                excesso -= tamanho
+
+            self._conn.executemany("DELETE FROM paginas WHERE chave = ?", removidas)
+            self._conn.commit()
+        return len(removidas)
+
+    def limpar(self) -> int:
+        """Remove todas as páginas; devolve quantas saíram"""
+        with self._lock:
+            total = self._conn.execute("SELECT COUNT(*) FROM paginas").fetchone()[0]
+            self._conn.execute("DELETE FROM paginas")
+            self._conn.commit()
+            self._conn.execute("VACUUM")
+        return total
+
+    def estatisticas(self) -> Dict:
+        """Resumo do conteúdo do cache"""
+        with self._lock:
+            total, tamanho, mais_antigo, mais_recente = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(tamanho), 0), MIN(ultimo_acesso), MAX(ultimo_acesso) FROM paginas"
+            ).fetchone()
+        return {
+            'caminho': str(self.caminho),
+            'paginas': total,
+            'tamanho_bytes': tamanho,
+            'limite_bytes': self.max_bytes,
+            'acesso_mais_antigo': mais_antigo,
+            'acesso_mais_recente': mais_recente,
+        }
+
+    def fechar(self) -> None:
+        """Fecha a conexão com o banco"""
+        with self._lock:
+            self._conn.close()
+
+
+def abrir_cache_padrao(config_manager) -> Optional[CacheOCR]:
+    """Abre o cache no diretório de configuração, ou None se estiver desativado"""
+    if not config_manager.config.get('cache_ocr', True):
+        return None
+    max_mb = config_manager.config.get('cache_ocr_max_mb', MAX_MB_PADRAO)
+    return CacheOCR(config_manager.config_dir / NOME_ARQUIVO, max_mb=max_mb)
+
+
+def _formatar_data(instante: Optional[float]) -> str:
+    if instante is None:
+        return "-"
+    return time.strftime("%d/%m/%Y %H:%M", time.localtime(instante))
+
+
+def main(argv: Optional[Iterable[str]] = None) -> int:
+    """Linha de comando para inspecionar ou esvaziar o cache de OCR"""
+    parser = argparse.ArgumentParser(description="Cache de OCR do Extrator de CCTs")
+    parser.add_argument("--arquivo", help="Banco do cache (padrão: diretório de configuração)")
+    sub = parser.add_subparsers(dest="comando", required=True)
+    sub.add_parser("info", help="Mostra tamanho e ocupação do cache")
+    sub.add_parser("limpar", help="Remove todas as páginas do cache")
+    podar = sub.add_parser("podar", help="Descarta as páginas menos usadas até caber no limite")
+    podar.add_argument("--max-mb", type=float, help="Limite desejado em MB (padrão: limite configurado)")
+    args = parser.parse_args(argv)
+
+    if args.arquivo:
+        cache = CacheOCR(args.arquivo)
+    else:
+        from extrator_cct_standalone import ConfigManager
+        config_manager = ConfigManager()
+        max_mb = config_manager.config.get('cache_ocr_max_mb', MAX_MB_PADRAO)
+        cache = CacheOCR(config_manager.config_dir / NOME_ARQUIVO, max_mb=max_mb)
+
+    try:
+        if args.comando == "info":
+            info = cache.estatisticas()
+            print(f"📁 Arquivo: {info['caminho']}")
+            print(f"   Páginas em cache: {info['paginas']}")
+            print(f"   Tamanho: {info['tamanho_bytes'] / 1024 / 1024:.2f} MB "
+                  f"de {info['limite_bytes'] / 1024 / 1024:.0f} MB")
+            print(f"   Acesso mais antigo: {_formatar_data(info['acesso_mais_antigo'])}")
+            print(f"   Acesso mais recente: {_formatar_data(info['acesso_mais_recente'])}")
+        elif args.comando == "limpar":
+            print(f"🗑 {cache.limpar()} página(s) removida(s) do cache")
+        elif args.comando == "podar":
+            max_bytes = int(args.max_mb * 1024 * 1024) if args.max_mb is not None else None
+            print(f"✂ {cache.podar(max_bytes)} página(s) descartada(s)")
+    finally:
+        cache.fechar()
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
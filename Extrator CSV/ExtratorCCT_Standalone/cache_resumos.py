@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Cache de resumos do Extrator de CCTs
+Descrição: Guarda em disco (SQLite) os resumos gerados pela IA, endereçados pelo
+hash do título e conteúdo normalizados + modelo + versão do prompt. Cláusulas
+que se repetem entre convenções anuais do mesmo sindicato não pagam uma nova
+chamada à API.
+"""
+
+import re
+import time
+import sqlite3
+import hashlib
+import threading
+import unicodedata
+from pathlib import Path
+from typing import Optional
+
+
+NOME_ARQUIVO = 'cache_resumos.sqlite'
+
+# "CLÁUSULA DÉCIMA SEGUNDA - " / "CLAUSULA 12ª –": a numeração muda de um ano para o outro
+_PADRAO_NUMERACAO = re.compile(r'^CLAUSULA\s+[^-–—:]*[-–—:]\s*')
+
+
+def normalizar_texto(texto: str) -> str:
+    """Maiúsculas, sem acentos e com espaços colapsados"""
+    texto = unicodedata.normalize('NFKD', texto)
+    texto = ''.join(c for c in texto if not unicodedata.combining(c))
+    return ' '.join(texto.upper().split())
+
+
+def normalizar_titulo(titulo: str) -> str:
+    """Título normalizado sem a numeração da cláusula"""
+    return _PADRAO_NUMERACAO.sub('', normalizar_texto(titulo))
+
+
+class CacheResumos:
+    """Cache em disco de resumos de cláusulas"""
+
+    def __init__(self, caminho: str):
+        self.caminho = Path(caminho)
+        self.caminho.parent.mkdir(parents=True, exist_ok=True)
+        self.acertos = 0
+        self.faltas = 0
+        self._lock = threading.Lock()
+
+        self._conn = sqlite3.connect(str(self.caminho), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS resumos (
+                   chave TEXT PRIMARY KEY,
+                   resumo TEXT NOT NULL,
+                   modelo TEXT NOT NULL,
+                   criado REAL NOT NULL
+               )"""
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def chave(titulo: str, conteudo: str, modelo: str, versao_prompt: int) -> str:
+        """Chave do resumo: título e conteúdo normalizados + modelo + versão do prompt"""
+        partes = "\x1f".join([normalizar_titulo(titulo), normalizar_texto(conteudo), modelo, str(versao_prompt)])
+        return hashlib.sha256(partes.encode('utf-8')).hexdigest()
+
+    def obter(self, chave: str) -> Optional[str]:
+        """Resumo em cache ou None"""
+        with self._lock:
+            linha = self._conn.execute("SELECT resumo FROM resumos WHERE chave = ?", (chave,)).fetchone()
+            if linha is None:
+                self.faltas += 1
+                return None
+            self.acertos += 1
+            return linha[0]
+
+    def guardar(self, chave: str, resumo: str, modelo: str) -> None:
+        """Guarda um resumo"""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO resumos (chave, resumo, modelo, criado) VALUES (?, ?, ?, ?)",
+                (chave, resumo, modelo, time.time())
+            )
+            self._conn.commit()
+
+    def fechar(self) -> None:
+        """Fecha a conexão com o banco"""
+        with self._lock:
+            self._conn.close()
+
+
+def abrir_cache_padrao(config_manager) -> Optional[CacheResumos]:
+    """Abre o cache no diretório de configuração, ou None se estiver desativado"""
+    if not config_manager.config.get('cache_resumos', True):
+        return None
+    return CacheResumos(config_manager.config_dir / NOME_ARQUIVO)
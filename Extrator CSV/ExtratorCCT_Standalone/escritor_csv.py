@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Gravação incremental do CSV do Extrator de CCTs
+Descrição: Grava cada cláusula assim que o resumo fica pronto, na ordem do
+documento, em um arquivo parcial (<nome>.parcial.csv) descarregado em disco a
+cada poucas linhas. Ao final o parcial é renomeado para o destino de uma vez;
+se o processo cair no meio, o parcial fica com as cláusulas já gravadas.
+"""
+
+import os
+import io
+import csv
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+LINHAS_POR_DESCARGA = 20
+SEGUNDOS_POR_DESCARGA = 2.0
+
+
+def caminho_parcial(destino: str) -> Path:
+    """Arquivo parcial ao lado do destino (CCT.csv -> CCT.parcial.csv)"""
+    destino = Path(destino)
+    return destino.with_suffix('.parcial' + destino.suffix)
+
+
+class EscritorCSV:
+    """CSV gravado linha a linha, com renomeação atômica no final"""
+
+    def __init__(self, destino: str, campos: List[str], limpar: Optional[Callable[[str], str]] = None,
+                 linhas_por_descarga: int = LINHAS_POR_DESCARGA,
+                 segundos_por_descarga: float = SEGUNDOS_POR_DESCARGA):
+        """
+        Args:
+            destino: CSV final
+            campos: Colunas, na ordem
+            limpar: Aplicada a cada valor antes de gravar
+            linhas_por_descarga / segundos_por_descarga: o que vier primeiro
+                faz as linhas acumuladas irem para o disco
+        """
+        self.destino = Path(destino)
+        self.parcial = caminho_parcial(destino)
+        self.campos = campos
+        self.limpar = limpar or (lambda valor: valor)
+        self.linhas_por_descarga = max(1, linhas_por_descarga)
+        self.segundos_por_descarga = segundos_por_descarga
+        self.linhas = 0
+
+        # Resumos chegam fora de ordem; as linhas só são gravadas em sequência
+        self._fora_de_ordem: Dict[int, Dict[str, str]] = {}
+        self._proximo = 0
+
+        # Linhas completas vão para o buffer e descem ao arquivo em uma escrita só
+        self._buffer = io.StringIO()
+        self._writer = csv.DictWriter(
+            self._buffer,
+            fieldnames=campos,
+            quoting=csv.QUOTE_ALL,
+            escapechar='\\',
+            doublequote=True
+        )
+        self._no_buffer = 0
+        self._arquivo = open(self.parcial, 'w', newline='', encoding='utf-8')
+        self._writer.writeheader()
+        self.descarregar()
+
+    def __enter__(self) -> 'EscritorCSV':
+        return self
+
+    def __exit__(self, tipo, *exc) -> None:
+        if self._arquivo.closed:
+            return
+        if tipo is None:
+            self.concluir()
+        else:
+            self.interromper()
+
+    def gravar(self, indice: int, registro: Dict[str, str]) -> None:
+        """Recebe a linha de posição `indice`; grava todas as que já estão em sequência"""
+        self._fora_de_ordem[indice] = registro
+        while self._proximo in self._fora_de_ordem:
+            registro = self._fora_de_ordem.pop(self._proximo)
+            self._writer.writerow({campo: self.limpar(registro[campo]) for campo in self.campos})
+            self._proximo += 1
+            self._no_buffer += 1
+            self.linhas += 1
+
+        if (self._no_buffer >= self.linhas_por_descarga
+                or time.monotonic() - self._ultima_descarga >= self.segundos_por_descarga):
+            self.descarregar()
+
+    def descarregar(self) -> None:
+        """Leva ao disco as linhas acumuladas"""
+        self._arquivo.write(self._buffer.getvalue())
+        self._arquivo.flush()
+        os.fsync(self._arquivo.fileno())
+        self._buffer.seek(0)
+        self._buffer.truncate()
+        self._no_buffer = 0
+        self._ultima_descarga = time.monotonic()
+
+    def concluir(self) -> bool:
+        """
+        Grava o restante e renomeia o parcial para o destino.
+        Devolve False (e apaga o parcial) se nenhuma linha foi gravada.
+        """
+        if self._fora_de_ordem:
+            self.interromper()
+            raise ValueError(f"Linhas fora de sequência, a partir da {self._proximo}: "
+                             f"{sorted(self._fora_de_ordem)[:5]}")
+
+        self.descarregar()
+        self._arquivo.close()
+        if not self.linhas:
+            self.parcial.unlink()
+            return False
+        os.replace(self.parcial, self.destino)
+        return True
+
+    def interromper(self) -> None:
+        """Fecha o parcial com as linhas já em sequência, sem renomear"""
+        self.descarregar()
+        self._arquivo.close()
+        print(f"⚠ CSV parcial mantido com {self.linhas} linha(s): {self.parcial}")
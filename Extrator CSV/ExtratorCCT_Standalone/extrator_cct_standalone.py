@@ -11,252 +11,302 @@ import sys
 import re
 import csv
 import json
+import queue
 from pathlib import Path
 from typing import List, Dict, Tuple, Optional
-import fitz  # PyMuPDF
-from PIL import Image
-import pytesseract
-import io
-from openai import OpenAI
-import tkinter as tk
-from tkinter import filedialog, messagebox, simpledialog, ttk
+import threading
+import multiprocessing
+# fitz, PIL, pytesseract e openai levam mais de um segundo para importar: são
+# importados só quando a extração começa (ver preaquecer_importacoes)
+from cache_ocr import abrir_cache_padrao
+from cache_resumos import abrir_cache_padrao as abrir_cache_resumos
+from trabalho_extracao import TrabalhoExtracao, ORIGEM_IA, ORIGEM_SIMPLES
+from base_clausulas import BaseClausulas, COLUNAS, caminho_base
+from escritor_csv import EscritorCSV
+from limpeza_csv import limpar_para_csv
+from metricas import Metricas, caminho_relatorio, caminho_prometheus
+from fila_extracao import TrabalhadorExtracao, responder, PROGRESSO, PERGUNTA, CONCLUIDO, ERRO
+from segmentador_clausulas import segmentar
+from similaridade_clausulas import IndiceSimilaridade, LIMIAR_PADRAO
+from resumos_ia import SumarizadorIA, CONCORRENCIA_PADRAO, RPM_PADRAO, TPM_PADRAO
+from motor_ocr import (extrair_paginas_ocr, extrair_paginas_hibrido, workers_padrao, ROTA_TEXTO, ROTA_OCR,
+                       DPI_PADRAO, DPI_INICIAL_ADAPTATIVO, CONFIANCA_MINIMA)
+try:
+    import tkinter as tk
+    from tkinter import filedialog, messagebox, ttk
+except ImportError:
+    tk = None  # Servidor sem Tk: só o extrator em lote (extrator_lote.py) funciona
 
 
-
-# Código adicional para v4.0
-# Adicionar ao extrator_cct_standalone.py
-
-import tkinter as tk
-from tkinter import ttk, filedialog, messagebox
-import csv
-import shutil
-from pathlib import Path
-
-
-class BarraProgresso:
-    """Barra de progresso visual"""
+def abrir_no_aplicativo_padrao(caminho):
+    """Abre o arquivo no aplicativo padrão do sistema"""
+    import platform
     
-    def __init__(self, titulo="Processando..."):
-        self.titulo = titulo
-        self.janela = None
-        self.progresso = None
-        self.label_status = None
-        self.label_porcentagem = None
-        
-    def criar_janela(self):
-        """Cria janela de progresso"""
-        self.janela = tk.Toplevel()
-        self.janela.title(self.titulo)
-        self.janela.geometry("500x150")
-        self.janela.resizable(False, False)
-        
-        # Centralizar
-        self.janela.update_idletasks()
-        x = (self.janela.winfo_screenwidth() // 2) - (500 // 2)
-        y = (self.janela.winfo_screenheight() // 2) - (150 // 2)
-        self.janela.geometry(f"+{x}+{y}")
-        
-        # Frame principal
-        frame = tk.Frame(self.janela, padx=30, pady=20)
-        frame.pack(fill=tk.BOTH, expand=True)
-        
-        # Título
-        titulo_label = tk.Label(frame, text=self.titulo, font=("Arial", 12, "bold"))
-        titulo_label.pack(pady=(0, 15))
-        
-        # Barra de progresso
-        self.progresso = ttk.Progressbar(frame, length=440, mode='determinate', maximum=100)
-        self.progresso.pack(pady=(0, 10))
-        
-        # Status
-        self.label_status = tk.Label(frame, text="Iniciando...", font=("Arial", 9))
-        self.label_status.pack()
-        
-        # Porcentagem
-        self.label_porcentagem = tk.Label(frame, text="0%", font=("Arial", 10, "bold"))
-        self.label_porcentagem.pack(pady=(5, 0))
-        
-        self.janela.update()
-        
-    def atualizar(self, valor, status=""):
-        """Atualiza progresso"""
-        if self.janela and self.janela.winfo_exists():
-            self.progresso['value'] = valor
-            if status:
-                self.label_status.config(text=status)
-            self.label_porcentagem.config(text=f"{int(valor)}%")
-            self.janela.update()
-    
-    def fechar(self):
-        """Fecha janela"""
-        if self.janela and self.janela.winfo_exists():
-            self.janela.destroy()
+    if platform.system() == 'Windows':
+        os.startfile(caminho)
+    elif platform.system() == 'Darwin':  # macOS
+        os.system(f'open "{caminho}"')
+    else:  # Linux
+        os.system(f'xdg-open "{caminho}"')
 
 
-def janela_confirmacao_csv(csv_path, total_clausulas, convencao):
-    """Mostra janela de confirmação após extração"""
-    
-    dialog = tk.Toplevel()
-    dialog.title("Extração Concluída")
-    dialog.geometry("600x400")  # Aumentado de 300 para 400 para mostrar botões
-    dialog.resizable(False, False)
-    
-    # Centralizar
-    dialog.update_idletasks()
-    x = (dialog.winfo_screenwidth() // 2) - (600 // 2)
-    y = (dialog.winfo_screenheight() // 2) - (300 // 2)
-    dialog.geometry(f"+{x}+{y}")
-    
-    # Frame principal
-    main_frame = tk.Frame(dialog, padx=30, pady=20)
-    main_frame.pack(fill=tk.BOTH, expand=True)
-    
-    # Ícone de sucesso
-    success_label = tk.Label(main_frame, text="✅", font=("Arial", 48))
-    success_label.pack(pady=(0, 10))
-    
-    # Título
-    title_label = tk.Label(main_frame, text="Extração Concluída com Sucesso!", font=("Arial", 14, "bold"))
-    title_label.pack(pady=(0, 15))
-    
-    # Informações
-    info_frame = tk.Frame(main_frame)
-    info_frame.pack(pady=(0, 20))
+def selecionar_planilha_mae(parent):
+    """Permite usuário selecionar planilha mãe (diálogo sobre a janela parent)"""
     
-    info_text = f"""
-Arquivo CSV gerado: {Path(csv_path).name}
-
-Total de cláusulas extraídas: {total_clausulas}
-Convenção: {convencao}
-
-Deseja conferir o arquivo e integrá-lo à planilha mãe?
-    """
-    
-    info_label = tk.Label(info_frame, text=info_text, font=("Arial", 10), justify=tk.LEFT)
-    info_label.pack()
-    
-    # Resultado
-    result = {"acao": None}
-    
-    def abrir_csv():
-        """Abre CSV no aplicativo padrão"""
-        import os
-        import platform
-        
-        try:
-            if platform.system() == 'Windows':
-                os.startfile(csv_path)
-            elif platform.system() == 'Darwin':  # macOS
-                os.system(f'open "{csv_path}"')
-            else:  # Linux
-                os.system(f'xdg-open "{csv_path}"')
-            
-            # Mostrar mensagem de confirmação
-            messagebox.showinfo(
-                "Arquivo Aberto",
-                "O arquivo CSV foi aberto no aplicativo padrão.\n\nVocê ainda pode integrar com a planilha mãe ou fechar.",
-                parent=dialog
-            )
-        except Exception as e:
-            messagebox.showerror(
-                "Erro",
-                f"Não foi possível abrir o arquivo:\n{str(e)}",
-                parent=dialog
-            )
-    
-    def integrar():
-        result["acao"] = "integrar"
-        dialog.destroy()
-    
-    def fechar():
-        result["acao"] = "fechar"
-        dialog.destroy()
-    
-    # Botões
-    button_frame = tk.Frame(main_frame)
-    button_frame.pack()
-    
-    tk.Button(button_frame, text="📄 Abrir CSV", command=abrir_csv, font=("Arial", 10), padx=15, pady=8).pack(side=tk.LEFT, padx=5)
-    tk.Button(button_frame, text="✅ Integrar com Planilha Mãe", command=integrar, font=("Arial", 10, "bold"), bg="#4CAF50", fg="white", padx=15, pady=8).pack(side=tk.LEFT, padx=5)
-    tk.Button(button_frame, text="Fechar", command=fechar, font=("Arial", 10), padx=15, pady=8).pack(side=tk.LEFT, padx=5)
-    
-    # Aguardar usuário
-    dialog.transient()
-    dialog.grab_set()
-    dialog.wait_window()
-    
-    return result["acao"]
-
-
-def selecionar_planilha_mae():
-    """Permite usuário selecionar planilha mãe"""
-    
-    root = tk.Tk()
-    root.withdraw()
-    root.attributes('-topmost', True)
-    
-    arquivo = filedialog.askopenfilename(
+    return filedialog.askopenfilename(
+        parent=parent,
         title="Selecione a Planilha Mãe (CSV)",
         filetypes=[("Arquivos CSV", "*.csv"), ("Todos os arquivos", "*.*")],
         initialdir=os.getcwd()
     )
+
+
+def mesclar_na_planilha_mae(csv_extraido, csv_mae):
+    """Upsert do CSV extraído na base de cláusulas e exportação da planilha mãe (sem janelas)"""
     
-    root.destroy()
-    return arquivo
+    with BaseClausulas(caminho_base(csv_mae)) as base:
+        # 1. Trazer para a base alterações feitas direto na planilha mãe
+        importadas = base.sincronizar_csv(csv_mae)
+        if importadas is not None:
+            print(f"✓ Planilha mãe importada na base: {importadas.total} cláusulas"
+                  + (f", {importadas.removidas} removida(s)" if importadas.removidas else ""))
+        
+        # 2. Inserir/atualizar as cláusulas extraídas (uma transação, com histórico)
+        with open(csv_extraido, 'r', encoding='utf-8', newline='') as f:
+            resultado = base.upsert(csv.DictReader(f), origem=Path(csv_extraido).name)
+        
+        # 3. Atualizar a planilha mãe
+        base.exportar_csv(csv_mae, resultado)
+    
+    print(f"✓ {len(resultado.inseridas)} cláusulas adicionadas, "
+          f"{resultado.atualizadas} atualizadas e {resultado.iguais} já existentes")
+    return resultado
 
 
-def integrar_com_planilha_mae(csv_extraido, csv_mae):
-    """Integra dados extraídos na planilha mãe"""
+def integrar_com_planilha_mae(csv_extraido, csv_mae, parent):
+    """Integra dados extraídos na planilha mãe (upsert na base de cláusulas); mensagens sobre parent"""
     
     try:
-        # 1. Fazer backup da planilha mãe
-        backup_path = str(Path(csv_mae).with_suffix('.backup.csv'))
-        shutil.copy2(csv_mae, backup_path)
-        print(f"✓ Backup criado: {backup_path}")
-        
-        # 2. Ler CSV extraído (pular cabeçalho)
-        with open(csv_extraido, 'r', encoding='utf-8') as f:
-            reader = csv.reader(f)
-            next(reader)  # Pular cabeçalho
-            dados_extraidos = list(reader)
-        
-        # 3. Adicionar ao CSV mãe
-        with open(csv_mae, 'a', newline='', encoding='utf-8') as f:
-            writer = csv.writer(f, quoting=csv.QUOTE_ALL)
-            writer.writerows(dados_extraidos)
-        
-        print(f"✓ {len(dados_extraidos)} cláusulas adicionadas à planilha mãe")
-        
-        # Mensagem de sucesso
-        root = tk.Tk()
-        root.withdraw()
-        root.attributes('-topmost', True)
+        resultado = mesclar_na_planilha_mae(csv_extraido, csv_mae)
         
         messagebox.showinfo(
             "Integração Concluída",
             f"✅ Sucesso!\n\n"
-            f"{len(dados_extraidos)} cláusulas foram adicionadas à planilha mãe.\n\n"
-            f"Backup criado: {Path(backup_path).name}"
+            f"{len(resultado.inseridas)} cláusulas novas adicionadas à planilha mãe.\n"
+            f"{resultado.atualizadas} cláusulas atualizadas e {resultado.iguais} sem alteração.\n\n"
+            f"Histórico de alterações: {caminho_base(csv_mae).name}",
+            parent=parent
         )
-        
-        root.destroy()
         return True
         
     except Exception as e:
-        # Mensagem de erro
-        root = tk.Tk()
-        root.withdraw()
-        root.attributes('-topmost', True)
-        
         messagebox.showerror(
             "Erro na Integração",
-            f"❌ Erro ao integrar dados:\n\n{str(e)}"
+            f"❌ Erro ao integrar dados:\n\n{str(e)}",
+            parent=parent
         )
-        
-        root.destroy()
         return False
 
 
+class JanelaFila:
+    """
+    Janela principal: PDFs enfileirados são processados em uma thread
+    (fila_extracao) e a janela acompanha pelos eventos, sem travar
+    """
+    
+    INTERVALO_EVENTOS_MS = 100
+    
+    def __init__(self, config_manager):
+        self.config_manager = config_manager
+        self.itens = {}  # número do pedido -> [pedido, item da tabela, fim (None, CONCLUIDO ou ERRO)]
+        
+        self.root = tk.Tk()
+        self.root.title("Extrator de CCTs")
+        self.root.geometry("820x440")
+        self._montar()
+        
+        self.trabalhador = TrabalhadorExtracao(self._criar_extrator)
+        self.trabalhador.start()
+        
+        self.root.protocol("WM_DELETE_WINDOW", self.fechar)
+        self.root.after(self.INTERVALO_EVENTOS_MS, self._ler_eventos)
+    
+    def _montar(self):
+        """Cria os componentes da janela"""
+        main_frame = tk.Frame(self.root, padx=20, pady=15)
+        main_frame.pack(fill=tk.BOTH, expand=True)
+        
+        tk.Label(main_frame, text="Extração de CCTs", font=("Arial", 14, "bold")).pack(pady=(0, 10))
+        
+        # Fila de PDFs
+        tabela_frame = tk.Frame(main_frame)
+        tabela_frame.pack(fill=tk.BOTH, expand=True)
+        self.tabela = ttk.Treeview(tabela_frame, columns=("pdf", "status", "clausulas"), show="headings")
+        self.tabela.heading("pdf", text="PDF")
+        self.tabela.heading("status", text="Situação")
+        self.tabela.heading("clausulas", text="Cláusulas")
+        self.tabela.column("pdf", width=360)
+        self.tabela.column("status", width=300)
+        self.tabela.column("clausulas", width=80, anchor=tk.CENTER)
+        scrollbar = tk.Scrollbar(tabela_frame, orient="vertical", command=self.tabela.yview)
+        self.tabela.configure(yscrollcommand=scrollbar.set)
+        self.tabela.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        
+        # Progresso do PDF em andamento
+        self.label_status = tk.Label(main_frame, text="Adicione PDFs para começar.", font=("Arial", 9))
+        self.label_status.pack(pady=(10, 5))
+        self.progresso = ttk.Progressbar(main_frame, length=760, mode='determinate', maximum=100)
+        self.progresso.pack(pady=(0, 10))
+        
+        # Botões
+        button_frame = tk.Frame(main_frame)
+        button_frame.pack()
+        tk.Button(button_frame, text="➕ Adicionar PDFs", command=self.adicionar_pdfs,
+                  font=("Arial", 10, "bold"), padx=15, pady=8).pack(side=tk.LEFT, padx=5)
+        tk.Button(button_frame, text="📄 Abrir CSV", command=self.abrir_csv,
+                  font=("Arial", 10), padx=15, pady=8).pack(side=tk.LEFT, padx=5)
+        tk.Button(button_frame, text="✅ Integrar com Planilha Mãe", command=self.integrar,
+                  font=("Arial", 10, "bold"), bg="#4CAF50", fg="white", padx=15, pady=8).pack(side=tk.LEFT, padx=5)
+        tk.Button(button_frame, text="Fechar", command=self.fechar,
+                  font=("Arial", 10), padx=15, pady=8).pack(side=tk.LEFT, padx=5)
+    
+    def _criar_extrator(self, pedido):
+        """Executado na thread de extração; a confirmação do sindicato é feita na thread da janela"""
+        extrator = ExtratorCCT(pdf_path=pedido.pdf_path, config_manager=self.config_manager)
+        confirmar = extrator._confirmar_sindicato
+        extrator._confirmar_sindicato = lambda detectado, todos: self.trabalhador.perguntar(
+            pedido, confirmar, detectado, todos)
+        return extrator
+    
+    def adicionar_pdfs(self):
+        """Seleciona um ou mais PDFs e os coloca na fila"""
+        print("📄 Selecione os arquivos PDF das CCTs...")
+        arquivos = filedialog.askopenfilenames(
+            parent=self.root,
+            title="Selecione os arquivos PDF das CCTs",
+            filetypes=[("Arquivos PDF", "*.pdf"), ("Todos os arquivos", "*.*")],
+            initialdir=os.getcwd()
+        )
+        if not arquivos:
+            return
+        
+        if len(arquivos) == 1:
+            # Um PDF: escolhe o nome do CSV, como antes
+            pdf_path = arquivos[0]
+            output_path = filedialog.asksaveasfilename(
+                parent=self.root,
+                title="Salvar CSV como",
+                defaultextension=".csv",
+                filetypes=[("Arquivos CSV", "*.csv"), ("Todos os arquivos", "*.*")],
+                initialfile=f"{Path(pdf_path).stem}_extraido.csv",
+                initialdir=os.path.dirname(pdf_path) or os.getcwd()
+            )
+            if not output_path:
+                return
+            destinos = [(pdf_path, output_path)]
+        else:
+            # Vários PDFs: uma pasta para todos os CSVs
+            pasta = filedialog.askdirectory(
+                parent=self.root,
+                title="Pasta onde salvar os CSVs",
+                initialdir=os.path.dirname(arquivos[0]) or os.getcwd()
+            )
+            if not pasta:
+                return
+            destinos = [(pdf, os.path.join(pasta, f"{Path(pdf).stem}_extraido.csv")) for pdf in arquivos]
+        
+        for pdf_path, output_path in destinos:
+            pedido = self.trabalhador.adicionar(pdf_path, output_path)
+            item = self.tabela.insert("", tk.END, values=(Path(pdf_path).name, "⏸ Na fila", ""))
+            self.itens[pedido.numero] = [pedido, item, None]
+            print(f"✓ Na fila: {Path(pdf_path).name} -> {output_path}")
+    
+    def _ler_eventos(self):
+        """Trata os eventos publicados pela thread de extração"""
+        try:
+            while True:
+                self._tratar(self.trabalhador.eventos.get_nowait())
+        except queue.Empty:
+            pass
+        self.root.after(self.INTERVALO_EVENTOS_MS, self._ler_eventos)
+    
+    def _tratar(self, evento):
+        pedido, item, _ = self.itens[evento.pedido.numero]
+        nome = Path(pedido.pdf_path).name
+        
+        if evento.tipo == PROGRESSO:
+            self.tabela.set(item, "status", f"⏳ {evento.dados['status']}")
+            self.progresso['value'] = evento.dados['valor']
+            self.label_status.config(text=f"{nome}: {evento.dados['status']} ({int(evento.dados['valor'])}%)")
+        elif evento.tipo == PERGUNTA:
+            responder(evento)
+        elif evento.tipo == CONCLUIDO:
+            self.itens[pedido.numero][2] = CONCLUIDO
+            self.tabela.set(item, "status", "✅ Concluído")
+            self.tabela.set(item, "clausulas", evento.dados['clausulas'])
+            self.label_status.config(text=f"{nome}: concluído ({evento.dados['convencao']})")
+            print(f"📄 Arquivo gerado: {pedido.output_path}")
+            print()
+        elif evento.tipo == ERRO:
+            self.itens[pedido.numero][2] = ERRO
+            self.tabela.set(item, "status", f"❌ {evento.dados['mensagem']}")
+            self.label_status.config(text=f"{nome}: erro")
+            messagebox.showerror("Erro", f"Erro ao processar {nome}:\n\n{evento.dados['mensagem']}",
+                                 parent=self.root)
+    
+    def _concluidos_selecionados(self):
+        """Pedidos concluídos selecionados na tabela (ou todos os concluídos, sem seleção)"""
+        selecionados = set(self.tabela.selection())
+        return [pedido for pedido, item, fim in self.itens.values()
+                if fim == CONCLUIDO and (not selecionados or item in selecionados)]
+    
+    def abrir_csv(self):
+        for pedido in self._concluidos_selecionados()[:1]:
+            try:
+                abrir_no_aplicativo_padrao(pedido.output_path)
+            except Exception as e:
+                messagebox.showerror("Erro", f"Não foi possível abrir o arquivo:\n{str(e)}", parent=self.root)
+    
+    def integrar(self):
+        """Integra os CSVs concluídos (selecionados) à planilha mãe"""
+        pedidos = self._concluidos_selecionados()
+        if not pedidos:
+            messagebox.showinfo("Integrar", "Nenhuma extração concluída para integrar.", parent=self.root)
+            return
+        
+        print("\n📊 Integrando com planilha mãe...")
+        csv_mae = selecionar_planilha_mae(self.root)
+        if not csv_mae:
+            print("❌ Nenhuma planilha mãe selecionada.")
+            return
+        
+        # Lembrada para reaproveitar resumos de cláusulas semelhantes nas próximas extrações
+        self.config_manager.config['planilha_mae'] = csv_mae
+        self.config_manager.save_config()
+        
+        for pedido in pedidos:
+            if integrar_com_planilha_mae(pedido.output_path, csv_mae, self.root):
+                print(f"✅ Integração concluída: {Path(pedido.output_path).name}")
+            else:
+                print(f"❌ Erro na integração: {Path(pedido.output_path).name}")
+    
+    def fechar(self):
+        # PDFs com erro já terminaram: só contam os que estão na fila ou em processamento
+        pendentes = sum(1 for _, _, fim in self.itens.values() if fim is None)
+        if pendentes and not messagebox.askyesno(
+                "Fechar",
+                f"Há {pendentes} PDF(s) na fila ou em processamento.\n\n"
+                "Fechar mesmo assim? Um trabalho interrompido continua de onde parou na próxima vez.",
+                parent=self.root):
+            return
+        self.trabalhador.encerrar()
+        self.root.destroy()
+    
+    def executar(self):
+        """Loop da interface (até a janela ser fechada)"""
+        self.root.mainloop()
+
 
 class ConfigManager:
     """Gerencia configurações do aplicativo"""
@@ -307,6 +357,46 @@ class ConfigManager:
         """Define caminho do Tesseract"""
         self.config['tesseract_path'] = path
         self.save_config()
+    
+    def get_workers_ocr(self) -> int:
+        """Obtém número de processos usados no OCR (1 = serial)"""
+        try:
+            return max(1, int(self.config.get('ocr_workers', workers_padrao())))
+        except (TypeError, ValueError):
+            return workers_padrao()
+    
+    def set_workers_ocr(self, workers: int):
+        """Define número de processos usados no OCR"""
+        self.config['ocr_workers'] = max(1, int(workers))
+        self.save_config()
+    
+    def get_ocr_cinza(self) -> bool:
+        """Indica se as páginas são renderizadas em tons de cinza para o OCR"""
+        return bool(self.config.get('ocr_cinza', False))
+    
+    def set_ocr_cinza(self, cinza: bool):
+        """Define renderização em tons de cinza para o OCR"""
+        self.config['ocr_cinza'] = bool(cinza)
+        self.save_config()
+    
+    def get_ocr_adaptativo(self) -> bool:
+        """Indica se o OCR começa em DPI menor e refaz em 300 DPI só as páginas de baixa confiança"""
+        return bool(self.config.get('ocr_adaptativo', False))
+    
+    def set_ocr_adaptativo(self, adaptativo: bool):
+        """Define OCR adaptativo"""
+        self.config['ocr_adaptativo'] = bool(adaptativo)
+        self.save_config()
+    
+    def get_modo_extracao(self) -> str:
+        """Obtém modo de extração: 'hibrido' (camada de texto + OCR) ou 'ocr' (OCR em todas as páginas)"""
+        modo = self.config.get('modo_extracao', 'hibrido')
+        return modo if modo in ('hibrido', 'ocr') else 'hibrido'
+    
+    def set_modo_extracao(self, modo: str):
+        """Define modo de extração"""
+        self.config['modo_extracao'] = modo
+        self.save_config()
 
 
 class ConfigDialog:
@@ -421,60 +511,64 @@ def find_tesseract():
     return None
 
 
-def selecionar_pdf():
-    """Abre janela do Windows Explorer para selecionar PDF"""
-    root = tk.Tk()
-    root.withdraw()
-    root.attributes('-topmost', True)
-    
-    arquivo = filedialog.askopenfilename(
-        title="Selecione o arquivo PDF da CCT",
-        filetypes=[("Arquivos PDF", "*.pdf"), ("Todos os arquivos", "*.*")],
-        initialdir=os.getcwd()
-    )
-    
-    root.destroy()
-    return arquivo
-
-
-def selecionar_csv_saida(pdf_path):
-    """Abre janela do Windows Explorer para salvar CSV"""
-    root = tk.Tk()
-    root.withdraw()
-    root.attributes('-topmost', True)
-    
-    nome_base = Path(pdf_path).stem
-    nome_sugerido = f"{nome_base}_extraido.csv"
-    
-    arquivo = filedialog.asksaveasfilename(
-        title="Salvar CSV como",
-        defaultextension=".csv",
-        filetypes=[("Arquivos CSV", "*.csv"), ("Todos os arquivos", "*.*")],
-        initialfile=nome_sugerido,
-        initialdir=os.path.dirname(pdf_path) or os.getcwd()
-    )
+def preaquecer_importacoes(usar_ia: bool = True):
+    """
+    Importa as bibliotecas pesadas enquanto o usuário escolhe os PDFs.
     
-    root.destroy()
-    return arquivo
+    Roda em uma thread separada depois que a janela aparece: a primeira
+    extração já as encontra carregadas e a abertura do aplicativo não espera
+    por elas.
+    """
+    try:
+        import fitz  # PyMuPDF
+        import pytesseract
+        if usar_ia:
+            import openai
+    except Exception:
+        pass  # O erro aparece de novo (e é tratado) quando a extração importar o módulo
 
 
 class ExtratorCCT:
     """Classe para extrair dados de PDFs usando Tesseract OCR"""
     
-    def __init__(self, pdf_path: str, config_manager: ConfigManager):
+    def __init__(self, pdf_path: str, config_manager: ConfigManager, workers_ocr: Optional[int] = None):
         self.pdf_path = pdf_path
         self.config_manager = config_manager
+        self.workers_ocr = workers_ocr or config_manager.get_workers_ocr()
+        self.ocr_cinza = config_manager.get_ocr_cinza()
+        # OCR adaptativo: primeira passada em ocr_dpi_inicial, páginas abaixo de ocr_confianca_minima refeitas
+        self.ocr_dpi_inicial = None
+        self.ocr_confianca_minima = config_manager.config.get('ocr_confianca_minima', CONFIANCA_MINIMA)
+        if config_manager.get_ocr_adaptativo():
+            self.ocr_dpi_inicial = config_manager.config.get('ocr_dpi_inicial', DPI_INICIAL_ADAPTATIVO)
+        self.modo_extracao = config_manager.get_modo_extracao()
+        self.rotas_paginas = []
+        self.cache_ocr = abrir_cache_padrao(config_manager)
+        self.trabalho = None
         self.texto_completo = ""
         self.sindicato = ""
         self.convencao = ""
         self.clausulas = []
+        self.metricas = Metricas()
         
         # Configurar OpenAI se disponível
         api_key = config_manager.get_api_key()
         self.usar_ia = False
         if api_key:
             try:
-                self.client = OpenAI(api_key=api_key)
+                from openai import OpenAI
+                
+                # Novas tentativas ficam a cargo do SumarizadorIA (com jitter e limite de taxa)
+                self.client = OpenAI(api_key=api_key, max_retries=0)
+                self.sumarizador = SumarizadorIA(
+                    self.client,
+                    concorrencia=config_manager.config.get('ia_concorrencia', CONCORRENCIA_PADRAO),
+                    rpm=config_manager.config.get('ia_rpm', RPM_PADRAO),
+                    tpm=config_manager.config.get('ia_tpm', TPM_PADRAO),
+                    cache=abrir_cache_resumos(config_manager),
+                    similares=self._carregar_indice_similares(),
+                    metricas=self.metricas
+                )
                 self.usar_ia = True
             except:
                 self.usar_ia = False
@@ -487,38 +581,103 @@ class ExtratorCCT:
                 config_manager.set_tesseract_path(tesseract_path)
         
         if tesseract_path and os.path.exists(tesseract_path):
+            import pytesseract
             pytesseract.pytesseract.tesseract_cmd = tesseract_path
         
+    def _carregar_indice_similares(self) -> Optional[IndiceSimilaridade]:
+        """Indexa as cláusulas da última planilha mãe usada para reaproveitar resumos"""
+        planilha_mae = self.config_manager.config.get('planilha_mae')
+        if not planilha_mae or not os.path.exists(planilha_mae):
+            return None
+        if not self.config_manager.config.get('reaproveitar_similares', True):
+            return None
+        
+        try:
+            with self.metricas.etapa('indice_similares'):
+                indice = IndiceSimilaridade.carregar_csv(
+                    planilha_mae,
+                    limiar=self.config_manager.config.get('similaridade_limiar', LIMIAR_PADRAO)
+                )
+            print(f"🔁 {len(indice)} cláusulas da planilha mãe indexadas para reaproveitar resumos")
+            return indice
+        except Exception as e:
+            print(f"⚠ Não foi possível indexar a planilha mãe: {e}")
+            return None
+    
     def extrair_texto_pdf_ocr(self) -> str:
         """Extrai texto do PDF usando Tesseract OCR"""
+        paginas_salvas = self.trabalho.paginas() if self.trabalho else None
+        if paginas_salvas is not None:
+            self.rotas_paginas = paginas_salvas['rotas']
+            self.texto_completo = "\n".join(texto for texto in paginas_salvas['textos'] if texto.strip())
+            print(f"\n📄 Texto do PDF retomado do trabalho anterior: {len(self.texto_completo)} caracteres\n")
+            return self.texto_completo
+        
         print(f"\n📄 Extraindo texto do PDF com OCR de alta qualidade...")
         print("   ⏳ Este processo pode demorar alguns minutos...")
         print()
         
-        texto_completo = []
+        if self.workers_ocr > 1:
+            print(f"   ⚙ OCR paralelo com {self.workers_ocr} processos")
+            print()
         
+        if self.ocr_dpi_inicial:
+            print(f"   ⚙ OCR adaptativo: {self.ocr_dpi_inicial} DPI, refeito em {DPI_PADRAO} DPI abaixo de "
+                  f"{self.ocr_confianca_minima:g}% de confiança")
+            print()
+        
+        def ao_concluir(numero, total_paginas, texto_pagina, rota=ROTA_OCR):
+            status = "✓" if texto_pagina.strip() else "(vazia)"
+            origem = "texto" if rota == ROTA_TEXTO else "OCR"
+            print(f"   Página {numero}/{total_paginas} [{origem}]... {status}")
+        
+        medidas = {}
         try:
-            doc = fitz.open(self.pdf_path)
-            total_paginas = len(doc)
+            if self.modo_extracao == 'hibrido':
+                textos_paginas, self.rotas_paginas = extrair_paginas_hibrido(
+                    self.pdf_path,
+                    workers=self.workers_ocr,
+                    cinza=self.ocr_cinza,
+                    ao_concluir=ao_concluir,
+                    cache=self.cache_ocr,
+                    medidas=medidas,
+                    dpi_inicial=self.ocr_dpi_inicial,
+                    confianca_minima=self.ocr_confianca_minima
+                )
+            else:
+                textos_paginas = extrair_paginas_ocr(
+                    self.pdf_path,
+                    workers=self.workers_ocr,
+                    cinza=self.ocr_cinza,
+                    ao_concluir=ao_concluir,
+                    cache=self.cache_ocr,
+                    medidas=medidas,
+                    dpi_inicial=self.ocr_dpi_inicial,
+                    confianca_minima=self.ocr_confianca_minima
+                )
+                self.rotas_paginas = [ROTA_OCR] * len(textos_paginas)
             
-            for i, page in enumerate(doc, 1):
-                print(f"   Processando página {i}/{total_paginas}... ", end='', flush=True)
-                
-                # Converter página para imagem em alta resolução
-                pix = page.get_pixmap(dpi=300)
-                img_data = pix.tobytes("png")
-                img = Image.open(io.BytesIO(img_data))
-                
-                # Executar OCR
-                texto_pagina = pytesseract.image_to_string(img, lang='por')
-                
-                if texto_pagina.strip():
-                    texto_completo.append(texto_pagina)
-                    print("✓")
-                else:
-                    print("(vazia)")
+            for n, texto in enumerate(textos_paginas):
+                medida = medidas.get(n, {})
+                self.metricas.registrar_pagina(n + 1, rota=self.rotas_paginas[n], caracteres=len(texto), **medida)
+                self.metricas.contar('bytes_imagem', medida.get('bytes_imagem', 0))
+            self.metricas.contar('paginas', len(textos_paginas))
+            reprocessadas = sum(1 for medida in medidas.values() if medida.get('reprocessada'))
+            self.metricas.contar('paginas_reprocessadas', reprocessadas)
             
-            doc.close()
+            if self.trabalho:
+                self.trabalho.salvar_paginas(textos_paginas, self.rotas_paginas)
+            
+            paginas_texto = self.rotas_paginas.count(ROTA_TEXTO)
+            paginas_ocr = self.rotas_paginas.count(ROTA_OCR)
+            print(f"\n   Rotas: {paginas_texto} página(s) pela camada de texto, {paginas_ocr} por OCR")
+            if self.ocr_dpi_inicial:
+                print(f"   OCR adaptativo: {reprocessadas} página(s) refeita(s) em {DPI_PADRAO} DPI")
+            if self.cache_ocr is not None and (self.cache_ocr.acertos or self.cache_ocr.faltas):
+                print(f"   Cache de OCR: {self.cache_ocr.acertos} página(s) reaproveitada(s), "
+                      f"{self.cache_ocr.faltas} nova(s)")
+            
+            texto_completo = [texto for texto in textos_paginas if texto.strip()]
             
             self.texto_completo = "\n".join(texto_completo)
             print(f"\n✓ Extração concluída: {len(self.texto_completo)} caracteres\n")
@@ -718,6 +877,15 @@ class ExtratorCCT:
     
     def identificar_sindicato_convencao(self) -> Tuple[str, str]:
         """Identifica o sindicato e o período da convenção"""
+        identificacao = self.trabalho.identificacao() if self.trabalho else None
+        if identificacao is not None:
+            self.sindicato = identificacao['sindicato']
+            self.convencao = identificacao['convencao']
+            print("🔍 Sindicato e convenção retomados do trabalho anterior")
+            print(f"   Sindicato: {self.sindicato[:80]}{'...' if len(self.sindicato) > 80 else ''}")
+            print(f"   Convenção: {self.convencao}\n")
+            return self.sindicato, self.convencao
+        
         print("🔍 Identificando sindicato e convenção...")
         
         linhas_iniciais = self.texto_completo[:8000]
@@ -764,6 +932,9 @@ class ExtratorCCT:
         if not self.convencao:
             self.convencao = "ANO NÃO IDENTIFICADO"
         
+        if self.trabalho:
+            self.trabalho.salvar_identificacao(self.sindicato, self.convencao)
+        
         print(f"   Sindicato: {self.sindicato[:80]}{'...' if len(self.sindicato) > 80 else ''}")
         print(f"   Convenção: {self.convencao}\n")
         
@@ -778,71 +949,94 @@ class ExtratorCCT:
         titulo = re.sub(r'\s+', ' ', titulo)
         return titulo.strip()
     
-    def extrair_clausulas(self) -> List[Dict[str, str]]:
-        """Extrai cláusulas do texto"""
-        print("📋 Extraindo cláusulas...")
-        
-        linhas = self.texto_completo.split('\n')
+    def segmentar_clausulas(self) -> List[Dict[str, str]]:
+        """Divide o texto em cláusulas (título e conteúdo)"""
         clausulas_encontradas = []
-        i = 0
         
-        while i < len(linhas):
-            linha = linhas[i].strip()
+        for titulo_clausula, conteudo, _, _ in segmentar(self.texto_completo):
+            conteudo_completo = self._limpar_conteudo(conteudo)
             
-            if re.match(r'^CL[ÁA]USULA\s+', linha, re.IGNORECASE):
-                titulo_clausula = linha
-                inicio_conteudo = i + 1
-                
-                j = i + 1
-                while j < len(linhas):
-                    proxima_linha = linhas[j].strip()
-                    if re.match(r'^CL[ÁA]USULA\s+', proxima_linha, re.IGNORECASE):
-                        break
-                    j += 1
-                
-                conteudo_linhas = linhas[inicio_conteudo:j]
-                conteudo_completo = '\n'.join(conteudo_linhas).strip()
-                conteudo_completo = self._limpar_conteudo(conteudo_completo)
-                
-                if conteudo_completo:
-                    titulo_normalizado = self.normalizar_titulo_clausula(titulo_clausula)
-                    
-                    clausulas_encontradas.append({
-                        'titulo': titulo_normalizado,
-                        'conteudo': conteudo_completo
-                    })
-                
-                i = j
-            else:
-                i += 1
+            if conteudo_completo:
+                clausulas_encontradas.append({
+                    'titulo': self.normalizar_titulo_clausula(titulo_clausula),
+                    'conteudo': conteudo_completo
+                })
+        
+        return clausulas_encontradas
+    
+    def extrair_clausulas(self, escritor: Optional[EscritorCSV] = None) -> List[Dict[str, str]]:
+        """Extrai cláusulas do texto (com escritor, cada uma é gravada assim que o resumo fica pronto)"""
+        print("📋 Extraindo cláusulas...")
+        
+        clausulas_encontradas = self.trabalho.clausulas() if self.trabalho else None
+        if clausulas_encontradas is not None:
+            print(f"   Cláusulas retomadas do trabalho anterior")
+        else:
+            with self.metricas.etapa('segmentacao'):
+                clausulas_encontradas = self.segmentar_clausulas()
+            if self.trabalho:
+                self.trabalho.salvar_clausulas(clausulas_encontradas)
         
         print(f"   Encontradas {len(clausulas_encontradas)} cláusulas")
+        
+        resumos_salvos = self.trabalho.resumos(self.usar_ia) if self.trabalho else {}
+        if resumos_salvos:
+            print(f"   {len(resumos_salvos)} resumo(s) retomado(s) do trabalho anterior")
         print()
         
-        clausulas = []
         total = len(clausulas_encontradas)
+        resumos = dict(resumos_salvos)
         
-        for idx, clausula_info in enumerate(clausulas_encontradas, 1):
-            titulo = clausula_info['titulo']
-            conteudo = clausula_info['conteudo']
-            
-            if idx % 5 == 0 or idx == total:
-                print(f"   Processando cláusulas... {idx}/{total}")
-            
-            if self.usar_ia and conteudo:
-                resumo = self._gerar_resumo_ia(titulo, conteudo)
-            else:
-                resumo = self._gerar_resumo_simples(conteudo)
-            
-            clausula_dict = {
+        def montar_linha(indice):
+            return {
                 'Sindicato': self.sindicato,
                 'Convenção': self.convencao,
-                'Título da Cláusula': titulo,
-                'Resumo': resumo,
-                'Cláusula Completa': conteudo
+                'Título da Cláusula': clausulas_encontradas[indice]['titulo'],
+                'Resumo': resumos[indice],
+                'Cláusula Completa': clausulas_encontradas[indice]['conteudo']
             }
+        
+        if escritor:
+            for indice in sorted(resumos):
+                escritor.gravar(indice, montar_linha(indice))
+        
+        pendentes = [
+            (indice, info['titulo'], info['conteudo'])
+            for indice, info in enumerate(clausulas_encontradas)
+            if indice not in resumos
+        ]
+        
+        def registrar(indice, resumo, origem=ORIGEM_SIMPLES):
+            resumos[indice] = resumo
+            if self.trabalho:
+                self.trabalho.registrar_resumo(indice, resumo, origem)
+            if escritor:
+                escritor.gravar(indice, montar_linha(indice))
+            if len(resumos) % 5 == 0 or len(resumos) == total:
+                print(f"   Processando cláusulas... {len(resumos)}/{total}")
+        
+        with self.metricas.etapa('resumos'):
+            if self.usar_ia:
+                com_conteudo = [item for item in pendentes if item[2]]
+                if com_conteudo:
+                    print(f"   🤖 Gerando {len(com_conteudo)} resumo(s) com IA "
+                          f"({self.sumarizador.concorrencia} em paralelo)")
+                
+                def registrar_ia(indice, resumo):
+                    if resumo is None:  # Falha da IA: resumo simples, refeito se o trabalho for retomado
+                        registrar(indice, self._gerar_resumo_simples(clausulas_encontradas[indice]['conteudo']))
+                    else:
+                        registrar(indice, resumo, ORIGEM_IA)
+                
+                self.sumarizador.resumir_lote(com_conteudo, registrar_ia)
             
-            clausulas.append(clausula_dict)
+            for indice, titulo, conteudo in pendentes:
+                if indice not in resumos:
+                    registrar(indice, self._gerar_resumo_simples(conteudo))
+        
+        self.metricas.contar('clausulas', total)
+        
+        clausulas = [montar_linha(indice) for indice in range(total)]
         
         self.clausulas = clausulas
         print(f"\n✓ Total de {len(clausulas)} cláusulas extraídas\n")
@@ -877,81 +1071,28 @@ class ExtratorCCT:
     
     def _gerar_resumo_ia(self, titulo: str, conteudo: str) -> str:
         """Gera resumo usando IA"""
-        try:
-            prompt = f"""Analise a seguinte cláusula de CCT e gere um resumo conciso em uma frase (máximo 200 caracteres).
-
-Título: {titulo}
-Conteúdo: {conteudo[:1500]}
-
-Resumo:"""
-
-            response = self.client.chat.completions.create(
-                model="gpt-4.1-mini",
-                messages=[
-                    {"role": "system", "content": "Você é especialista em direito trabalhista. Gere resumos concisos de cláusulas de CCTs."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.3,
-                max_tokens=100
-            )
-            
-            resumo = response.choices[0].message.content.strip().strip('"\'')
-            if resumo and not resumo.endswith('.'):
-                resumo += '.'
-            
-            return resumo
-            
-        except Exception as e:
+        resumo = self.sumarizador.resumir(titulo, conteudo)
+        if resumo is None:
             return self._gerar_resumo_simples(conteudo)
+        return resumo
     
     def _limpar_para_csv(self, texto: str) -> str:
         """Limpa texto para CSV"""
-        if not isinstance(texto, str):
-            return str(texto)
-        
-        texto = texto.replace('\r\n', ' ').replace('\n', ' ').replace('\r', ' ')
-        texto = ' '.join(texto.split())
-        texto = ''.join(char for char in texto if ord(char) >= 32 or char in '\t\n\r')
-        
-        return texto.strip()
+        return limpar_para_csv(texto)
     
-    def salvar_csv(self, output_path: str) -> None:
-        """Salva cláusulas em CSV"""
-        print(f"💾 Salvando dados em CSV: {output_path}")
-        
-        if not self.clausulas:
-            print("❌ Nenhuma cláusula para salvar!")
-            return
-        
+    def _concluir_csv(self, escritor: EscritorCSV) -> None:
+        """Renomeia o CSV parcial para o destino e mostra o resumo da gravação"""
         try:
-            with open(output_path, 'w', newline='', encoding='utf-8') as csvfile:
-                fieldnames = ['Sindicato', 'Convenção', 'Título da Cláusula', 'Resumo', 'Cláusula Completa']
-                writer = csv.DictWriter(
-                    csvfile, 
-                    fieldnames=fieldnames,
-                    quoting=csv.QUOTE_ALL,
-                    escapechar='\\',
-                    doublequote=True
-                )
-                
-                writer.writeheader()
-                
-                clausulas_limpas = []
-                for clausula in self.clausulas:
-                    clausula_limpa = {}
-                    for key, value in clausula.items():
-                        clausula_limpa[key] = self._limpar_para_csv(value)
-                    clausulas_limpas.append(clausula_limpa)
-                
-                writer.writerows(clausulas_limpas)
-            
-            print(f"✓ Arquivo CSV salvo com sucesso!")
-            print(f"   Total de linhas: {len(self.clausulas)}")
-            print(f"   Tamanho: {os.path.getsize(output_path) / 1024:.2f} KB\n")
-            
+            if not escritor.concluir():
+                print("❌ Nenhuma cláusula para salvar!")
+                return
         except Exception as e:
             print(f"❌ Erro ao salvar CSV: {e}")
             raise
+        
+        print(f"✓ Arquivo CSV salvo com sucesso!")
+        print(f"   Total de linhas: {escritor.linhas}")
+        print(f"   Tamanho: {os.path.getsize(escritor.destino) / 1024:.2f} KB\n")
     
     def processar(self, output_path: str, barra_progresso=None) -> None:
         """Executa processo completo"""
@@ -959,26 +1100,124 @@ Resumo:"""
         print("🚀 EXTRATOR DE DADOS DE CCTs - VERSÃO STANDALONE")
         print("=" * 70)
         
+        status = 'erro'
+        try:
+            self._processar_etapas(output_path, barra_progresso)
+            status = 'concluido'
+        finally:
+            self._salvar_relatorio(output_path, status)
+            self._fechar_caches()
+        
+        cache_resumos = self.sumarizador.cache if self.usar_ia else None
+        if cache_resumos is not None:
+            print(f"📦 Cache de resumos: {cache_resumos.acertos} acerto(s), {cache_resumos.faltas} falta(s)")
+            print()
+        
+        similares = self.sumarizador.similares if self.usar_ia else None
+        if similares is not None and similares.consultas:
+            print(f"🔁 Cláusulas semelhantes à planilha mãe: {similares.reaproveitados} resumo(s) reaproveitado(s), "
+                  f"{similares.ajustados} ajustado(s), de {similares.consultas} consultada(s)")
+            print()
+        
+        print("=" * 70)
+        print("✅ PROCESSO CONCLUÍDO COM SUCESSO!")
+        print("=" * 70)
+        print()
+    
+    def _configuracao_trabalho(self) -> Dict:
+        """Ajustes que mudam o texto extraído (checkpoints de outra configuração não são retomados)"""
+        return {
+            'modo_extracao': self.modo_extracao,
+            'dpi': DPI_PADRAO,
+            'ocr_cinza': self.ocr_cinza,
+            'ocr_dpi_inicial': self.ocr_dpi_inicial,
+            'ocr_confianca_minima': self.ocr_confianca_minima if self.ocr_dpi_inicial else None,
+        }
+    
+    def _processar_etapas(self, output_path: str, barra_progresso=None) -> None:
+        """Etapas do processar, cada uma medida em self.metricas"""
+        if self.config_manager.config.get('retomar_trabalhos', True):
+            self.trabalho = TrabalhoExtracao.abrir(self.config_manager.config_dir / 'trabalhos', self.pdf_path,
+                                                   self._configuracao_trabalho())
+            if self.trabalho.descartado:
+                print("\n♻ Trabalho interrompido com outra configuração de extração descartado")
+            if self.trabalho.retomado:
+                print(f"\n♻ Retomando trabalho interrompido: {self.trabalho.diretorio}")
+        
+        self.metricas.contar('bytes_pdf', os.path.getsize(self.pdf_path))
+        
         if barra_progresso:
             barra_progresso.atualizar(10, "Extraindo texto do PDF...")
-        self.extrair_texto_pdf_ocr()
+        with self.metricas.etapa('extracao_texto'):
+            self.extrair_texto_pdf_ocr()
+        self.metricas.contar('caracteres_texto', len(self.texto_completo))
+        
         if barra_progresso:
             barra_progresso.atualizar(30, "Identificando sindicato e convenção...")
-        self.identificar_sindicato_convencao()
+        with self.metricas.etapa('identificacao'):
+            self.identificar_sindicato_convencao()
         if barra_progresso:
             barra_progresso.atualizar(50, "Extraindo cláusulas...")
-        self.extrair_clausulas()
-        if barra_progresso:
-            barra_progresso.atualizar(90, "Salvando CSV...")
-        self.salvar_csv(output_path)
+        
+        # Cada cláusula vai para o CSV parcial assim que o resumo fica pronto
+        with EscritorCSV(output_path, COLUNAS, limpar=self._limpar_para_csv) as escritor:
+            print(f"💾 Gravando CSV à medida que as cláusulas ficam prontas: {escritor.parcial}")
+            self.extrair_clausulas(escritor)
+            if barra_progresso:
+                barra_progresso.atualizar(90, "Salvando CSV...")
+            with self.metricas.etapa('gravacao_csv'):
+                self._concluir_csv(escritor)
+        if os.path.exists(output_path):
+            self.metricas.contar('bytes_csv', os.path.getsize(output_path))
+        
+        if self.trabalho:
+            self.trabalho.concluir()
         
         if barra_progresso:
             barra_progresso.atualizar(100, "Processo concluído!")
+    
+    def _fechar_caches(self) -> None:
+        """Fecha as conexões dos caches de OCR e de resumos (os contadores continuam disponíveis)"""
+        if self.cache_ocr is not None:
+            self.cache_ocr.fechar()
+        if self.usar_ia and self.sumarizador.cache is not None:
+            self.sumarizador.cache.fechar()
+    
+    def _salvar_relatorio(self, output_path: str, status: str) -> None:
+        """Relatório JSON da execução ao lado do CSV (e o .prom, se configurado)"""
+        config = self.config_manager.config
+        if not config.get('relatorio_execucao', True):
+            return
         
-        print("=" * 70)
-        print("✅ PROCESSO CONCLUÍDO COM SUCESSO!")
-        print("=" * 70)
-        print()
+        if self.cache_ocr is not None:
+            self.metricas.registrar_cache('ocr', self.cache_ocr.acertos, self.cache_ocr.faltas)
+        if self.usar_ia and self.sumarizador.cache is not None:
+            self.metricas.registrar_cache('resumos', self.sumarizador.cache.acertos, self.sumarizador.cache.faltas)
+        if self.usar_ia and self.sumarizador.similares is not None:
+            similares = self.sumarizador.similares
+            self.metricas.registrar_cache('similares', similares.reaproveitados + similares.ajustados,
+                                          similares.consultas - similares.reaproveitados - similares.ajustados)
+        
+        try:
+            relatorio = self.metricas.salvar_json(
+                caminho_relatorio(output_path),
+                status=status,
+                pdf=str(self.pdf_path),
+                csv=str(output_path),
+                modo_extracao=self.modo_extracao,
+                workers_ocr=self.workers_ocr,
+                ocr_dpi_inicial=self.ocr_dpi_inicial,
+                ocr_confianca_minima=self.ocr_confianca_minima if self.ocr_dpi_inicial else None,
+                resumos_ia=self.usar_ia,
+            )
+            print(f"📈 Relatório da execução: {relatorio}")
+            if config.get('metricas_prometheus', False):
+                prom = self.metricas.salvar_prometheus(caminho_prometheus(output_path),
+                                                       pdf=Path(self.pdf_path).name)
+                print(f"📈 Métricas (Prometheus): {prom}")
+            print()
+        except OSError as e:
+            print(f"⚠ Não foi possível gravar o relatório da execução: {e}")
 
 
 def main():
@@ -1035,65 +1274,17 @@ def main():
             root.destroy()
             return 1
         
-        # 1. Selecionar arquivo PDF
-        print("📄 Selecione o arquivo PDF da CCT...")
-        pdf_path = selecionar_pdf()
-        
-        if not pdf_path:
-            print("❌ Nenhum arquivo selecionado. Operação cancelada.")
-            return 1
-        
-        print(f"✓ Arquivo selecionado: {os.path.basename(pdf_path)}\n")
-        
-        # 2. Selecionar onde salvar CSV
-        print("💾 Selecione onde salvar o arquivo CSV...")
-        output_path = selecionar_csv_saida(pdf_path)
-        
-        if not output_path:
-            print("❌ Nenhum local selecionado. Operação cancelada.")
-            return 1
-        
-        print(f"✓ Será salvo em: {os.path.basename(output_path)}\n")
-        
-        # 3. Verificar se IA está disponível
         if config_manager.get_api_key():
             print("🤖 OpenAI configurada - Usando IA para gerar resumos\n")
         else:
             print("⚠️  OpenAI não configurada - Usando resumos simples\n")
         
-        # 4. Processar com barra de progresso
-        extrator = ExtratorCCT(pdf_path=pdf_path, config_manager=config_manager)
-        
-        # Criar barra de progresso
-        barra = BarraProgresso("Extraindo Dados da CCT")
-        barra.criar_janela()
-        
-        try:
-            extrator.processar(output_path, barra_progresso=barra)
-        finally:
-            barra.fechar()
-        
-        # 5. Janela de confirmação
-        print(f"📄 Arquivo gerado: {output_path}")
-        print()
-        
-        acao = janela_confirmacao_csv(output_path, len(extrator.clausulas), extrator.convencao)
-        
-        if acao == "integrar":
-            print("\n📊 Integrando com planilha mãe...")
-            
-            # Selecionar planilha mãe
-            csv_mae = selecionar_planilha_mae()
-            
-            if csv_mae:
-                # Integrar
-                sucesso = integrar_com_planilha_mae(output_path, csv_mae)
-                if sucesso:
-                    print("✅ Integração concluída com sucesso!")
-                else:
-                    print("❌ Erro na integração.")
-            else:
-                print("❌ Nenhuma planilha mãe selecionada.")
+        # Janela com a fila de PDFs; a extração roda em segundo plano
+        janela = JanelaFila(config_manager)
+        janela.root.after_idle(janela.adicionar_pdfs)
+        threading.Thread(target=preaquecer_importacoes, args=(bool(config_manager.get_api_key()),),
+                         name='preaquecer', daemon=True).start()
+        janela.executar()
         
         return 0
         
@@ -1116,4 +1307,5 @@ def main():
 
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()  # Necessário para o OCR paralelo no executável
     sys.exit(main())
@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Extrator de CCTs em lote, sem interface gráfica
+Descrição: Processa vários PDFs ao mesmo tempo (um processo por PDF, --jobs em
+paralelo) sem abrir janelas: o sindicato detectado é aceito e cada CSV pode
+ir para um diretório de saída e/ou ser integrado à planilha mãe. Chave da API
+e caminho do Tesseract vêm do ConfigManager (mesma configuração do
+aplicativo). Os processos de OCR e os limites da IA (ia_concorrencia, ia_rpm,
+ia_tpm) são divididos entre os --jobs, para o lote inteiro não passar do que
+está configurado. A saída de cada extração vai para um .log ao lado do CSV; no
+fim, um resumo em JSON é impresso na saída padrão.
+
+Uso:
+    python extrator_lote.py "CCTs/*.pdf" outra.pdf --saida csvs --jobs 3
+    python extrator_lote.py pasta_pdfs --planilha-mae CCTs_Extraidas.csv
+
+Código de saída: 0 = todos concluídos, 1 = algum PDF com erro, 2 = nada a
+processar ou configuração inválida.
+"""
+
+import os
+import sys
+import glob
+import json
+import time
+import argparse
+import traceback
+import multiprocessing
+from contextlib import redirect_stdout, redirect_stderr
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from extrator_cct_standalone import ConfigManager, ExtratorCCT, find_tesseract, mesclar_na_planilha_mae
+from metricas import caminho_relatorio
+from resumos_ia import CONCORRENCIA_PADRAO, RPM_PADRAO, TPM_PADRAO
+
+
+def encontrar_pdfs(entradas: List[str]) -> List[Path]:
+    """Arquivos, padrões glob (** recursivo) e diretórios -> PDFs sem repetição, na ordem dada"""
+    pdfs = []
+    vistos = set()
+    for entrada in entradas:
+        if glob.has_magic(entrada):
+            candidatos = sorted(glob.glob(entrada, recursive=True))
+        elif os.path.isdir(entrada):
+            candidatos = sorted(str(p) for p in Path(entrada).iterdir() if p.suffix.lower() == '.pdf')
+        else:
+            candidatos = [entrada]
+        for candidato in candidatos:
+            caminho = Path(candidato)
+            chave = caminho.resolve()
+            if chave not in vistos and (caminho.is_file() or not glob.has_magic(entrada)):
+                vistos.add(chave)
+                pdfs.append(caminho)
+    return pdfs
+
+
+def caminhos_saida(pdfs: List[Path], saida: Optional[str]) -> List[Path]:
+    """<nome>_extraido.csv no diretório de saída (ou ao lado do PDF); nomes repetidos ganham sufixo"""
+    usados = set()
+    destinos = []
+    for pdf in pdfs:
+        pasta = Path(saida) if saida else pdf.parent
+        destino = pasta / f"{pdf.stem}_extraido.csv"
+        n = 2
+        while destino.resolve() in usados:
+            destino = pasta / f"{pdf.stem}_{n}_extraido.csv"
+            n += 1
+        usados.add(destino.resolve())
+        destinos.append(destino)
+    return destinos
+
+
+def _aceitar_sindicato(detectado: str, todos: list) -> str:
+    """Sem janela de confirmação: usa o sindicato detectado (ou o primeiro encontrado)"""
+    return detectado or (todos[0] if todos else "")
+
+
+def limites_ia_por_job(config: Dict, jobs: int) -> Dict[str, int]:
+    """Concorrência e limites de taxa da IA de cada job (os configurados divididos pelos jobs)"""
+    return {
+        'ia_concorrencia': max(1, config.get('ia_concorrencia', CONCORRENCIA_PADRAO) // jobs),
+        'ia_rpm': max(1, config.get('ia_rpm', RPM_PADRAO) // jobs),
+        'ia_tpm': max(1, config.get('ia_tpm', TPM_PADRAO) // jobs),
+    }
+
+
+def processar_pdf(pdf_path: str, output_path: str, workers_ocr: int,
+                  limites_ia: Optional[Dict[str, int]] = None) -> Dict:
+    """Extrai um PDF em um processo do lote; prints vão para <CSV>.log"""
+    inicio = time.perf_counter()
+    resultado = {'pdf': pdf_path, 'csv': output_path, 'status': 'erro'}
+    log = Path(output_path).with_suffix('.log')
+    resultado['log'] = str(log)
+
+    with open(log, 'w', encoding='utf-8') as f, redirect_stdout(f), redirect_stderr(f):
+        try:
+            config_manager = ConfigManager()
+            config_manager.config.update(limites_ia or {})  # Só neste processo (não é salvo)
+            extrator = ExtratorCCT(pdf_path, config_manager, workers_ocr=workers_ocr)
+            extrator._confirmar_sindicato = _aceitar_sindicato
+            extrator.processar(output_path)
+            resultado.update(
+                status='concluido' if os.path.exists(output_path) else 'vazio',
+                clausulas=len(extrator.clausulas),
+                sindicato=extrator.sindicato,
+                convencao=extrator.convencao,
+                resumos_ia=extrator.usar_ia,
+            )
+        except Exception as e:
+            traceback.print_exc()
+            resultado['erro'] = f"{type(e).__name__}: {e}"
+
+    relatorio = caminho_relatorio(output_path)
+    if relatorio.exists():
+        resultado['relatorio'] = str(relatorio)
+    resultado['segundos'] = round(time.perf_counter() - inicio, 3)
+    return resultado
+
+
+def _verificar_configuracao(config_manager: ConfigManager) -> Optional[str]:
+    """Mesma verificação do aplicativo: sem Tesseract não há extração"""
+    tesseract_path = config_manager.get_tesseract_path()
+    if not tesseract_path:
+        tesseract_path = find_tesseract()
+        if tesseract_path:
+            config_manager.set_tesseract_path(tesseract_path)
+    if not tesseract_path or not os.path.exists(tesseract_path):
+        return "Tesseract OCR não encontrado (configure tesseract_path ou instale o Tesseract)"
+    return None
+
+
+def _integrar(resultado: Dict, planilha_mae: str) -> None:
+    """Integra um CSV concluído à planilha mãe (no processo principal, um de cada vez)"""
+    try:
+        with redirect_stdout(sys.stderr):
+            mesclado = mesclar_na_planilha_mae(resultado['csv'], planilha_mae)
+        resultado['planilha_mae'] = {
+            'inseridas': len(mesclado.inseridas),
+            'atualizadas': mesclado.atualizadas,
+            'iguais': mesclado.iguais,
+        }
+    except Exception as e:
+        resultado['status'] = 'erro'
+        resultado['erro'] = f"Integração com a planilha mãe: {type(e).__name__}: {e}"
+
+
+def executar_lote(pdfs: List[Path], destinos: List[Path], jobs: int, workers_ocr: int,
+                  planilha_mae: Optional[str] = None,
+                  limites_ia: Optional[Dict[str, int]] = None) -> List[Dict]:
+    """Processa os PDFs com até jobs processos; resultados na ordem dos PDFs"""
+    resultados: List[Optional[Dict]] = [None] * len(pdfs)
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        futuros = {
+            executor.submit(processar_pdf, str(pdf), str(destino), workers_ocr, limites_ia): i
+            for i, (pdf, destino) in enumerate(zip(pdfs, destinos))
+        }
+        try:
+            for futuro in as_completed(futuros):
+                i = futuros[futuro]
+                try:
+                    resultado = futuro.result()
+                except Exception as e:
+                    resultado = {'pdf': str(pdfs[i]), 'csv': str(destinos[i]), 'status': 'erro',
+                                 'erro': f"{type(e).__name__}: {e}"}
+                if planilha_mae and resultado['status'] == 'concluido':
+                    _integrar(resultado, planilha_mae)
+                resultados[i] = resultado
+
+                marca = {'concluido': '✓', 'vazio': '⚠'}.get(resultado['status'], '❌')
+                detalhe = resultado.get('erro') or f"{resultado.get('clausulas', 0)} cláusulas"
+                print(f"{marca} [{sum(r is not None for r in resultados)}/{len(pdfs)}] "
+                      f"{pdfs[i].name}: {detalhe} ({resultado.get('segundos', 0):.1f}s)", file=sys.stderr)
+        except KeyboardInterrupt:
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+    return resultados
+
+
+def resumo_lote(resultados: List[Dict], segundos: float, **extras) -> Dict:
+    """Resumo legível por máquina (impresso como JSON no fim da execução)"""
+    contagem = {}
+    for resultado in resultados:
+        contagem[resultado['status']] = contagem.get(resultado['status'], 0) + 1
+    return {
+        **extras,
+        'total': len(resultados),
+        'concluidos': contagem.get('concluido', 0),
+        'vazios': contagem.get('vazio', 0),
+        'erros': contagem.get('erro', 0),
+        'clausulas': sum(r.get('clausulas', 0) for r in resultados),
+        'segundos': round(segundos, 3),
+        'arquivos': resultados,
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Extrai CCTs em lote, sem interface gráfica")
+    parser.add_argument('entradas', nargs='+', help="PDFs, padrões glob (entre aspas) ou diretórios")
+    parser.add_argument('--saida', help="Diretório dos CSVs (padrão: ao lado de cada PDF)")
+    parser.add_argument('--planilha-mae', help="Integra cada CSV concluído a esta planilha mãe")
+    parser.add_argument('--jobs', '-j', type=int, default=1, help="PDFs processados ao mesmo tempo")
+    parser.add_argument('--workers-ocr', type=int,
+                        help="Processos de OCR por PDF (padrão: ocr_workers da configuração dividido por --jobs)")
+    parser.add_argument('--resumo', help="Grava também o resumo JSON neste arquivo")
+    args = parser.parse_args(argv)
+
+    inicio = time.perf_counter()
+    jobs = max(1, args.jobs)
+
+    def encerrar(codigo: int, resultados: List[Dict], **extras) -> int:
+        resumo = resumo_lote(resultados, time.perf_counter() - inicio, codigo_saida=codigo, jobs=jobs, **extras)
+        texto = json.dumps(resumo, ensure_ascii=False)
+        if args.resumo:
+            Path(args.resumo).write_text(texto + '\n', encoding='utf-8')
+        print(texto)
+        return codigo
+
+    config_manager = ConfigManager()
+    problema = _verificar_configuracao(config_manager)
+    if problema:
+        print(f"❌ {problema}", file=sys.stderr)
+        return encerrar(2, [], erro=problema)
+
+    pdfs = encontrar_pdfs(args.entradas)
+    if not pdfs:
+        print("❌ Nenhum PDF encontrado", file=sys.stderr)
+        return encerrar(2, [], erro="Nenhum PDF encontrado")
+
+    if args.saida:
+        Path(args.saida).mkdir(parents=True, exist_ok=True)
+    destinos = caminhos_saida(pdfs, args.saida)
+    workers_ocr = args.workers_ocr or max(1, config_manager.get_workers_ocr() // jobs)
+    limites_ia = limites_ia_por_job(config_manager.config, jobs)
+
+    ia = "resumos simples"
+    if config_manager.get_api_key():
+        ia = (f"com IA: {limites_ia['ia_concorrencia']} em paralelo e "
+              f"{limites_ia['ia_rpm']} req/min por PDF")
+    print(f"🚀 {len(pdfs)} PDF(s), {jobs} ao mesmo tempo, {workers_ocr} processo(s) de OCR cada ({ia})",
+          file=sys.stderr)
+
+    try:
+        resultados = executar_lote(pdfs, destinos, jobs, workers_ocr, args.planilha_mae, limites_ia)
+    except KeyboardInterrupt:
+        print("\n❌ Operação cancelada pelo usuário.", file=sys.stderr)
+        return 130
+
+    codigo = 0 if all(r['status'] != 'erro' for r in resultados) else 1
+    return encerrar(codigo, resultados, planilha_mae=args.planilha_mae)
+
+
+if __name__ == '__main__':
+    multiprocessing.freeze_support()
+    sys.exit(main())
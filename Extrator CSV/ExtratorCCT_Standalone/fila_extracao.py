@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Fila de extração em segundo plano do Extrator de CCTs
+Descrição: Uma thread processa os PDFs enfileirados, um de cada vez, e publica
+eventos (progresso, pergunta, concluído, erro) em uma fila thread-safe. A
+interface Tk lê essa fila com after() e continua respondendo enquanto o OCR e
+as chamadas à API rodam. Diálogos que a extração precisa abrir (confirmação do
+sindicato) são pedidos à thread da interface, que devolve a resposta.
+"""
+
+import queue
+import threading
+import traceback
+from typing import Any, Callable, Optional
+
+PROGRESSO = 'progresso'
+PERGUNTA = 'pergunta'
+CONCLUIDO = 'concluido'
+ERRO = 'erro'
+
+
+class Evento:
+    """Mensagem da thread de extração para a interface"""
+
+    def __init__(self, tipo: str, pedido: 'PedidoExtracao', **dados):
+        self.tipo = tipo
+        self.pedido = pedido
+        self.dados = dados
+
+
+class PedidoExtracao:
+    """Um PDF na fila e o CSV de destino"""
+
+    def __init__(self, numero: int, pdf_path: str, output_path: str):
+        self.numero = numero
+        self.pdf_path = pdf_path
+        self.output_path = output_path
+        self.extrator = None
+
+
+class ProgressoEventos:
+    """Substitui a BarraProgresso dentro da thread: atualizar() vira um evento"""
+
+    def __init__(self, eventos: queue.Queue, pedido: PedidoExtracao):
+        self.eventos = eventos
+        self.pedido = pedido
+
+    def atualizar(self, valor, status=""):
+        self.eventos.put(Evento(PROGRESSO, self.pedido, valor=valor, status=status))
+
+
+class TrabalhadorExtracao(threading.Thread):
+    """Thread que processa a fila de PDFs e publica eventos"""
+
+    def __init__(self, criar_extrator: Callable[[PedidoExtracao], Any], eventos: Optional[queue.Queue] = None):
+        """
+        Args:
+            criar_extrator: Monta o extrator de um pedido (chamada na thread de extração)
+            eventos: Fila lida pela interface (criada se não for informada)
+        """
+        super().__init__(name='extracao', daemon=True)
+        self.criar_extrator = criar_extrator
+        self.eventos = eventos if eventos is not None else queue.Queue()
+        self._pedidos: queue.Queue = queue.Queue()
+        self._numero = 0
+        self._lock = threading.Lock()
+
+    def adicionar(self, pdf_path: str, output_path: str) -> PedidoExtracao:
+        """Enfileira um PDF; devolve o pedido (o número identifica os eventos dele)"""
+        with self._lock:
+            self._numero += 1
+            pedido = PedidoExtracao(self._numero, pdf_path, output_path)
+        self._pedidos.put(pedido)
+        return pedido
+
+    def encerrar(self) -> None:
+        """Termina a thread depois do pedido em andamento"""
+        self._pedidos.put(None)
+
+    def perguntar(self, pedido: PedidoExtracao, funcao: Callable, *args) -> Any:
+        """Executa funcao(*args) na thread da interface e espera o resultado"""
+        resposta: queue.Queue = queue.Queue(maxsize=1)
+        self.eventos.put(Evento(PERGUNTA, pedido, funcao=funcao, args=args, resposta=resposta))
+        sucesso, valor = resposta.get()
+        if not sucesso:
+            raise valor
+        return valor
+
+    def run(self) -> None:
+        while True:
+            pedido = self._pedidos.get()
+            if pedido is None:
+                return
+            try:
+                pedido.extrator = self.criar_extrator(pedido)
+                pedido.extrator.processar(pedido.output_path,
+                                          barra_progresso=ProgressoEventos(self.eventos, pedido))
+                self.eventos.put(Evento(CONCLUIDO, pedido,
+                                        clausulas=len(pedido.extrator.clausulas),
+                                        convencao=pedido.extrator.convencao))
+            except Exception as e:
+                traceback.print_exc()
+                self.eventos.put(Evento(ERRO, pedido, mensagem=str(e)))
+
+
+def responder(evento: Evento) -> None:
+    """Na thread da interface: executa a pergunta do evento e devolve a resposta à extração"""
+    try:
+        evento.dados['resposta'].put((True, evento.dados['funcao'](*evento.dados['args'])))
+    except Exception as e:
+        evento.dados['resposta'].put((False, e))
@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Limpeza de texto para o CSV do Extrator de CCTs
+Descrição: Deixa cada valor em uma linha só (espaços em branco, inclusive
+quebras de linha, viram um espaço) e remove caracteres de controle. Os
+padrões são montados uma vez; limpar_coluna faz o mesmo em uma coluna inteira
+do pandas.
+"""
+
+import re
+
+# Controles que sobram depois de juntar os espaços (\t, \n, \r, \x0b, \x0c e
+# \x1c-\x1f já são espaço em branco para str.split). Uma classe de regex é
+# mais rápida que str.translate, que em texto acentuado consulta a tabela
+# caractere a caractere.
+CONTROLES = ''.join(chr(c) for c in range(32) if not chr(c).isspace())
+PADRAO_CONTROLES = re.compile('[' + re.escape(CONTROLES) + ']')
+
+# Os mesmos espaços em branco de str.split, listados um a um: o \s do motor de
+# regex do pandas (pyarrow) só reconhece os espaços ASCII. O último deles é o
+# U+3000 (espaço ideográfico)
+PADRAO_ESPACOS = '[' + re.escape(''.join(chr(c) for c in range(0x3001) if chr(c).isspace())) + ']+'
+
+
+def limpar_para_csv(texto) -> str:
+    """Texto em uma linha, sem espaços repetidos nem caracteres de controle"""
+    if not isinstance(texto, str):
+        return str(texto)
+    return PADRAO_CONTROLES.sub('', ' '.join(texto.split())).strip()
+
+
+def limpar_coluna(serie):
+    """limpar_para_csv aplicado a uma coluna (pandas.Series) de uma vez"""
+    return (serie.map(str)
+            .str.replace(PADRAO_ESPACOS, ' ', regex=True)
+            .str.replace(PADRAO_CONTROLES.pattern, '', regex=True)
+            .str.strip())
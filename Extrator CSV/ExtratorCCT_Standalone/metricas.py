@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Métricas de execução do Extrator de CCTs
+Descrição: Tempos de parede e de CPU por etapa, tempos por página (renderização
+e Tesseract), histogramas de latência da API, bytes processados e taxas de
+acerto dos caches. No fim da execução vira um relatório JSON gravado ao lado
+do CSV e, opcionalmente, um arquivo no formato de texto do Prometheus.
+"""
+
+import os
+import re
+import json
+import math
+import time
+import bisect
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, List, Optional
+
+# Limites (segundos) dos baldes dos histogramas de latência
+LIMITES_LATENCIA = (0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+PREFIXO_PROMETHEUS = 'extrator_cct'
+
+
+def tempo_cpu() -> float:
+    """
+    CPU do processo (process_time, alta resolução) e dos filhos já encerrados
+    (os filhos só contam no Unix)
+    """
+    t = os.times()
+    return time.process_time() + t.children_user + t.children_system
+
+
+def caminho_relatorio(caminho_csv: str) -> Path:
+    """Relatório JSON ao lado do CSV (CCT.csv -> CCT.relatorio.json)"""
+    return Path(caminho_csv).with_suffix('.relatorio.json')
+
+
+def caminho_prometheus(caminho_csv: str) -> Path:
+    """Arquivo .prom ao lado do CSV, no formato lido pelo textfile collector"""
+    return Path(caminho_csv).with_suffix('.prom')
+
+
+class Histograma:
+    """Histograma de baldes cumulativos, com soma e percentis"""
+
+    def __init__(self, limites=LIMITES_LATENCIA):
+        self.limites = tuple(limites)
+        self.baldes = [0] * (len(self.limites) + 1)
+        self.valores: List[float] = []
+
+    def observar(self, valor: float) -> None:
+        self.baldes[bisect.bisect_left(self.limites, valor)] += 1
+        self.valores.append(valor)
+
+    def percentil(self, p: float) -> Optional[float]:
+        """Percentil pelo método nearest-rank (p50 de [1, 2] é 1)"""
+        if not self.valores:
+            return None
+        ordenados = sorted(self.valores)
+        posicao = max(0, math.ceil(p / 100 * len(ordenados)) - 1)
+        return ordenados[min(len(ordenados) - 1, posicao)]
+
+    def resumo(self) -> Dict:
+        acumulado = 0
+        baldes = {}
+        for limite, quantidade in zip(self.limites + ('+Inf',), self.baldes):
+            acumulado += quantidade
+            baldes[str(limite)] = acumulado
+        return {
+            'quantidade': len(self.valores),
+            'soma_s': round(sum(self.valores), 6),
+            'p50_s': self.percentil(50),
+            'p95_s': self.percentil(95),
+            'max_s': max(self.valores) if self.valores else None,
+            'baldes': baldes,
+        }
+
+
+class Metricas:
+    """Coletor de métricas de uma execução (seguro entre threads)"""
+
+    def __init__(self):
+        self.inicio = time.time()
+        self._inicio_parede = time.perf_counter()
+        self._inicio_cpu = tempo_cpu()
+        self._lock = threading.Lock()
+        self.etapas: Dict[str, Dict] = {}
+        self.paginas: Dict[int, Dict] = {}
+        self.contadores: Dict[str, float] = {}
+        self.histogramas: Dict[str, Histograma] = {}
+        self.caches: Dict[str, Dict] = {}
+
+    @contextmanager
+    def etapa(self, nome: str):
+        """Mede o tempo de parede e de CPU do bloco; repetições se acumulam"""
+        parede, cpu = time.perf_counter(), tempo_cpu()
+        try:
+            yield
+        finally:
+            parede, cpu = time.perf_counter() - parede, tempo_cpu() - cpu
+            with self._lock:
+                etapa = self.etapas.setdefault(nome, {'parede_s': 0.0, 'cpu_s': 0.0, 'execucoes': 0})
+                etapa['parede_s'] += parede
+                etapa['cpu_s'] += cpu
+                etapa['execucoes'] += 1
+
+    def contar(self, nome: str, valor: float = 1) -> None:
+        with self._lock:
+            self.contadores[nome] = self.contadores.get(nome, 0) + valor
+
+    def observar(self, nome: str, valor: float) -> None:
+        with self._lock:
+            self.histogramas.setdefault(nome, Histograma()).observar(valor)
+
+    def registrar_pagina(self, numero: int, **dados) -> None:
+        """Dados de uma página (numeração a partir de 1); chamadas repetidas se somam ao registro"""
+        with self._lock:
+            self.paginas.setdefault(numero, {'pagina': numero}).update(dados)
+
+    def registrar_cache(self, nome: str, acertos: int, faltas: int) -> None:
+        consultas = acertos + faltas
+        self.caches[nome] = {
+            'acertos': acertos,
+            'faltas': faltas,
+            'taxa_acerto': round(acertos / consultas, 4) if consultas else None,
+        }
+
+    def relatorio(self, **extras) -> Dict:
+        """Relatório completo da execução; extras entram no topo (PDF, CSV, status...)"""
+        with self._lock:
+            etapas = {nome: {'parede_s': round(e['parede_s'], 6), 'cpu_s': round(e['cpu_s'], 6),
+                             'execucoes': e['execucoes']}
+                      for nome, e in self.etapas.items()}
+            return {
+                **extras,
+                'inicio': time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime(self.inicio)),
+                'total': {
+                    'parede_s': round(time.perf_counter() - self._inicio_parede, 6),
+                    'cpu_s': round(tempo_cpu() - self._inicio_cpu, 6),
+                },
+                'etapas': etapas,
+                'contadores': dict(self.contadores),
+                'latencias': {nome: h.resumo() for nome, h in self.histogramas.items()},
+                'caches': dict(self.caches),
+                'paginas': [self.paginas[n] for n in sorted(self.paginas)],
+            }
+
+    def salvar_json(self, caminho: str, **extras) -> Path:
+        """Grava o relatório (arquivo temporário + renomeação)"""
+        caminho = Path(caminho)
+        temporario = caminho.with_suffix(caminho.suffix + '.tmp')
+        with open(temporario, 'w', encoding='utf-8') as f:
+            json.dump(self.relatorio(**extras), f, ensure_ascii=False, indent=2)
+        os.replace(temporario, caminho)
+        return caminho
+
+    def prometheus(self, **rotulos) -> str:
+        """Métricas no formato de texto do Prometheus"""
+        rotulos_txt = ','.join(f'{chave}="{_escapar(valor)}"' for chave, valor in rotulos.items())
+
+        def rotular(*extras):
+            todos = ','.join(filter(None, (rotulos_txt,) + extras))
+            return '{' + todos + '}' if todos else ''
+
+        rel = self.relatorio()
+        linhas = []
+
+        def metrica(nome, tipo, ajuda, amostras):
+            nome = f'{PREFIXO_PROMETHEUS}_{nome}'
+            linhas.append(f'# HELP {nome} {ajuda}')
+            linhas.append(f'# TYPE {nome} {tipo}')
+            for sufixo, extra, valor in amostras:
+                linhas.append(f'{nome}{sufixo}{rotular(extra)} {valor}')
+
+        metrica('execucao_segundos', 'gauge', 'Tempo de parede da execução',
+                [('', '', rel['total']['parede_s'])])
+        for campo, ajuda in (('parede_s', 'Tempo de parede por etapa'), ('cpu_s', 'Tempo de CPU por etapa')):
+            tipo = 'parede' if campo == 'parede_s' else 'cpu'
+            metrica(f'etapa_{tipo}_segundos', 'gauge', ajuda,
+                    [('', f'etapa="{_escapar(nome)}"', e[campo]) for nome, e in rel['etapas'].items()])
+        for nome, valor in rel['contadores'].items():
+            metrica(f'{_nome_metrica(nome)}_total', 'counter', nome, [('', '', valor)])
+        for nome, h in self.histogramas.items():
+            resumo = h.resumo()
+            amostras = [('_bucket', f'le="{limite}"', quantidade) for limite, quantidade in resumo['baldes'].items()]
+            amostras += [('_sum', '', resumo['soma_s']), ('_count', '', resumo['quantidade'])]
+            metrica(f'{_nome_metrica(nome)}', 'histogram', nome, amostras)
+        metrica('cache_acertos_total', 'counter', 'Acertos de cache',
+                [('', f'cache="{nome}"', c['acertos']) for nome, c in rel['caches'].items()])
+        metrica('cache_faltas_total', 'counter', 'Faltas de cache',
+                [('', f'cache="{nome}"', c['faltas']) for nome, c in rel['caches'].items()])
+        return '\n'.join(linhas) + '\n'
+
+    def salvar_prometheus(self, caminho: str, **rotulos) -> Path:
+        caminho = Path(caminho)
+        temporario = caminho.with_suffix(caminho.suffix + '.tmp')
+        temporario.write_text(self.prometheus(**rotulos), encoding='utf-8')
+        os.replace(temporario, caminho)
+        return caminho
+
+
+def _escapar(valor) -> str:
+    return str(valor).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _nome_metrica(nome: str) -> str:
+    return re.sub(r'[^a-zA-Z0-9_]', '_', nome)
@@ -0,0 +1,390 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Motor de OCR do Extrator de CCTs
+Descrição: Renderiza páginas com PyMuPDF e executa Tesseract, em série ou
+distribuindo lotes de páginas entre processos. No modo híbrido usa a camada
+de texto nativa das páginas que passam na avaliação e só faz OCR das demais.
+Com o tesserocr instalado, cada processo mantém o Tesseract carregado
+(tesseract_persistente); sem ele, cada página é um processo do Tesseract
+"""
+
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Callable, Dict, List, Optional, Tuple
+
+from metricas import tempo_cpu
+
+# fitz (PyMuPDF), PIL e pytesseract são importados dentro das funções: importar
+# este módulo não custa nada até a primeira página (o aplicativo abre mais rápido)
+
+
+DPI_PADRAO = 300
+IDIOMA_PADRAO = 'por'
+
+# Formato do arquivo temporário que o pytesseract grava para o Tesseract ler:
+# PPM/PGM não tem compressão, ao contrário do PNG usado por padrão
+FORMATO_TEMPORARIO = 'PPM'
+
+# OCR adaptativo: a primeira passada usa DPI_INICIAL_ADAPTATIVO; páginas cuja
+# confiança média das palavras (0-100, do TSV do Tesseract) fica abaixo de
+# CONFIANCA_MINIMA são renderizadas de novo no DPI final
+DPI_INICIAL_ADAPTATIVO = 200
+CONFIANCA_MINIMA = 80.0
+
+# Roteamento por página no modo híbrido
+ROTA_TEXTO = 'texto'
+ROTA_OCR = 'ocr'
+
+# Limiares para aceitar a camada de texto nativa sem OCR
+MIN_CARACTERES = 50
+MAX_LIXO = 0.05
+PONTUACAO_VALIDA = set('.,;:!?()[]{}/\\-–—_%ºª°§$€"\'“”‘’«»*+=&@#<>…•·')
+
+
+def workers_padrao() -> int:
+    """Número padrão de processos de OCR (um por núcleo)"""
+    return max(1, os.cpu_count() or 1)
+
+
+def renderizar_pagina(page, dpi: int = DPI_PADRAO, cinza: bool = False):
+    """Renderiza a página em um pixmap RGB (ou tons de cinza) sem canal alfa"""
+    import fitz  # PyMuPDF
+    colorspace = fitz.csGRAY if cinza else fitz.csRGB
+    return page.get_pixmap(dpi=dpi, colorspace=colorspace, alpha=False)
+
+
+def imagem_do_pixmap(pix) -> 'Image.Image':
+    """
+    Cria a imagem PIL direto dos pixels do pixmap, sem codificar PNG.
+
+    Usa pix.samples (uma cópia simples dos bytes) em vez de pix.samples_mv:
+    a memoryview seria liberada junto com o pixmap enquanto a imagem ainda
+    a referencia.
+    """
+    from PIL import Image
+    
+    modo = "L" if pix.n == 1 else "RGB"
+    img = Image.frombuffer(modo, (pix.width, pix.height), pix.samples, "raw", modo, pix.stride, 1)
+    img.format = FORMATO_TEMPORARIO
+    return img
+
+
+def ocr_pagina(page, dpi: int = DPI_PADRAO, idioma: str = IDIOMA_PADRAO, cinza: bool = False,
+               config: str = "") -> str:
+    """Renderiza uma página e executa o OCR"""
+    return ocr_pagina_medida(page, dpi, idioma, cinza, config)[0]
+
+
+def ocr_pagina_medida(page, dpi: int = DPI_PADRAO, idioma: str = IDIOMA_PADRAO, cinza: bool = False,
+                      config: str = "") -> Tuple[str, Dict]:
+    """
+    ocr_pagina que também devolve os tempos de renderização e de Tesseract
+    (parede e CPU) e o tamanho da imagem. A CPU do Tesseract pela linha de
+    comando (processo filho) só é contada no Unix; no Windows, só a do tesserocr.
+    """
+    inicio, cpu_inicio = time.perf_counter(), tempo_cpu()
+    pix = renderizar_pagina(page, dpi, cinza)
+    renderizado, cpu_renderizado = time.perf_counter(), tempo_cpu()
+    texto, _ = tesseract_pixmap(pix, idioma, config)
+    medida = {
+        'dpi': dpi,
+        'renderizar_s': round(renderizado - inicio, 6),
+        'ocr_s': round(time.perf_counter() - renderizado, 6),
+        'renderizar_cpu_s': round(cpu_renderizado - cpu_inicio, 6),
+        'ocr_cpu_s': round(tempo_cpu() - cpu_renderizado, 6),
+        'bytes_imagem': pix.stride * pix.height,
+    }
+    return texto, medida
+
+
+def tesseract_pixmap(pix, idioma: str = IDIOMA_PADRAO, config: str = "",
+                     confiancas: bool = False) -> Tuple[str, List[float]]:
+    """
+    Texto do pixmap (o mesmo de image_to_string) e, com confiancas=True, a
+    confiança de cada palavra.
+
+    Usa o Tesseract persistente deste processo quando disponível; senão, um
+    processo do Tesseract por chamada (pytesseract, imagem em arquivo
+    temporário), com saída txt e tsv na mesma execução quando há confianças.
+    """
+    from pytesseract import pytesseract as tesseract
+    from tesseract_persistente import reconhecer
+    
+    resultado = reconhecer(pix, idioma, config, tesseract.tesseract_cmd)
+    if resultado is not None:
+        return resultado
+    
+    img = imagem_do_pixmap(pix)
+    if not confiancas:
+        return tesseract.image_to_string(img, lang=idioma, config=config), []
+    
+    with tesseract.save(img) as (base, entrada):
+        tesseract.run_tesseract(entrada, base, 'txt', idioma, f'-c tessedit_create_tsv=1 {config}'.strip())
+        with open(f'{base}.txt', 'rb') as f:
+            texto = f.read().decode('utf-8')
+        with open(f'{base}.tsv', 'rb') as f:
+            dados = tesseract.file_to_dict(f.read().decode('utf-8'), '\t', -1)
+    
+    return texto, [float(conf) for conf, palavra in zip(dados.get('conf', []), dados.get('text', []))
+                   if float(conf) >= 0 and str(palavra).strip()]
+
+
+def tesseract_texto_e_confianca(pix, idioma: str = IDIOMA_PADRAO, config: str = "") -> Tuple[str, Optional[float], int]:
+    """
+    Texto do pixmap, confiança média das palavras reconhecidas (None se não
+    houver nenhuma) e número de palavras.
+    """
+    texto, confiancas = tesseract_pixmap(pix, idioma, config, confiancas=True)
+    media = sum(confiancas) / len(confiancas) if confiancas else None
+    return texto, media, len(confiancas)
+
+
+def ocr_pagina_adaptativa(page, dpi_inicial: int = DPI_INICIAL_ADAPTATIVO, dpi_final: int = DPI_PADRAO,
+                          confianca_minima: float = CONFIANCA_MINIMA, idioma: str = IDIOMA_PADRAO,
+                          cinza: bool = False, config: str = "") -> Tuple[str, Dict]:
+    """
+    OCR em dpi_inicial; se a confiança média ficar abaixo de confianca_minima
+    (ou nenhuma palavra for reconhecida), renderiza de novo em dpi_final.
+
+    A medida traz o DPI usado, a confiança final, os tempos (parede e CPU,
+    somando as passadas, como em ocr_pagina_medida) e, quando a página foi
+    refeita, a confiança da primeira passada.
+    """
+    medida = {'renderizar_s': 0.0, 'ocr_s': 0.0, 'renderizar_cpu_s': 0.0, 'ocr_cpu_s': 0.0,
+              'reprocessada': False}
+    for dpi in (dpi_inicial, dpi_final):
+        inicio, cpu_inicio = time.perf_counter(), tempo_cpu()
+        pix = renderizar_pagina(page, dpi, cinza)
+        renderizado, cpu_renderizado = time.perf_counter(), tempo_cpu()
+        texto, confianca, palavras = tesseract_texto_e_confianca(pix, idioma, config)
+        medida['renderizar_s'] = round(medida['renderizar_s'] + renderizado - inicio, 6)
+        medida['ocr_s'] = round(medida['ocr_s'] + time.perf_counter() - renderizado, 6)
+        medida['renderizar_cpu_s'] = round(medida['renderizar_cpu_s'] + cpu_renderizado - cpu_inicio, 6)
+        medida['ocr_cpu_s'] = round(medida['ocr_cpu_s'] + tempo_cpu() - cpu_renderizado, 6)
+        medida.update(dpi=dpi, confianca=None if confianca is None else round(confianca, 2),
+                      palavras=palavras, bytes_imagem=pix.stride * pix.height)
+        if dpi == dpi_final or (confianca is not None and confianca >= confianca_minima):
+            break
+        medida.update(reprocessada=True, dpi_inicial=dpi, confianca_inicial=medida['confianca'])
+    return texto, medida
+
+
+def _ocr_pagina(page, dpi: int, idioma: str, cinza: bool, config: str,
+                dpi_inicial: Optional[int], confianca_minima: float) -> Tuple[str, Dict]:
+    """OCR adaptativo quando dpi_inicial é menor que o DPI final; senão, DPI fixo"""
+    if dpi_inicial and dpi_inicial < dpi:
+        return ocr_pagina_adaptativa(page, dpi_inicial, dpi, confianca_minima, idioma, cinza, config)
+    return ocr_pagina_medida(page, dpi, idioma, cinza, config)
+
+
+def dividir_paginas(total_paginas: int, partes: int) -> List[Tuple[int, int]]:
+    """Divide as páginas em intervalos contíguos [inicio, fim)"""
+    partes = max(1, min(partes, total_paginas))
+    tamanho, resto = divmod(total_paginas, partes)
+    intervalos = []
+    inicio = 0
+    for k in range(partes):
+        fim = inicio + tamanho + (1 if k < resto else 0)
+        intervalos.append((inicio, fim))
+        inicio = fim
+    return intervalos
+
+
+def _ocr_lote(pdf_path: str, paginas: List[int], dpi: int, idioma: str, cinza: bool, config: str,
+              tesseract_cmd: Optional[str], dpi_inicial: Optional[int] = None,
+              confianca_minima: float = CONFIANCA_MINIMA) -> List[Tuple[int, str, Dict]]:
+    """Executado no processo filho: abre o PDF e faz OCR das páginas do lote"""
+    import fitz  # PyMuPDF
+    import pytesseract
+    
+    if tesseract_cmd:
+        pytesseract.pytesseract.tesseract_cmd = tesseract_cmd
+
+    doc = fitz.open(pdf_path)
+    try:
+        return [(n, *_ocr_pagina(doc[n], dpi, idioma, cinza, config, dpi_inicial, confianca_minima))
+                for n in paginas]
+    finally:
+        doc.close()
+
+
+def ocr_paginas(pdf_path: str, paginas: List[int], workers: int = 1, dpi: int = DPI_PADRAO,
+                idioma: str = IDIOMA_PADRAO, cinza: bool = False, config: str = "",
+                ao_concluir: Optional[Callable[[int, str], None]] = None,
+                cache=None, medidas: Optional[Dict[int, Dict]] = None,
+                dpi_inicial: Optional[int] = None, confianca_minima: float = CONFIANCA_MINIMA) -> Dict[int, str]:
+    """
+    Executa OCR nas páginas indicadas (índices a partir de 0).
+
+    Com workers > 1 as páginas são divididas em lotes contíguos e cada processo
+    abre o PDF por conta própria; o resultado é idêntico ao caminho serial.
+    Com um cache (cache_ocr.CacheOCR), páginas já reconhecidas são lidas dele
+    e cada página nova é gravada assim que termina.
+    ao_concluir(indice_pagina, texto) é chamado no processo principal.
+    Com um dicionário em medidas, cada página recebe seus tempos de
+    renderização e de Tesseract (ou 'cache': True).
+    Com dpi_inicial menor que dpi o OCR é adaptativo (ocr_pagina_adaptativa).
+    """
+    import fitz  # PyMuPDF
+    import pytesseract
+    
+    textos: Dict[int, str] = {}
+    chaves: Dict[int, str] = {}
+    # O texto do modo adaptativo depende do DPI inicial e do limiar: entram na chave do cache
+    adaptativo = bool(dpi_inicial and dpi_inicial < dpi)
+    modo_chave = f"adaptativo:{dpi_inicial}@{confianca_minima:g}" if adaptativo else ""
+
+    def _registrar(n, texto, medida):
+        textos[n] = texto
+        if medidas is not None:
+            medidas[n] = medida
+        if cache is not None and n in chaves:
+            cache.guardar(chaves[n], texto)
+        if ao_concluir:
+            ao_concluir(n, texto)
+
+    if cache is not None:
+        pendentes = []
+        with fitz.open(pdf_path) as doc:
+            for n in paginas:
+                chaves[n] = cache.chave_pagina(doc[n], dpi, idioma, config, cinza, modo_chave)
+                texto = cache.obter(chaves[n])
+                if texto is None:
+                    pendentes.append(n)
+                else:
+                    textos[n] = texto
+                    if medidas is not None:
+                        medidas[n] = {'cache': True}
+                    if ao_concluir:
+                        ao_concluir(n, texto)
+        paginas = pendentes
+
+    if workers <= 1 or len(paginas) <= 1:
+        if paginas:
+            with fitz.open(pdf_path) as doc:
+                for n in paginas:
+                    _registrar(n, *_ocr_pagina(doc[n], dpi, idioma, cinza, config, dpi_inicial, confianca_minima))
+        return textos
+
+    # Mais lotes que processos para equilibrar páginas lentas
+    lotes = [paginas[inicio:fim] for inicio, fim in dividir_paginas(len(paginas), workers * 4)]
+    tesseract_cmd = pytesseract.pytesseract.tesseract_cmd
+
+    with ProcessPoolExecutor(max_workers=min(workers, len(lotes))) as executor:
+        futuros = [
+            executor.submit(_ocr_lote, pdf_path, lote, dpi, idioma, cinza, config, tesseract_cmd,
+                            dpi_inicial, confianca_minima)
+            for lote in lotes
+        ]
+        for futuro in as_completed(futuros):
+            for n, texto, medida in futuro.result():
+                _registrar(n, texto, medida)
+
+    return textos
+
+
+def extrair_paginas_ocr(pdf_path: str, workers: int = 1, dpi: int = DPI_PADRAO,
+                        idioma: str = IDIOMA_PADRAO, cinza: bool = False, config: str = "",
+                        ao_concluir: Optional[Callable[[int, int, str], None]] = None,
+                        cache=None, medidas: Optional[Dict[int, Dict]] = None,
+                        dpi_inicial: Optional[int] = None, confianca_minima: float = CONFIANCA_MINIMA) -> List[str]:
+    """
+    Executa OCR em todas as páginas e devolve os textos na ordem das páginas.
+
+    Com cinza=True a página é renderizada com um único canal (1/3 dos bytes).
+    ao_concluir(numero_pagina, total_paginas, texto) é chamado a cada página.
+    Com dpi_inicial o OCR é adaptativo (ver ocr_pagina_adaptativa).
+    """
+    import fitz  # PyMuPDF
+    
+    with fitz.open(pdf_path) as doc:
+        total_paginas = len(doc)
+
+    def _notificar(n, texto):
+        if ao_concluir:
+            ao_concluir(n + 1, total_paginas, texto)
+
+    textos = ocr_paginas(pdf_path, list(range(total_paginas)), workers, dpi, idioma, cinza, config,
+                         _notificar, cache, medidas, dpi_inicial, confianca_minima)
+    return [textos[n] for n in range(total_paginas)]
+
+
+def avaliar_camada_texto(page, min_caracteres: int = MIN_CARACTERES,
+                         max_lixo: float = MAX_LIXO) -> Dict:
+    """
+    Avalia a camada de texto nativa da página.
+
+    Critérios: quantidade de caracteres, proporção de caracteres estranhos
+    (lixo de OCR embutido, símbolos de substituição, controle) e presença
+    de fontes. Devolve o texto e as métricas, com 'aprovada' indicando se
+    a página pode dispensar o OCR.
+    """
+    texto = page.get_text()
+    visiveis = [c for c in texto if not c.isspace()]
+    caracteres = len(visiveis)
+    lixo = sum(1 for c in visiveis if not (c.isalnum() or c in PONTUACAO_VALIDA))
+    proporcao_lixo = lixo / caracteres if caracteres else 1.0
+    fontes = len(page.get_fonts())
+
+    return {
+        'texto': texto,
+        'caracteres': caracteres,
+        'lixo': round(proporcao_lixo, 4),
+        'fontes': fontes,
+        'aprovada': caracteres >= min_caracteres and proporcao_lixo <= max_lixo and fontes > 0,
+    }
+
+
+def extrair_paginas_hibrido(pdf_path: str, workers: int = 1, dpi: int = DPI_PADRAO,
+                            idioma: str = IDIOMA_PADRAO, cinza: bool = False, config: str = "",
+                            min_caracteres: int = MIN_CARACTERES, max_lixo: float = MAX_LIXO,
+                            ao_concluir: Optional[Callable[[int, int, str, str], None]] = None,
+                            cache=None, medidas: Optional[Dict[int, Dict]] = None,
+                            dpi_inicial: Optional[int] = None,
+                            confianca_minima: float = CONFIANCA_MINIMA) -> Tuple[List[str], List[str]]:
+    """
+    Usa a camada de texto das páginas aprovadas e faz OCR apenas nas demais.
+
+    Devolve (textos, rotas) na ordem das páginas; cada rota é ROTA_TEXTO ou
+    ROTA_OCR. ao_concluir(numero_pagina, total_paginas, texto, rota) é
+    chamado a cada página concluída. medidas recebe os tempos por página
+    (avaliação da camada de texto e, nas páginas com OCR, os de ocr_paginas).
+    Com dpi_inicial o OCR das demais páginas é adaptativo.
+    """
+    import fitz  # PyMuPDF
+    
+    textos: List[str] = []
+    rotas: List[str] = []
+
+    with fitz.open(pdf_path) as doc:
+        total_paginas = len(doc)
+        for n in range(total_paginas):
+            inicio = time.perf_counter()
+            avaliacao = avaliar_camada_texto(doc[n], min_caracteres, max_lixo)
+            if medidas is not None:
+                medidas[n] = {'avaliacao_s': round(time.perf_counter() - inicio, 6)}
+            if avaliacao['aprovada']:
+                textos.append(avaliacao['texto'])
+                rotas.append(ROTA_TEXTO)
+                if ao_concluir:
+                    ao_concluir(n + 1, total_paginas, avaliacao['texto'], ROTA_TEXTO)
+            else:
+                textos.append("")
+                rotas.append(ROTA_OCR)
+
+    pendentes = [n for n, rota in enumerate(rotas) if rota == ROTA_OCR]
+
+    def _notificar(n, texto):
+        if ao_concluir:
+            ao_concluir(n + 1, total_paginas, texto, ROTA_OCR)
+
+    medidas_ocr = {} if medidas is not None else None
+    for n, texto in ocr_paginas(pdf_path, pendentes, workers, dpi, idioma, cinza, config,
+                                _notificar, cache, medidas_ocr, dpi_inicial, confianca_minima).items():
+        textos[n] = texto
+        if medidas is not None:
+            medidas[n].update(medidas_ocr.get(n, {}))
+
+    return textos, rotas
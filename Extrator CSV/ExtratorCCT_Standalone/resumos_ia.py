@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Resumos de cláusulas com IA do Extrator de CCTs
+Descrição: Gera resumos em paralelo (pool de threads) com limite de concorrência,
+limitador de taxa por requisições/min e tokens/min e novas tentativas com
+espera exponencial e jitter em erros 429/5xx. Os resultados voltam na ordem
+das cláusulas. Com um cache de resumos, cláusulas já resumidas não chamam a API;
+com um índice de similaridade, cláusulas quase idênticas às da planilha mãe
+reaproveitam (ou apenas ajustam) o resumo do vizinho.
+"""
+
+import time
+import random
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, Dict, List, Optional, Tuple
+
+from similaridade_clausulas import numeros, trechos_alterados
+
+
+MODELO_PADRAO = "gpt-4.1-mini"
+MAX_TOKENS_RESUMO = 100
+CONCORRENCIA_PADRAO = 4
+RPM_PADRAO = 500
+TPM_PADRAO = 200000
+MAX_TENTATIVAS = 5
+
+# Aumente sempre que o prompt ou os parâmetros mudarem: invalida o cache de resumos
+VERSAO_PROMPT = 1
+LIMITE_CONTEUDO = 1500
+
+MENSAGEM_SISTEMA = "Você é especialista em direito trabalhista. Gere resumos concisos de cláusulas de CCTs."
+
+
+def montar_prompt(titulo: str, conteudo: str) -> str:
+    """Prompt de resumo de uma cláusula"""
+    return f"""Analise a seguinte cláusula de CCT e gere um resumo conciso em uma frase (máximo 200 caracteres).
+
+Título: {titulo}
+Conteúdo: {conteudo[:LIMITE_CONTEUDO]}
+
+Resumo:"""
+
+
+def montar_prompt_ajuste(titulo: str, resumo_anterior: str, trechos: str) -> str:
+    """Prompt curto para atualizar o resumo de uma cláusula quase idêntica"""
+    return f"""O resumo abaixo é de uma cláusula quase idêntica de outra convenção. Atualize-o com os valores, datas e percentuais dos trechos alterados, mantendo uma frase (máximo 200 caracteres).
+
+Título: {titulo}
+Resumo anterior: {resumo_anterior}
+Trechos alterados: {trechos}
+
+Resumo:"""
+
+
+def estimar_tokens(texto: str) -> int:
+    """Estimativa grosseira de tokens (~4 caracteres por token)"""
+    return len(texto) // 4 + 1
+
+
+class LimitadorTaxa:
+    """Token bucket duplo: requisições por minuto e tokens por minuto"""
+
+    def __init__(self, rpm: int = RPM_PADRAO, tpm: int = TPM_PADRAO):
+        self.rpm = max(1, rpm)
+        self.tpm = max(1, tpm)
+        self._requisicoes = float(self.rpm)
+        self._tokens = float(self.tpm)
+        self._ultimo = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _repor(self) -> None:
+        agora = time.monotonic()
+        decorrido = agora - self._ultimo
+        self._ultimo = agora
+        self._requisicoes = min(self.rpm, self._requisicoes + decorrido * self.rpm / 60)
+        self._tokens = min(self.tpm, self._tokens + decorrido * self.tpm / 60)
+
+    def adquirir(self, tokens: int) -> None:
+        """Bloqueia até haver uma requisição e os tokens estimados disponíveis"""
+        tokens = min(tokens, self.tpm)
+        while True:
+            with self._lock:
+                self._repor()
+                if self._requisicoes >= 1 and self._tokens >= tokens:
+                    self._requisicoes -= 1
+                    self._tokens -= tokens
+                    return
+                espera = max(
+                    (1 - self._requisicoes) * 60 / self.rpm,
+                    (tokens - self._tokens) * 60 / self.tpm,
+                )
+            time.sleep(max(espera, 0.01))
+
+    def ajustar(self, diferenca_tokens: int) -> None:
+        """Corrige o balde com o consumo real informado pela API"""
+        with self._lock:
+            self._tokens -= diferenca_tokens
+
+
+def _erro_transitorio(erro: Exception) -> bool:
+    """429, 5xx, timeout ou falha de conexão: vale tentar de novo"""
+    status = getattr(erro, 'status_code', None)
+    if status is not None:
+        return status == 429 or status >= 500
+    nome = type(erro).__name__
+    return nome in ('APIConnectionError', 'APITimeoutError', 'Timeout', 'ConnectionError')
+
+
+class SumarizadorIA:
+    """Gera resumos de cláusulas com a API da OpenAI"""
+
+    def __init__(self, client, modelo: str = MODELO_PADRAO, concorrencia: int = CONCORRENCIA_PADRAO,
+                 rpm: int = RPM_PADRAO, tpm: int = TPM_PADRAO, max_tentativas: int = MAX_TENTATIVAS,
+                 cache=None, similares=None, metricas=None):
+        self.client = client
+        self.metricas = metricas
+        self.cache = cache
+        self.similares = similares
+        self.modelo = modelo
+        self.concorrencia = max(1, concorrencia)
+        self.limitador = LimitadorTaxa(rpm, tpm)
+        self.max_tentativas = max(1, max_tentativas)
+
+    def resumir(self, titulo: str, conteudo: str) -> Optional[str]:
+        """Resumo de uma cláusula, ou None se a API falhar em todas as tentativas"""
+        chave = None
+        if self.cache is not None:
+            chave = self.cache.chave(titulo, conteudo[:LIMITE_CONTEUDO], self.modelo, VERSAO_PROMPT)
+            resumo = self.cache.obter(chave)
+            if resumo is not None:
+                return resumo
+
+        resumo = None
+        if self.similares is not None:
+            resumo = self._resumo_de_vizinho(titulo, conteudo)
+        if resumo is None:
+            resumo = self._completar(montar_prompt(titulo, conteudo))
+
+        if resumo and chave is not None:
+            self.cache.guardar(chave, resumo, self.modelo)
+        return resumo
+
+    def _resumo_de_vizinho(self, titulo: str, conteudo: str) -> Optional[str]:
+        """Reaproveita o resumo da cláusula parecida ou o ajusta aos trechos com números novos"""
+        vizinho = self.similares.consultar(conteudo)
+        if vizinho is None:
+            return None
+
+        if vizinho.mesmos_numeros:
+            self.similares.registrar_uso(ajustado=False)
+            return vizinho.resumo
+
+        trechos = trechos_alterados(conteudo, numeros(vizinho.registro['Cláusula Completa']))
+        resumo = self._completar(montar_prompt_ajuste(titulo, vizinho.resumo, trechos))
+        if resumo is not None:
+            self.similares.registrar_uso(ajustado=True)
+        return resumo
+
+    def _completar(self, prompt: str) -> Optional[str]:
+        """Uma chamada de resumo com limite de taxa e novas tentativas; None se falhar"""
+        estimativa = estimar_tokens(MENSAGEM_SISTEMA + prompt) + MAX_TOKENS_RESUMO
+
+        for tentativa in range(self.max_tentativas):
+            self.limitador.adquirir(estimativa)
+            inicio = time.perf_counter()
+            try:
+                response = self.client.chat.completions.create(
+                    model=self.modelo,
+                    messages=[
+                        {"role": "system", "content": MENSAGEM_SISTEMA},
+                        {"role": "user", "content": prompt}
+                    ],
+                    temperature=0.3,
+                    max_tokens=MAX_TOKENS_RESUMO
+                )
+                # Resposta sem choices/message (malformada) conta como falha da chamada
+                resumo = (response.choices[0].message.content or "").strip().strip('"\'')
+            except Exception as e:
+                self._medir(inicio, erro=True)
+                if not _erro_transitorio(e) or tentativa == self.max_tentativas - 1:
+                    return None
+                # Espera exponencial com jitter completo
+                time.sleep(random.uniform(0, min(30.0, 2 ** tentativa)))
+                continue
+
+            usage = getattr(response, 'usage', None)
+            tokens = getattr(usage, 'total_tokens', None) if usage is not None else None
+            if tokens:
+                self.limitador.ajustar(tokens - estimativa)
+            self._medir(inicio, tokens=tokens or 0)
+
+            if resumo and not resumo.endswith('.'):
+                resumo += '.'
+            return resumo or None
+
+        return None
+
+    def _medir(self, inicio: float, erro: bool = False, tokens: int = 0) -> None:
+        """Latência de uma chamada à API (com sucesso ou não) nas métricas"""
+        if self.metricas is None:
+            return
+        self.metricas.observar('api_latencia_segundos', time.perf_counter() - inicio)
+        self.metricas.contar('api_chamadas')
+        if erro:
+            self.metricas.contar('api_erros')
+        if tokens:
+            self.metricas.contar('api_tokens', tokens)
+
+    def resumir_lote(self, itens: List[Tuple[int, str, str]],
+                     ao_concluir: Optional[Callable[[int, Optional[str]], None]] = None) -> Dict[int, Optional[str]]:
+        """
+        Resume vários itens (indice, titulo, conteudo) em paralelo.
+
+        Devolve {indice: resumo ou None}. ao_concluir(indice, resumo) é chamado
+        na thread que invocou o método, à medida que cada resumo fica pronto.
+        """
+        resumos: Dict[int, Optional[str]] = {}
+        if not itens:
+            return resumos
+
+        with ThreadPoolExecutor(max_workers=min(self.concorrencia, len(itens))) as executor:
+            futuros = {
+                executor.submit(self.resumir, titulo, conteudo): indice
+                for indice, titulo, conteudo in itens
+            }
+            try:
+                for futuro in as_completed(futuros):
+                    indice = futuros[futuro]
+                    resumos[indice] = futuro.result()
+                    if ao_concluir:
+                        ao_concluir(indice, resumos[indice])
+            except BaseException:
+                # Erro no ao_concluir (ou interrupção): não chamar a API para os itens que faltam
+                executor.shutdown(wait=False, cancel_futures=True)
+                raise
+
+        return resumos
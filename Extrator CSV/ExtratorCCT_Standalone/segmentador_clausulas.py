@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Segmentador de cláusulas do Extrator de CCTs
+Descrição: Divide o texto em cláusulas em uma única passada: uma expressão
+pré-compilada localiza os cabeçalhos "CLÁUSULA ..." e o corpo de cada cláusula
+é o trecho entre um cabeçalho e o seguinte
+"""
+
+import re
+from typing import Iterator, Tuple
+
+
+# Linha cujo conteúdo (sem espaços nas pontas) começa com "CLÁUSULA"/"CLAUSULA",
+# seguido de espaço e mais texto na mesma linha
+PADRAO_CABECALHO = re.compile(r'^[^\S\n]*(CL[ÁA]USULA[^\S\n]+\S[^\n]*)', re.IGNORECASE | re.MULTILINE)
+
+
+def segmentar(texto: str) -> Iterator[Tuple[str, str, int, int]]:
+    """
+    Gera (titulo, corpo, linha_inicio, linha_fim) para cada cláusula.
+
+    titulo é a linha do cabeçalho sem espaços nas pontas; corpo são as linhas
+    seguintes até o próximo cabeçalho (ou o fim do texto), sem espaços nas
+    pontas. linha_inicio é o índice da linha do cabeçalho e linha_fim o índice
+    da linha seguinte à última do corpo.
+    """
+    anterior = None
+    linha_atual = 0
+    posicao_linha = 0
+
+    for match in PADRAO_CABECALHO.finditer(texto):
+        linha_atual += texto.count('\n', posicao_linha, match.start())
+        posicao_linha = match.start()
+
+        if anterior is not None:
+            titulo, inicio_corpo, linha_inicio = anterior
+            yield titulo, texto[inicio_corpo:match.start()].strip(), linha_inicio, linha_atual
+
+        fim_titulo = match.end(1)
+        anterior = (match.group(1).strip(), fim_titulo + 1, linha_atual)
+
+    if anterior is not None:
+        titulo, inicio_corpo, linha_inicio = anterior
+        total_linhas = linha_atual + texto.count('\n', posicao_linha) + 1
+        yield titulo, texto[inicio_corpo:].strip(), linha_inicio, total_linhas
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Detecção de cláusulas quase idênticas do Extrator de CCTs
+Descrição: Índice MinHash/LSH sobre as cláusulas já presentes na planilha mãe.
+Cláusulas novas acima do limiar de similaridade reaproveitam o resumo do
+vizinho mais próximo (ou o ajustam com uma chamada curta à IA quando valores,
+datas ou percentuais mudaram), em vez de pagar um resumo completo.
+"""
+
+import re
+import csv
+import random
+import hashlib
+import threading
+from collections import defaultdict
+from typing import Dict, FrozenSet, List, Optional, Set
+
+from cache_resumos import normalizar_texto
+
+
+NUM_PERMUTACOES = 64
+BANDAS = 16
+TAMANHO_SHINGLE = 3
+LIMIAR_PADRAO = 0.8
+
+_PRIMO = (1 << 61) - 1
+_PADRAO_PALAVRA = re.compile(r'\w+')
+_PADRAO_NUMERO = re.compile(r'\d+(?:[.,]\d+)*')
+_PADRAO_FRASE = re.compile(r'(?<=[.;:])\s+')
+
+
+def shingles(texto: str, tamanho: int = TAMANHO_SHINGLE) -> Set[str]:
+    """Conjunto de n-gramas de palavras do texto normalizado"""
+    palavras = _PADRAO_PALAVRA.findall(normalizar_texto(texto))
+    if len(palavras) < tamanho:
+        return {' '.join(palavras)} if palavras else set()
+    return {' '.join(palavras[i:i + tamanho]) for i in range(len(palavras) - tamanho + 1)}
+
+
+def numeros(texto: str) -> FrozenSet[str]:
+    """Valores numéricos (datas, percentuais, quantias) citados no texto"""
+    return frozenset(_PADRAO_NUMERO.findall(texto))
+
+
+def trechos_alterados(conteudo: str, numeros_vizinho: FrozenSet[str], limite: int = 600) -> str:
+    """Frases da cláusula nova com números que não aparecem no vizinho"""
+    trechos = []
+    for frase in _PADRAO_FRASE.split(conteudo):
+        if numeros(frase) - numeros_vizinho:
+            trechos.append(' '.join(frase.split()))
+    return ' '.join(trechos)[:limite]
+
+
+def jaccard(a: Set[str], b: Set[str]) -> float:
+    if not a and not b:
+        return 1.0
+    return len(a & b) / len(a | b)
+
+
+class Vizinho:
+    """Cláusula da planilha mãe mais parecida com uma cláusula nova"""
+
+    def __init__(self, registro: Dict[str, str], similaridade: float, mesmos_numeros: bool):
+        self.registro = registro
+        self.similaridade = similaridade
+        self.mesmos_numeros = mesmos_numeros
+
+    @property
+    def resumo(self) -> str:
+        return self.registro['Resumo']
+
+
+class IndiceSimilaridade:
+    """Índice MinHash com LSH por bandas"""
+
+    def __init__(self, limiar: float = LIMIAR_PADRAO, num_permutacoes: int = NUM_PERMUTACOES,
+                 bandas: int = BANDAS, semente: int = 1):
+        if num_permutacoes % bandas:
+            raise ValueError("num_permutacoes deve ser múltiplo de bandas")
+        self.limiar = limiar
+        self.bandas = bandas
+        self.linhas_por_banda = num_permutacoes // bandas
+
+        gerador = random.Random(semente)
+        self._permutacoes = [
+            (gerador.randrange(1, _PRIMO), gerador.randrange(0, _PRIMO))
+            for _ in range(num_permutacoes)
+        ]
+        self._baldes: List[Dict[tuple, List[int]]] = [defaultdict(list) for _ in range(bandas)]
+        self._registros: List[Dict[str, str]] = []
+        self._shingles: List[Set[str]] = []
+        self._numeros: List[FrozenSet[str]] = []
+
+        self._lock = threading.Lock()
+        self.consultas = 0
+        self.reaproveitados = 0
+        self.ajustados = 0
+
+    def __len__(self) -> int:
+        return len(self._registros)
+
+    def assinatura(self, conjunto: Set[str]) -> List[int]:
+        """Assinatura MinHash do conjunto de shingles"""
+        valores = [int.from_bytes(hashlib.blake2b(s.encode('utf-8'), digest_size=8).digest(), 'big')
+                   for s in conjunto]
+        if not valores:
+            return [0] * len(self._permutacoes)
+        return [min((a * v + b) % _PRIMO for v in valores) for a, b in self._permutacoes]
+
+    def _chaves_bandas(self, assinatura: List[int]):
+        r = self.linhas_por_banda
+        for banda in range(self.bandas):
+            yield banda, tuple(assinatura[banda * r:(banda + 1) * r])
+
+    def adicionar(self, registro: Dict[str, str]) -> None:
+        """Indexa uma cláusula (precisa de 'Cláusula Completa' e 'Resumo')"""
+        conjunto = shingles(registro['Cláusula Completa'])
+        if not conjunto or not registro.get('Resumo'):
+            return
+
+        posicao = len(self._registros)
+        self._registros.append(registro)
+        self._shingles.append(conjunto)
+        self._numeros.append(numeros(registro['Cláusula Completa']))
+        for banda, chave in self._chaves_bandas(self.assinatura(conjunto)):
+            self._baldes[banda][chave].append(posicao)
+
+    def consultar(self, conteudo: str) -> Optional[Vizinho]:
+        """Vizinho mais parecido com similaridade (Jaccard) >= limiar, ou None"""
+        with self._lock:
+            self.consultas += 1
+
+        conjunto = shingles(conteudo)
+        if not conjunto:
+            return None
+
+        candidatos = set()
+        for banda, chave in self._chaves_bandas(self.assinatura(conjunto)):
+            candidatos.update(self._baldes[banda].get(chave, ()))
+
+        melhor, melhor_similaridade = None, self.limiar
+        for posicao in candidatos:
+            similaridade = jaccard(conjunto, self._shingles[posicao])
+            if similaridade >= melhor_similaridade:
+                melhor, melhor_similaridade = posicao, similaridade
+
+        if melhor is None:
+            return None
+        return Vizinho(self._registros[melhor], melhor_similaridade,
+                       numeros(conteudo) == self._numeros[melhor])
+
+    def registrar_uso(self, ajustado: bool) -> None:
+        """Contabiliza um resumo reaproveitado ou ajustado a partir de um vizinho"""
+        with self._lock:
+            if ajustado:
+                self.ajustados += 1
+            else:
+                self.reaproveitados += 1
+
+    @classmethod
+    def carregar_csv(cls, caminho: str, limiar: float = LIMIAR_PADRAO) -> 'IndiceSimilaridade':
+        """Indexa as cláusulas de uma planilha no formato do extrator"""
+        indice = cls(limiar=limiar)
+        with open(caminho, 'r', encoding='utf-8', newline='') as f:
+            for registro in csv.DictReader(f):
+                if registro.get('Cláusula Completa'):
+                    indice.adicionar(registro)
+        return indice
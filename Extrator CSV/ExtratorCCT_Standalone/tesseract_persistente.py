@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tesseract persistente do Extrator de CCTs
+Descrição: Mantém uma instância da API do Tesseract (tesserocr) por thread,
+com o modelo do idioma carregado uma única vez, e entrega os pixels do pixmap
+direto da memória: sem um processo novo e sem arquivo temporário por página.
+O texto é o mesmo da linha de comando (inclusive o separador de página no
+fim). Sem o tesserocr instalado, ou com opções de config que a API não
+reproduz, reconhecer() devolve None e o motor_ocr usa o pytesseract.
+"""
+
+import os
+import shlex
+import shutil
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+try:
+    import tesserocr
+except ImportError:
+    tesserocr = None
+
+# Padrões da linha de comando: PSM_AUTO (3) e OEM_DEFAULT (3)
+PSM_PADRAO = 3
+OEM_PADRAO = 3
+
+# Acrescentado pela linha de comando ao fim do texto de cada página (variável page_separator)
+SEPARADOR_PAGINA_PADRAO = '\f'
+
+_local = threading.local()
+
+
+def opcoes_config(config: str = "") -> Optional[Tuple[int, int, Dict[str, str]]]:
+    """
+    (psm, oem, variáveis) a partir das opções de linha de comando em config.
+
+    Entende --psm, --oem, --dpi e -c nome=valor; qualquer outra opção devolve
+    None (a página vai para a linha de comando, que a interpreta).
+    """
+    psm, oem, variaveis = PSM_PADRAO, OEM_PADRAO, {}
+    partes = shlex.split(config or "", posix=os.name != 'nt')
+    try:
+        i = 0
+        while i < len(partes):
+            opcao, valor = partes[i], partes[i + 1]
+            if opcao == '--psm':
+                psm = int(valor)
+            elif opcao == '--oem':
+                oem = int(valor)
+            elif opcao == '--dpi':
+                variaveis['user_defined_dpi'] = str(int(valor))
+            elif opcao == '-c':
+                nome, valor = valor.split('=', 1)
+                variaveis[nome] = valor
+            else:
+                return None
+            i += 2
+    except (IndexError, ValueError):
+        return None
+    return psm, oem, variaveis
+
+
+def disponivel(config: str = "") -> bool:
+    """Indica se o tesserocr está instalado e reproduz as opções de config"""
+    return tesserocr is not None and opcoes_config(config) is not None
+
+
+def pasta_tessdata(tesseract_cmd: Optional[str]) -> Optional[str]:
+    """
+    Pasta tessdata ao lado do executável do Tesseract (instalação do Windows),
+    para usar os mesmos modelos da linha de comando. None deixa a biblioteca
+    decidir (TESSDATA_PREFIX ou a pasta padrão dela).
+    """
+    if not tesseract_cmd or os.environ.get('TESSDATA_PREFIX'):
+        return None
+    executavel = shutil.which(tesseract_cmd) or tesseract_cmd
+    pasta = Path(executavel).resolve().parent / 'tessdata'
+    return str(pasta) if pasta.is_dir() else None
+
+
+def _api(idioma: str, config: str, tesseract_cmd: Optional[str]):
+    """API desta thread para idioma/config (criada na primeira página); None se o modelo não carregar"""
+    apis = getattr(_local, 'apis', None)
+    if apis is None:
+        apis = _local.apis = {}
+
+    chave = (idioma, config, tesseract_cmd)
+    if chave not in apis:
+        psm, oem, variaveis = opcoes_config(config)
+        argumentos = {'lang': idioma, 'psm': psm, 'oem': oem, 'variables': variaveis}
+        caminho = pasta_tessdata(tesseract_cmd)
+        if caminho:
+            argumentos['path'] = caminho
+        try:
+            apis[chave] = tesserocr.PyTessBaseAPI(**argumentos)
+        except RuntimeError as e:
+            print(f"⚠ Tesseract persistente indisponível ({e}); usando a linha de comando")
+            apis[chave] = None
+    return apis[chave]
+
+
+def reconhecer(pix, idioma: str, config: str = "",
+               tesseract_cmd: Optional[str] = None) -> Optional[Tuple[str, List[int]]]:
+    """
+    OCR de um pixmap do PyMuPDF (RGB ou cinza, sem alfa).
+
+    Devolve o texto, igual ao de pytesseract.image_to_string, e a confiança
+    (0-100) de cada palavra; None se a API não puder ser usada.
+    """
+    if not disponivel(config):
+        return None
+    api = _api(idioma, config, tesseract_cmd)
+    if api is None:
+        return None
+
+    amostras = pix.samples  # Referência mantida até o fim do reconhecimento (a API não copia)
+    try:
+        api.SetImageBytes(amostras, pix.width, pix.height, pix.n, pix.stride)
+        texto = api.GetUTF8Text()
+        confiancas = api.AllWordConfidences()
+        separador = api.GetVariableAsString('page_separator')
+    finally:
+        api.Clear()
+    return texto + (SEPARADOR_PAGINA_PADRAO if separador is None else separador), confiancas
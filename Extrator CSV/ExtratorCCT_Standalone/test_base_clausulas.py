@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Testes da integração com a planilha mãe (base_clausulas)
+Uso: python -m pytest test_base_clausulas.py
+"""
+
+import csv
+
+from base_clausulas import BaseClausulas, COLUNAS, REMOVIDA, caminho_base
+
+
+def _linha(titulo, resumo='Resumo', sindicato='SIND', convencao='2025-2026'):
+    return dict(zip(COLUNAS, (sindicato, convencao, titulo, resumo, f'Texto de {titulo}')))
+
+
+def _gravar(caminho, linhas):
+    with open(caminho, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=COLUNAS, quoting=csv.QUOTE_ALL)
+        writer.writeheader()
+        writer.writerows(linhas)
+
+
+def _ler(caminho):
+    with open(caminho, 'r', newline='', encoding='utf-8') as f:
+        return list(csv.DictReader(f))
+
+
+def _integrar(csv_extraido, csv_mae):
+    """Mesmos passos de mesclar_na_planilha_mae"""
+    with BaseClausulas(caminho_base(csv_mae)) as base:
+        base.sincronizar_csv(csv_mae)
+        resultado = base.upsert(_ler(csv_extraido), origem='extraido.csv')
+        base.exportar_csv(csv_mae, resultado)
+        return resultado
+
+
+def _titulos(caminho):
+    return [linha['Título da Cláusula'] for linha in _ler(caminho)]
+
+
+def test_linha_apagada_da_planilha_nao_volta(tmp_path):
+    mae, extraido = tmp_path / 'mae.csv', tmp_path / 'extraido.csv'
+    _gravar(mae, [_linha('CLÁUSULA 1'), _linha('CLÁUSULA 2')])
+    _gravar(extraido, [_linha('CLÁUSULA 3')])
+    _integrar(extraido, mae)
+    assert _titulos(mae) == ['CLÁUSULA 1', 'CLÁUSULA 2', 'CLÁUSULA 3']
+
+    # Apaga a cláusula 2 à mão e integra uma atualização (a planilha é regravada pela base)
+    _gravar(mae, [_linha('CLÁUSULA 1'), _linha('CLÁUSULA 3')])
+    _gravar(extraido, [_linha('CLÁUSULA 1', resumo='Resumo novo')])
+    resultado = _integrar(extraido, mae)
+
+    assert resultado.atualizadas == 1
+    assert _titulos(mae) == ['CLÁUSULA 1', 'CLÁUSULA 3']
+    with BaseClausulas(caminho_base(mae)) as base:
+        assert len(base) == 2
+        removidas = [h for h in base.historico() if h['operacao'] == REMOVIDA]
+    assert [(h['titulo'], h['sindicato']) for h in removidas] == [('CLÁUSULA 2', 'SIND')]
+
+
+def test_titulo_renomeado_nao_duplica(tmp_path):
+    mae, extraido = tmp_path / 'mae.csv', tmp_path / 'extraido.csv'
+    _gravar(mae, [_linha('CLÁUSULA 1'), _linha('CLÁUSULA 2')])
+    _gravar(extraido, [_linha('CLÁUSULA 1', resumo='Outro resumo')])
+    _integrar(extraido, mae)
+
+    _gravar(mae, [_linha('CLÁUSULA 1', resumo='Outro resumo'), _linha('CLÁUSULA 2 - REAJUSTE')])
+    _gravar(extraido, [_linha('CLÁUSULA 1', resumo='Terceiro resumo')])
+    _integrar(extraido, mae)
+
+    assert _titulos(mae) == ['CLÁUSULA 1', 'CLÁUSULA 2 - REAJUSTE']
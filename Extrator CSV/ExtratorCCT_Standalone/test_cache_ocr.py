@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Testes da chave de página do cache de OCR (cache_ocr)
+Uso: python -m pytest test_cache_ocr.py
+"""
+
+import pytest
+
+from cache_ocr import hash_conteudo_pagina
+
+fitz = pytest.importorskip('fitz')
+
+
+def _paginas_com_formulario(textos):
+    """PDF em que cada página só desenha (show_pdf_page) a página de origem com o texto"""
+    origem = fitz.open()
+    for texto in textos:
+        origem.new_page().insert_text((72, 72), texto, fontsize=14)
+
+    doc = fitz.open()
+    for n in range(len(textos)):
+        pagina = doc.new_page()
+        pagina.show_pdf_page(pagina.rect, origem, n)
+    return doc
+
+
+def test_formularios_diferentes_com_mesmo_nome_nao_colidem():
+    doc = _paginas_com_formulario(["CLAUSULA PRIMEIRA - REAJUSTE SALARIAL",
+                                   "CLAUSULA SEGUNDA - PISO SALARIAL"])
+
+    # Mesmo fluxo de conteúdo ("/fzFrm0 Do"): só os formulários diferem
+    assert doc[0].read_contents() == doc[1].read_contents()
+    assert hash_conteudo_pagina(doc[0]) != hash_conteudo_pagina(doc[1])
+
+
+def test_mesma_pagina_em_outro_pdf_tem_o_mesmo_hash():
+    texto = "CLAUSULA PRIMEIRA - REAJUSTE SALARIAL"
+    um, outro = _paginas_com_formulario([texto]), _paginas_com_formulario(["CAPA", texto])
+
+    assert hash_conteudo_pagina(um[0]) == hash_conteudo_pagina(outro[1])
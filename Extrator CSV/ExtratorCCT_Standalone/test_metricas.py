@@ -0,0 +1,23 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Testes das métricas de execução (metricas)
+Uso: python -m pytest test_metricas.py
+"""
+
+from metricas import Histograma
+
+
+def _histograma(valores):
+    histograma = Histograma()
+    for valor in valores:
+        histograma.observar(valor)
+    return histograma
+
+
+def test_percentil_nearest_rank():
+    assert _histograma([1, 2]).percentil(50) == 1
+    assert _histograma(range(1, 21)).percentil(95) == 19
+    assert _histograma(range(1, 21)).percentil(100) == 20
+    assert _histograma([3]).percentil(0) == 3
+    assert Histograma().percentil(50) is None
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Trabalhos de extração retomáveis do Extrator de CCTs
+Descrição: Mantém um diretório por PDF (identificado pelo hash do arquivo) com
+checkpoints de cada etapa: textos das páginas, sindicato/convenção, cláusulas
+segmentadas e resumos já gerados. Um trabalho interrompido continua da última
+unidade concluída, desde que a configuração de extração (modo, DPI, OCR em
+cinza, OCR adaptativo) seja a mesma; com outra configuração ele recomeça.
+"""
+
+import os
+import json
+import shutil
+import hashlib
+from pathlib import Path
+from typing import Dict, List, Optional
+
+# Origem de cada resumo salvo: só os da IA são retomados quando a IA está ativa
+ORIGEM_IA = 'ia'
+ORIGEM_SIMPLES = 'simples'
+
+
+def hash_arquivo(caminho: str) -> str:
+    """SHA-256 do conteúdo do arquivo"""
+    h = hashlib.sha256()
+    with open(caminho, 'rb') as f:
+        for bloco in iter(lambda: f.read(1024 * 1024), b''):
+            h.update(bloco)
+    return h.hexdigest()
+
+
+def _gravar_json_atomico(caminho: Path, dados) -> None:
+    """Grava JSON em arquivo temporário e renomeia (nunca deixa arquivo pela metade)"""
+    temporario = caminho.with_suffix(caminho.suffix + '.tmp')
+    with open(temporario, 'w', encoding='utf-8') as f:
+        json.dump(dados, f, ensure_ascii=False)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temporario, caminho)
+
+
+def _ler_json(caminho: Path):
+    """Lê JSON ou devolve None se o arquivo não existir ou estiver corrompido"""
+    if not caminho.exists():
+        return None
+    try:
+        with open(caminho, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+class TrabalhoExtracao:
+    """Diretório de checkpoints de uma extração"""
+
+    ARQ_ESTADO = 'estado.json'
+    ARQ_PAGINAS = 'paginas.json'
+    ARQ_CLAUSULAS = 'clausulas.json'
+    ARQ_RESUMOS = 'resumos.jsonl'
+
+    def __init__(self, diretorio: Path, pdf_path: str, hash_pdf: str, configuracao: Optional[Dict] = None):
+        self.diretorio = Path(diretorio)
+        self.diretorio.mkdir(parents=True, exist_ok=True)
+        self.pdf_path = pdf_path
+        self.hash_pdf = hash_pdf
+        self.configuracao = configuracao or {}
+        self.estado = _ler_json(self.diretorio / self.ARQ_ESTADO) or {}
+
+        # Checkpoints gravados com outra configuração não valem para esta: recomeça do zero
+        self.descartado = bool(self.estado) and self.estado.get('configuracao', {}) != self.configuracao
+        if self.descartado:
+            shutil.rmtree(self.diretorio, ignore_errors=True)
+            self.diretorio.mkdir(parents=True, exist_ok=True)
+            self.estado = {}
+        self.retomado = bool(self.estado)
+
+        if not self.retomado:
+            self.estado = {'pdf': str(pdf_path), 'hash_pdf': hash_pdf, 'configuracao': self.configuracao}
+            self._salvar_estado()
+
+    @classmethod
+    def abrir(cls, raiz: Path, pdf_path: str, configuracao: Optional[Dict] = None) -> 'TrabalhoExtracao':
+        """Abre (ou cria) o trabalho do PDF dentro de raiz; configuracao precisa ser serializável em JSON"""
+        hash_pdf = hash_arquivo(pdf_path)
+        return cls(Path(raiz) / hash_pdf[:32], pdf_path, hash_pdf, configuracao)
+
+    def _salvar_estado(self) -> None:
+        _gravar_json_atomico(self.diretorio / self.ARQ_ESTADO, self.estado)
+
+    # Etapa 1: textos das páginas
+    def paginas(self) -> Optional[Dict]:
+        """Textos e rotas das páginas salvos, ou None"""
+        return _ler_json(self.diretorio / self.ARQ_PAGINAS)
+
+    def salvar_paginas(self, textos: List[str], rotas: List[str]) -> None:
+        _gravar_json_atomico(self.diretorio / self.ARQ_PAGINAS, {'textos': textos, 'rotas': rotas})
+
+    # Etapa 2: sindicato e convenção
+    def identificacao(self) -> Optional[Dict[str, str]]:
+        """Sindicato e convenção confirmados, ou None"""
+        if 'sindicato' in self.estado and 'convencao' in self.estado:
+            return {'sindicato': self.estado['sindicato'], 'convencao': self.estado['convencao']}
+        return None
+
+    def salvar_identificacao(self, sindicato: str, convencao: str) -> None:
+        self.estado['sindicato'] = sindicato
+        self.estado['convencao'] = convencao
+        self._salvar_estado()
+
+    # Etapa 3: cláusulas segmentadas
+    def clausulas(self) -> Optional[List[Dict[str, str]]]:
+        """Cláusulas segmentadas (título e conteúdo), ou None"""
+        return _ler_json(self.diretorio / self.ARQ_CLAUSULAS)
+
+    def salvar_clausulas(self, clausulas: List[Dict[str, str]]) -> None:
+        _gravar_json_atomico(self.diretorio / self.ARQ_CLAUSULAS, clausulas)
+
+    # Etapa 4: resumos, um por linha à medida que ficam prontos
+    def resumos(self, usar_ia: bool) -> Dict[int, str]:
+        """
+        Resumos já gerados, por índice da cláusula. Com a IA ativa, só os que
+        vieram dela: resumos simples (fallback de uma falha da IA) são refeitos.
+        """
+        origem = ORIGEM_IA if usar_ia else ORIGEM_SIMPLES
+        caminho = self.diretorio / self.ARQ_RESUMOS
+        resumos = {}
+        if not caminho.exists():
+            return resumos
+
+        with open(caminho, 'r', encoding='utf-8') as f:
+            for linha in f:
+                try:
+                    registro = json.loads(linha)
+                except ValueError:
+                    continue  # Última linha truncada por uma interrupção
+                if registro.get('origem') == origem:
+                    resumos[registro['indice']] = registro['resumo']
+        return resumos
+
+    def registrar_resumo(self, indice: int, resumo: str, origem: str) -> None:
+        """Acrescenta o resumo com a origem real (ORIGEM_IA ou ORIGEM_SIMPLES)"""
+        linha = json.dumps({'indice': indice, 'resumo': resumo, 'origem': origem}, ensure_ascii=False)
+        with open(self.diretorio / self.ARQ_RESUMOS, 'a', encoding='utf-8') as f:
+            f.write(linha + '\n')
+            f.flush()
+            os.fsync(f.fileno())
+
+    def concluir(self) -> None:
+        """Remove o diretório do trabalho depois que o CSV foi salvo"""
+        shutil.rmtree(self.diretorio, ignore_errors=True)
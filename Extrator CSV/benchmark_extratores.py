@@ -0,0 +1,317 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark dos extratores de CCTs (v6, v7, v8 OCR e Standalone)
+Descrição: Roda cada extrator sobre os PDFs de pdfs/ com a API da OpenAI
+trocada por um cliente falso local (resumos determinísticos, latência
+configurável). Cada extrator roda em um processo separado, que mede o tempo
+por PDF e o pico de memória (RSS). O resultado (páginas/s, cláusulas/s, pico
+de RSS e checksums dos CSVs gerados) é acrescentado a um histórico JSON e
+comparado com a última execução do mesmo corpus, para achar regressões de
+velocidade ou mudanças de saída entre commits.
+
+Uso: python benchmark_extratores.py [pdfs...] [--motores v6 v7 v8 standalone]
+                                    [--repeticoes 3] [--latencia-api 0.0]
+"""
+
+import os
+import sys
+import csv
+import json
+import time
+import types
+import hashlib
+import argparse
+import platform
+import tempfile
+import contextlib
+import subprocess
+from pathlib import Path
+from typing import Dict, List, Optional
+
+PASTA = Path(__file__).resolve().parent
+PASTA_PDFS_PADRAO = PASTA.parent / "pdfs"
+HISTORICO_PADRAO = PASTA / "benchmark_historico.json"
+PREFIXO_RESULTADO = "RESULTADO_BENCHMARK "
+
+# nome: (pasta, módulo)
+MOTORES = {
+    'v6': ('extrator_cct_v6_FINAL', 'extrator_cct_v6'),
+    'v7': ('extrator_cct_v7_FINAL', 'extrator_cct_v7_final'),
+    'v8': ('extrator_cct_v8_OCR_FINAL', 'extrator_cct_v8_ocr'),
+    'standalone': ('ExtratorCCT_Standalone', 'extrator_cct_standalone'),
+}
+
+
+# ---------------------------------------------------------------------------
+# Cliente falso da OpenAI (usado só no processo filho)
+# ---------------------------------------------------------------------------
+
+class _Objeto:
+    def __init__(self, **campos):
+        self.__dict__.update(campos)
+
+
+class _CompletionsFalso:
+    def __init__(self, latencia: float):
+        self.latencia = latencia
+
+    def create(self, model=None, messages=(), **kwargs):
+        """Resumo determinístico: título e começo do conteúdo do prompt"""
+        if self.latencia:
+            time.sleep(self.latencia)
+        prompt = messages[-1]['content'] if messages else ''
+        titulo = ''
+        for linha in prompt.split('\n'):
+            if linha.startswith('Título:'):
+                titulo = linha[len('Título:'):].strip()
+                break
+        conteudo = prompt.split('Conteúdo:', 1)[-1].strip().split('\n')[0]
+        resumo = f"{titulo[:60]}: {conteudo[:80]}"
+        return _Objeto(
+            choices=[_Objeto(message=_Objeto(content=resumo))],
+            usage=_Objeto(total_tokens=len(prompt) // 4 + 25),
+        )
+
+
+def instalar_openai_falso(latencia: float) -> None:
+    """Registra um módulo 'openai' falso antes de os extratores o importarem"""
+    modulo = types.ModuleType('openai')
+
+    class OpenAI:
+        def __init__(self, *args, **kwargs):
+            self.chat = _Objeto(completions=_CompletionsFalso(latencia))
+
+    modulo.OpenAI = OpenAI
+    sys.modules['openai'] = modulo
+
+
+# ---------------------------------------------------------------------------
+# Processo filho: roda um extrator sobre os PDFs
+# ---------------------------------------------------------------------------
+
+def _criar_extrator(nome: str, modulo, pdf: str):
+    if nome == 'standalone':
+        config = modulo.ConfigManager()
+        # Sem caches nem checkpoints: cada repetição faz o trabalho todo
+        config.config.update(openai_api_key='benchmark', cache_ocr=False, cache_resumos=False,
+                             retomar_trabalhos=False, relatorio_execucao=False, planilha_mae=None)
+        extrator = modulo.ExtratorCCT(pdf, config)
+        extrator._confirmar_sindicato = lambda detectado, todos: detectado
+        return extrator
+    return modulo.ExtratorCCT(pdf, usar_ia=True)
+
+
+def pico_rss_mb() -> Optional[float]:
+    """Maior RSS do processo e dos filhos já encerrados (None sem o módulo resource)"""
+    try:
+        import resource
+    except ImportError:
+        return None
+    pico = max(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+               resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss)
+    # ru_maxrss vem em KB no Linux e em bytes no macOS
+    return round(pico / (1024 * 1024 if sys.platform == 'darwin' else 1024), 1)
+
+
+def checksum_arquivo(caminho: Path) -> str:
+    return hashlib.sha256(caminho.read_bytes()).hexdigest()
+
+
+def executar_filho(nome: str, pdfs: List[str], repeticoes: int, latencia: float) -> Dict:
+    """Roda o extrator `nome` em todos os PDFs, `repeticoes` vezes; fica com o melhor tempo de cada PDF"""
+    pasta, nome_modulo = MOTORES[nome]
+    temporario = Path(tempfile.mkdtemp(prefix='benchmark_cct_'))
+    # ConfigManager do Standalone usa a pasta do usuário: isolada no temporário
+    os.environ['HOME'] = os.environ['APPDATA'] = str(temporario)
+
+    instalar_openai_falso(latencia)
+    sys.path.insert(0, str(PASTA / pasta))
+    os.chdir(PASTA / pasta)
+
+    import fitz  # PyMuPDF
+    with contextlib.redirect_stdout(open(os.devnull, 'w', encoding='utf-8')):
+        modulo = __import__(nome_modulo)
+
+    resultados = {}
+    for pdf in pdfs:
+        with fitz.open(pdf) as doc:
+            paginas = len(doc)
+        saida = temporario / (Path(pdf).stem + '.csv')
+        melhor = float('inf')
+        checksums = set()
+        for _ in range(repeticoes):
+            inicio = time.perf_counter()
+            with contextlib.redirect_stdout(open(os.devnull, 'w', encoding='utf-8')):
+                extrator = _criar_extrator(nome, modulo, pdf)
+                extrator.processar(str(saida))
+            melhor = min(melhor, time.perf_counter() - inicio)
+            checksums.add(checksum_arquivo(saida))
+
+        with open(saida, 'r', encoding='utf-8', newline='') as f:
+            clausulas = sum(1 for _ in csv.DictReader(f))
+        resultados[Path(pdf).name] = {
+            'paginas': paginas,
+            'clausulas': clausulas,
+            'segundos': round(melhor, 4),
+            # Repetições com saídas diferentes não têm um checksum que as represente
+            'checksum': next(iter(checksums)) if len(checksums) == 1 else None,
+            'deterministico': len(checksums) == 1,
+        }
+
+    return {'pdfs': resultados, 'pico_rss_mb': pico_rss_mb()}
+
+
+# ---------------------------------------------------------------------------
+# Processo principal
+# ---------------------------------------------------------------------------
+
+def medir_motor(nome: str, pdfs: List[str], repeticoes: int, latencia: float) -> Dict:
+    """Roda o extrator em um processo separado e resume o resultado"""
+    comando = [sys.executable, str(Path(__file__).resolve()), '--filho', nome,
+               '--repeticoes', str(repeticoes), '--latencia-api', str(latencia), *pdfs]
+    processo = subprocess.run(comando, capture_output=True, text=True, encoding='utf-8', errors='replace')
+
+    linhas = [l for l in processo.stdout.splitlines() if l.startswith(PREFIXO_RESULTADO)]
+    if processo.returncode != 0 or not linhas:
+        erro = (processo.stderr.strip().splitlines() or ['sem saída'])[-1]
+        return {'status': 'erro', 'erro': erro}
+
+    bruto = json.loads(linhas[-1][len(PREFIXO_RESULTADO):])
+    por_pdf = bruto['pdfs']
+    paginas = sum(r['paginas'] for r in por_pdf.values())
+    clausulas = sum(r['clausulas'] for r in por_pdf.values())
+    segundos = sum(r['segundos'] for r in por_pdf.values())
+
+    # Checksum do conjunto: muda se a saída de qualquer PDF mudar
+    conjunto = hashlib.sha256()
+    for pdf in sorted(por_pdf):
+        conjunto.update(f"{pdf}:{por_pdf[pdf]['checksum']}\n".encode('utf-8'))
+
+    return {
+        'status': 'ok',
+        'paginas': paginas,
+        'clausulas': clausulas,
+        'segundos': round(segundos, 4),
+        'paginas_por_s': round(paginas / segundos, 2) if segundos else None,
+        'clausulas_por_s': round(clausulas / segundos, 2) if segundos else None,
+        'pico_rss_mb': bruto['pico_rss_mb'],
+        'checksum': conjunto.hexdigest(),
+        'deterministico': all(r['deterministico'] for r in por_pdf.values()),
+        'pdfs': por_pdf,
+    }
+
+
+def commit_atual() -> Dict:
+    """Commit do repositório e se há alterações não commitadas"""
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=PASTA,
+                                capture_output=True, text=True, check=True).stdout.strip()
+        sujo = bool(subprocess.run(['git', 'status', '--porcelain', '--', '.'], cwd=PASTA,
+                                   capture_output=True, text=True).stdout.strip())
+        return {'commit': commit, 'alteracoes_locais': sujo}
+    except (OSError, subprocess.CalledProcessError):
+        return {'commit': None, 'alteracoes_locais': None}
+
+
+def carregar_historico(caminho: Path) -> List[Dict]:
+    if not caminho.exists():
+        return []
+    with open(caminho, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def salvar_historico(caminho: Path, historico: List[Dict]) -> None:
+    temporario = caminho.with_suffix(caminho.suffix + '.tmp')
+    with open(temporario, 'w', encoding='utf-8') as f:
+        json.dump(historico, f, ensure_ascii=False, indent=2)
+    os.replace(temporario, caminho)
+
+
+def anterior_comparavel(historico: List[Dict], execucao: Dict, motor: str) -> Optional[Dict]:
+    """Última execução com o mesmo corpus e a mesma latência simulada em que o motor rodou"""
+    for anterior in reversed(historico):
+        if (anterior['corpus'] == execucao['corpus']
+                and anterior['latencia_api_s'] == execucao['latencia_api_s']
+                and anterior['motores'].get(motor, {}).get('status') == 'ok'):
+            return anterior
+    return None
+
+
+def imprimir_tabela(execucao: Dict, historico: List[Dict]) -> None:
+    print(f"{'Motor':<12}{'Páginas/s':>11}{'Cláusulas/s':>13}{'Pico RSS':>11}{'vs anterior':>13}  Saída")
+    for motor, r in execucao['motores'].items():
+        if r['status'] != 'ok':
+            print(f"{motor:<12}❌ {r['erro']}")
+            continue
+
+        anterior = anterior_comparavel(historico, execucao, motor)
+        variacao, saida = '-', 'nova'
+        if anterior:
+            antes = anterior['motores'][motor]
+            variacao = f"{(r['paginas_por_s'] / antes['paginas_por_s'] - 1) * 100:+.1f}%"
+            saida = 'igual' if r['checksum'] == antes['checksum'] else f"⚠ mudou desde {anterior['commit']}"
+        if not r['deterministico']:
+            saida += ' (não determinística)'
+
+        rss = f"{r['pico_rss_mb']:.0f} MB" if r['pico_rss_mb'] is not None else '-'
+        print(f"{motor:<12}{r['paginas_por_s']:>11.2f}{r['clausulas_por_s']:>13.2f}{rss:>11}{variacao:>13}  {saida}")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark dos extratores de CCTs")
+    parser.add_argument('pdfs', nargs='*', help="PDFs (padrão: todos de pdfs/)")
+    parser.add_argument('--motores', nargs='+', choices=list(MOTORES), default=list(MOTORES))
+    parser.add_argument('--repeticoes', type=int, default=3)
+    parser.add_argument('--latencia-api', type=float, default=0.0,
+                        help="Segundos de espera simulados em cada chamada à API falsa")
+    parser.add_argument('--historico', default=str(HISTORICO_PADRAO))
+    parser.add_argument('--nao-gravar', action='store_true', help="Não acrescenta a execução ao histórico")
+    parser.add_argument('--filho', choices=list(MOTORES), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    pdfs = sorted(str(Path(p).resolve()) for p in args.pdfs) or sorted(str(p) for p in PASTA_PDFS_PADRAO.glob('*.pdf'))
+    if not pdfs:
+        print(f"❌ Nenhum PDF encontrado em {PASTA_PDFS_PADRAO}")
+        return 1
+
+    if args.filho:
+        resultado = executar_filho(args.filho, pdfs, max(1, args.repeticoes), args.latencia_api)
+        print(PREFIXO_RESULTADO + json.dumps(resultado, ensure_ascii=False))
+        return 0
+
+    corpus = hashlib.sha256()
+    for pdf in pdfs:
+        corpus.update(f"{Path(pdf).name}:{checksum_arquivo(Path(pdf))}\n".encode('utf-8'))
+
+    print(f"📄 {len(pdfs)} PDF(s), {args.repeticoes} repetição(ões), latência simulada da API: {args.latencia_api}s")
+    print()
+
+    execucao = {
+        'data': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        **commit_atual(),
+        'python': platform.python_version(),
+        'plataforma': platform.platform(),
+        'cpus': os.cpu_count(),
+        'corpus': corpus.hexdigest(),
+        'latencia_api_s': args.latencia_api,
+        'repeticoes': args.repeticoes,
+        'motores': {},
+    }
+    for motor in args.motores:
+        print(f"⏱ {motor}...")
+        execucao['motores'][motor] = medir_motor(motor, pdfs, args.repeticoes, args.latencia_api)
+    print()
+
+    caminho = Path(args.historico)
+    historico = carregar_historico(caminho)
+    imprimir_tabela(execucao, historico)
+
+    if not args.nao_gravar:
+        salvar_historico(caminho, historico + [execucao])
+        print(f"\n📈 Execução acrescentada ao histórico: {caminho}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Correção de erros de OCR do Extrator de CCTs
+Descrição: Compila a tabela de correções (correcoes_ocr.json) uma única vez em
+uma só expressão e aplica todas as correções em uma passada sobre o texto.
+Novas correções entram no arquivo de regras, sem editar código.
+"""
+
+import re
+import json
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+ARQUIVO_REGRAS = Path(__file__).resolve().parent / "correcoes_ocr.json"
+
+# Versão do formato do arquivo de regras suportada por este módulo
+VERSAO_FORMATO = 1
+
+# \1, \g<1> e \g<nome> na substituição
+_PADRAO_REFERENCIA = re.compile(r'\\(\d+)|\\g<(\w+)>')
+
+# Regra que começa por um caractere literal (opcionalmente precedido de \b)
+_PADRAO_INICIO_LITERAL = re.compile(r'(\\b)?([^\W_]|/)(?![*+?{])')
+
+
+def _separar_inicio(padrao: str) -> Tuple[Optional[str], str]:
+    """
+    Separa o primeiro caractere literal da regra: ('a', resto) para '\\babril...'.
+    Devolve (None, padrao) quando a regra não começa por um literal simples.
+    """
+    if '|' in padrao:
+        return None, padrao
+    match = _PADRAO_INICIO_LITERAL.match(padrao)
+    if not match:
+        return None, padrao
+
+    caractere = match.group(2)
+    resto = padrao[match.end():]
+    if match.group(1):
+        if caractere == '/':
+            return None, padrao
+        # \bX com X alfanumérico equivale a X não precedido de caractere de palavra
+        resto = r'(?<!\w.)' + resto
+    return caractere, resto
+
+
+class CorretorOCR:
+    """
+    Aplica as regras de correção em uma única passada.
+
+    As regras viram alternativas de uma só expressão, agrupadas pelo primeiro
+    caractere (cada posição do texto testa só as regras que podem começar ali)
+    e mantendo a ordem do arquivo entre regras que casam na mesma posição. As
+    regras casam sobre o texto original: a saída de uma não é reprocessada
+    pelas seguintes.
+    """
+
+    def __init__(self, regras: List[Dict], versao: int = 0):
+        self.versao = versao
+        self.regras = regras
+        self._substituicoes: Dict[int, str] = {}
+        self._proximo_grupo = 1
+
+        # Cada item é uma regra isolada ou um bloco {caractere: [regras]}
+        estrutura = []
+        blocos = None
+
+        for regra in regras:
+            padrao = regra['padrao']
+            try:
+                compilado = re.compile(padrao)
+            except re.error as e:
+                raise ValueError(f"Regra de OCR inválida {padrao!r}: {e}") from e
+            if compilado.groupindex:
+                raise ValueError(f"Regra de OCR com grupo nomeado não é suportada: {padrao!r}")
+
+            ignorar = regra.get('ignorar_maiusculas', True)
+            caractere, resto = _separar_inicio(padrao) if ignorar else (None, padrao)
+            item = (ignorar, resto, regra['substituicao'], compilado.groups)
+
+            if caractere is None:
+                # Regra sem início literal pode casar onde as dos blocos casam: preserva a ordem
+                estrutura.append(item)
+                blocos = None
+            else:
+                if blocos is None:
+                    blocos = {}
+                    estrutura.append(blocos)
+                blocos.setdefault(caractere.lower(), []).append(item)
+
+        # Os grupos são numerados na ordem em que aparecem na expressão final
+        partes = []
+        for item in estrutura:
+            if isinstance(item, dict):
+                for caractere, itens in item.items():
+                    alternativas = '|'.join(self._alternativa(*i) for i in itens)
+                    partes.append(f"(?i:{re.escape(caractere)})(?:{alternativas})")
+            else:
+                partes.append(self._alternativa(*item))
+
+        self._padrao = re.compile('|'.join(partes)) if partes else None
+
+    def _alternativa(self, ignorar: bool, padrao: str, substituicao: str, grupos: int) -> str:
+        """
+        Alternativa da regra seguida de um grupo vazio marcador: o marcador é o
+        último grupo a fechar, então lastindex identifica a regra que casou.
+        """
+        primeiro_grupo = self._proximo_grupo
+        marcador = primeiro_grupo + grupos
+        self._proximo_grupo = marcador + 1
+        self._substituicoes[marcador] = self._renumerar(substituicao, primeiro_grupo, grupos)
+        flags = 'i' if ignorar else '-i'
+        return f"(?{flags}:{padrao})()"
+
+    @staticmethod
+    def _renumerar(substituicao: str, primeiro_grupo: int, total_grupos: int) -> str:
+        """Desloca as referências da regra para a posição dos seus grupos na expressão combinada"""
+        def deslocar(match):
+            numero = match.group(1) or match.group(2)
+            if not numero.isdigit() or int(numero) > total_grupos:
+                raise ValueError(f"Referência inválida na substituição {substituicao!r}")
+            if int(numero) == 0:
+                return r"\g<0>"
+            return f"\\g<{primeiro_grupo + int(numero) - 1}>"
+
+        return _PADRAO_REFERENCIA.sub(deslocar, substituicao)
+
+    def _substituir(self, match) -> str:
+        return match.expand(self._substituicoes[match.lastindex])
+
+    def corrigir(self, texto: str) -> str:
+        """Texto com todas as correções aplicadas"""
+        if self._padrao is None or not texto:
+            return texto
+        return self._padrao.sub(self._substituir, texto)
+
+
+def carregar_regras(caminho=ARQUIVO_REGRAS) -> CorretorOCR:
+    """Lê e compila o arquivo de regras"""
+    with open(caminho, 'r', encoding='utf-8') as f:
+        dados = json.load(f)
+
+    formato = dados.get('formato', 1)
+    if formato > VERSAO_FORMATO:
+        raise ValueError(f"Arquivo de regras no formato {formato}; suportado até {VERSAO_FORMATO}")
+
+    return CorretorOCR(dados.get('regras', []), versao=dados.get('versao', 0))
+
+
+@lru_cache(maxsize=None)
+def carregar_corretor(caminho: str = str(ARQUIVO_REGRAS)) -> CorretorOCR:
+    """Corretor compilado uma vez por processo para cada arquivo de regras"""
+    return carregar_regras(caminho)
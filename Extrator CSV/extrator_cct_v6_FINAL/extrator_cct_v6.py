@@ -14,6 +14,7 @@ from pathlib import Path
 from typing import List, Dict, Tuple, Optional
 import fitz  # PyMuPDF
 from openai import OpenAI
+from correcao_ocr import carregar_corretor
 
 # Configuração do cliente OpenAI (usa variáveis de ambiente pré-configuradas)
 client = OpenAI()
@@ -234,61 +235,8 @@ class ExtratorCCT:
         Returns:
             Texto corrigido
         """
-        # Dicionário de correções de OCR comuns
-        correcoes_ocr = {
-            # Correção de datas mal formatadas
-            r'\babrill?(\d{4})\b': r'abril/\1',
-            r'\bmaiol?(\d{4})\b': r'maio/\1',
-            r'\bjunhol?(\d{4})\b': r'junho/\1',
-            r'\bjulhol?(\d{4})\b': r'julho/\1',
-            r'\bagostol?(\d{4})\b': r'agosto/\1',
-            r'\bsetemb?rol?(\d{4})\b': r'setembro/\1',
-            r'\boutubl?rol?(\d{4})\b': r'outubro/\1',
-            r'\bnovembl?rol?(\d{4})\b': r'novembro/\1',
-            r'\bdezembl?rol?(\d{4})\b': r'dezembro/\1',
-            r'\bjaneirl?ol?(\d{4})\b': r'janeiro/\1',
-            r'\bfevereirl?ol?(\d{4})\b': r'fevereiro/\1',
-            r'\bmarçol?(\d{4})\b': r'março/\1',
-            
-            # Correção de datas com caracteres estranhos
-            r'\bmaiot2O2\'': 'maio/2025',
-            r'\bjulhol2025': 'julho/2025',
-            r'\bagosto/2O25': 'agosto/2025',
-            r'\bsetembro/2O25': 'setembro/2025',
-            r'\boutubro/2O25': 'outubro/2025',
-            
-            # Correção de anos com O em vez de 0
-            r'/2O(\d{2})\b': r'/20\1',
-            r'\b2O(\d{2})\b': r'20\1',
-            
-            # Correção de números com l em vez de 1
-            r'\bl2(\d{3})\b': r'1/2\1',
-            
-            # Correção de "íorma" para "forma"
-            r'\bíorma\b': 'forma',
-            
-            # Correção de "perÍodo" para "período"
-            r'\bperÍodo\b': 'período',
-            
-            # Correção de "trânsferência" para "transferência"
-            r'\btrânsferência\b': 'transferência',
-            
-            # Correção de "essês" para "esses"
-            r'\bessês\b': 'esses',
-            
-            # Correção de espaços antes de pontuação
-            r'\s+([,\.;:!?])': r'\1',
-            
-            # Correção de múltiplos espaços
-            r'\s{2,}': ' ',
-        }
-        
-        # Aplica todas as correções
-        texto_corrigido = texto
-        for padrao, substituicao in correcoes_ocr.items():
-            texto_corrigido = re.sub(padrao, substituicao, texto_corrigido, flags=re.IGNORECASE)
-        
-        return texto_corrigido
+        # Regras em correcoes_ocr.json, compiladas uma vez e aplicadas em uma passada
+        return carregar_corretor().corrigir(texto)
     
     def normalizar_titulo_clausula(self, titulo: str) -> str:
         """
@@ -13,6 +13,7 @@ from pathlib import Path
 from typing import List, Dict, Tuple
 import fitz  # PyMuPDF
 from openai import OpenAI
+from correcao_ocr import carregar_corretor
 import tkinter as tk
 from tkinter import filedialog, messagebox
 
@@ -249,35 +250,8 @@ class ExtratorCCT:
     
     def corrigir_ocr_texto(self, texto: str) -> str:
         """Corrige erros de OCR"""
-        correcoes_ocr = {
-            r'\babrill?(\d{4})\b': r'abril/\1',
-            r'\bmaiol?(\d{4})\b': r'maio/\1',
-            r'\bjunhol?(\d{4})\b': r'junho/\1',
-            r'\bjulhol?(\d{4})\b': r'julho/\1',
-            r'\bagostol?(\d{4})\b': r'agosto/\1',
-            r'\bsetemb?rol?(\d{4})\b': r'setembro/\1',
-            r'\boutubl?rol?(\d{4})\b': r'outubro/\1',
-            r'\bnovembl?rol?(\d{4})\b': r'novembro/\1',
-            r'\bdezembl?rol?(\d{4})\b': r'dezembro/\1',
-            r'\bjaneirl?ol?(\d{4})\b': r'janeiro/\1',
-            r'\bfevereirl?ol?(\d{4})\b': r'fevereiro/\1',
-            r'\bmarçol?(\d{4})\b': r'março/\1',
-            r'/2O(\d{2})\b': r'/20\1',
-            r'\b2O(\d{2})\b': r'20\1',
-            r'\bl2(\d{3})\b': r'1/2\1',
-            r'\bíorma\b': 'forma',
-            r'\bperÍodo\b': 'período',
-            r'\btrânsferência\b': 'transferência',
-            r'\bessês\b': 'esses',
-            r'\s+([,\.;:!?])': r'\1',
-            r'\s{2,}': ' ',
-        }
-        
-        texto_corrigido = texto
-        for padrao, substituicao in correcoes_ocr.items():
-            texto_corrigido = re.sub(padrao, substituicao, texto_corrigido, flags=re.IGNORECASE)
-        
-        return texto_corrigido
+        # Regras em correcoes_ocr.json, compiladas uma vez e aplicadas em uma passada
+        return carregar_corretor().corrigir(texto)
     
     def normalizar_titulo_clausula(self, titulo: str) -> str:
         """Normaliza título da cláusula"""
@@ -10,11 +10,12 @@ import os
 import re
 import csv
 from pathlib import Path
-from typing import List, Dict, Tuple
+from typing import Iterator, List, Dict, Tuple
 import fitz  # PyMuPDF
 from PIL import Image
 import pytesseract
-import io
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from openai import OpenAI
 import tkinter as tk
 from tkinter import filedialog, messagebox
@@ -64,12 +65,67 @@ def selecionar_csv_saida(pdf_path):
     return arquivo
 
 
+def ocr_pagina(page, cinza: bool = False) -> str:
+    """Converte a página em imagem de alta resolução e executa OCR"""
+    colorspace = fitz.csGRAY if cinza else fitz.csRGB
+    pix = page.get_pixmap(dpi=300, colorspace=colorspace, alpha=False)
+    
+    # Imagem criada direto dos pixels do pixmap (sem codificar/decodificar PNG)
+    modo = "L" if pix.n == 1 else "RGB"
+    img = Image.frombuffer(modo, (pix.width, pix.height), pix.samples, "raw", modo, pix.stride, 1)
+    
+    # Arquivo temporário do pytesseract em PPM/PGM (sem compressão) em vez de PNG
+    img.format = 'PPM'
+    return pytesseract.image_to_string(img, lang='por')
+
+
+def ocr_intervalo_paginas(pdf_path: str, inicio: int, fim: int, cinza: bool = False) -> List[Tuple[int, str]]:
+    """Executado em processo separado: abre o PDF e faz OCR das páginas [inicio, fim)"""
+    doc = fitz.open(pdf_path)
+    try:
+        return [(n, ocr_pagina(doc[n], cinza)) for n in range(inicio, fim)]
+    finally:
+        doc.close()
+
+
+# Linha cujo conteúdo (sem espaços nas pontas) começa com "CLÁUSULA"/"CLAUSULA" seguido de texto
+PADRAO_CABECALHO_CLAUSULA = re.compile(r'^[^\S\n]*(CL[ÁA]USULA[^\S\n]+\S[^\n]*)', re.IGNORECASE | re.MULTILINE)
+
+
+def segmentar_clausulas(texto: str) -> Iterator[Tuple[str, str, int, int]]:
+    """
+    Divide o texto em cláusulas em uma única passada.
+    Gera (titulo, corpo, linha_inicio, linha_fim): o corpo vai do cabeçalho
+    até o próximo cabeçalho (ou o fim do texto).
+    """
+    anterior = None
+    linha_atual = 0
+    posicao_linha = 0
+    
+    for match in PADRAO_CABECALHO_CLAUSULA.finditer(texto):
+        linha_atual += texto.count('\n', posicao_linha, match.start())
+        posicao_linha = match.start()
+        
+        if anterior is not None:
+            titulo, inicio_corpo, linha_inicio = anterior
+            yield titulo, texto[inicio_corpo:match.start()].strip(), linha_inicio, linha_atual
+        
+        anterior = (match.group(1).strip(), match.end(1) + 1, linha_atual)
+    
+    if anterior is not None:
+        titulo, inicio_corpo, linha_inicio = anterior
+        total_linhas = linha_atual + texto.count('\n', posicao_linha) + 1
+        yield titulo, texto[inicio_corpo:].strip(), linha_inicio, total_linhas
+
+
 class ExtratorCCT:
     """Classe para extrair dados de PDFs usando Tesseract OCR"""
     
-    def __init__(self, pdf_path: str, usar_ia: bool = True):
+    def __init__(self, pdf_path: str, usar_ia: bool = True, workers_ocr: int = None, ocr_cinza: bool = False):
         self.pdf_path = pdf_path
         self.usar_ia = usar_ia
+        self.workers_ocr = workers_ocr or os.cpu_count() or 1
+        self.ocr_cinza = ocr_cinza
         self.texto_completo = ""
         self.sindicato = ""
         self.convencao = ""
@@ -81,30 +137,23 @@ class ExtratorCCT:
         print("   ⏳ Este processo pode demorar alguns minutos...")
         print()
         
-        texto_completo = []
-        
         try:
             doc = fitz.open(self.pdf_path)
             total_paginas = len(doc)
             
-            for i, page in enumerate(doc, 1):
-                print(f"   Processando página {i}/{total_paginas}... ", end='', flush=True)
-                
-                # Converter página para imagem em alta resolução
-                pix = page.get_pixmap(dpi=300)
-                img_data = pix.tobytes("png")
-                img = Image.open(io.BytesIO(img_data))
-                
-                # Executar OCR
-                texto_pagina = pytesseract.image_to_string(img, lang='por')
-                
-                if texto_pagina.strip():
-                    texto_completo.append(texto_pagina)
-                    print("✓")
-                else:
-                    print("(vazia)")
+            if self.workers_ocr <= 1 or total_paginas <= 1:
+                textos_paginas = []
+                for i, page in enumerate(doc, 1):
+                    print(f"   Processando página {i}/{total_paginas}... ", end='', flush=True)
+                    texto_pagina = ocr_pagina(page, self.ocr_cinza)
+                    textos_paginas.append(texto_pagina)
+                    print("✓" if texto_pagina.strip() else "(vazia)")
+                doc.close()
+            else:
+                doc.close()
+                textos_paginas = self._ocr_paralelo(total_paginas)
             
-            doc.close()
+            texto_completo = [texto for texto in textos_paginas if texto.strip()]
             
             self.texto_completo = "\n".join(texto_completo)
             print(f"\n✓ Extração concluída: {len(self.texto_completo)} caracteres\n")
@@ -114,6 +163,36 @@ class ExtratorCCT:
             print(f"\n❌ Erro ao extrair texto do PDF: {e}")
             raise
     
+    def _ocr_paralelo(self, total_paginas: int) -> List[str]:
+        """Distribui intervalos de páginas entre processos e remonta na ordem original"""
+        print(f"   ⚙ OCR paralelo com {self.workers_ocr} processos")
+        
+        # Mais intervalos que processos para equilibrar páginas lentas
+        partes = min(total_paginas, self.workers_ocr * 4)
+        tamanho, resto = divmod(total_paginas, partes)
+        intervalos = []
+        inicio = 0
+        for k in range(partes):
+            fim = inicio + tamanho + (1 if k < resto else 0)
+            intervalos.append((inicio, fim))
+            inicio = fim
+        
+        textos_paginas = [""] * total_paginas
+        concluidas = 0
+        
+        with ProcessPoolExecutor(max_workers=min(self.workers_ocr, partes)) as executor:
+            futuros = [
+                executor.submit(ocr_intervalo_paginas, self.pdf_path, inicio, fim, self.ocr_cinza)
+                for inicio, fim in intervalos
+            ]
+            for futuro in as_completed(futuros):
+                for n, texto_pagina in futuro.result():
+                    textos_paginas[n] = texto_pagina
+                    concluidas += 1
+                print(f"   Processando... {concluidas}/{total_paginas} páginas")
+        
+        return textos_paginas
+    
     def normalizar_sindicato(self, sindicato_bruto: str) -> str:
         """Normaliza o nome do sindicato"""
         sindicato = ' '.join(sindicato_bruto.split())
@@ -231,45 +310,20 @@ class ExtratorCCT:
         """Extrai cláusulas do texto"""
         print("📋 Extraindo cláusulas...")
         
-        linhas = self.texto_completo.split('\n')
         clausulas_encontradas = []
-        i = 0
         
-        while i < len(linhas):
-            linha = linhas[i].strip()
+        for titulo_clausula, conteudo, linha_inicio, _ in segmentar_clausulas(self.texto_completo):
+            # Limpar conteúdo
+            conteudo_completo = self._limpar_conteudo(conteudo)
             
-            # Padrão mais robusto para cláusulas
-            if re.match(r'^CL[ÁA]USULA\s+', linha, re.IGNORECASE):
-                titulo_clausula = linha
-                inicio_conteudo = i + 1
+            if conteudo_completo:
+                titulo_normalizado = self.normalizar_titulo_clausula(titulo_clausula)
                 
-                # Buscar próxima cláusula
-                j = i + 1
-                while j < len(linhas):
-                    proxima_linha = linhas[j].strip()
-                    if re.match(r'^CL[ÁA]USULA\s+', proxima_linha, re.IGNORECASE):
-                        break
-                    j += 1
-                
-                # Extrair conteúdo
-                conteudo_linhas = linhas[inicio_conteudo:j]
-                conteudo_completo = '\n'.join(conteudo_linhas).strip()
-                
-                # Limpar conteúdo
-                conteudo_completo = self._limpar_conteudo(conteudo_completo)
-                
-                if conteudo_completo:
-                    titulo_normalizado = self.normalizar_titulo_clausula(titulo_clausula)
-                    
-                    clausulas_encontradas.append({
-                        'titulo': titulo_normalizado,
-                        'conteudo': conteudo_completo,
-                        'linha_inicio': i
-                    })
-                
-                i = j
-            else:
-                i += 1
+                clausulas_encontradas.append({
+                    'titulo': titulo_normalizado,
+                    'conteudo': conteudo_completo,
+                    'linha_inicio': linha_inicio
+                })
         
         print(f"   Encontradas {len(clausulas_encontradas)} cláusulas")
         print()
@@ -523,4 +577,5 @@ def main():
 
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()
     exit(main())
@@ -3,6 +3,7 @@ import streamlit as st
 import re
 import os
 import base64 # Importa o módulo base64 para codificar a imagem
+from base_cct import carregar_navegacao, ler_clausula_completa
 
 # -------------------------------------------------
 # 1️⃣ Configurações da página
@@ -43,16 +44,64 @@ st.markdown(
 )
 # -------------------------------------------------
 # (O restante do seu código permanece inalterado)
-# Carregue a base
-df = pd.read_csv("CCTs_Extraidas.csv", encoding="utf-8")
 # CONFIRA essas variáveis com os nomes certos do seu csv!
+arquivo_base = "CCTs_Extraidas.csv"
 col_sindicato = "Sindicato"
 col_cct = "Convenção"         # ajuste conforme seu arquivo ("Convenção", "Acordo", etc)
 col_nome = "Título da Cláusula"
 col_resumo = "Resumo"
 col_completa = "Cláusula Completa"
+
+
+def versao_arquivo(caminho):
+    """Identifica a versão do arquivo (data de modificação + tamanho) sem lê-lo"""
+    info = os.stat(caminho)
+    return (info.st_mtime_ns, info.st_size)
+
+
+@st.cache_resource(max_entries=1, show_spinner="Carregando a base de CCTs...")
+def carregar_indice(caminho, versao):
+    """
+    Lê a base uma vez por versão do arquivo e monta o índice
+    sindicato -> convenção -> título da cláusula -> linha, na ordem do arquivo.
+    As reruns do Streamlit (cada troca de selectbox) só consultam o dicionário.
+    Só as colunas de navegação são lidas; a Cláusula Completa vem sob demanda.
+    """
+    df = carregar_navegacao(caminho)
+    df["_linha"] = range(len(df))
+    # Como as listas originais (dropna): todo sindicato preenchido aparece, mas
+    # convenções e títulos em branco não entram nas listas de convenções/cláusulas
+    df = df[df[col_sindicato].notna()]
+    indice = {}
+    for linha in df.to_dict("records"):
+        sindicato, cct = linha[col_sindicato], linha[col_cct]
+        ccts = indice.setdefault(sindicato, {})
+        if pd.isna(cct):
+            continue
+        clausulas = ccts.setdefault(cct, {})
+        if pd.isna(linha[col_nome]):
+            continue
+        # Títulos repetidos na mesma convenção mostram a primeira ocorrência
+        clausulas.setdefault(linha[col_nome], linha)
+    return {
+        "tem_resumo": col_resumo in df.columns,
+        "sindicatos": sorted(indice),
+        "ccts": {sindicato: sorted(ccts) for sindicato, ccts in indice.items()},
+        "clausulas": indice,
+    }
+
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def carregar_clausula_completa(caminho, versao, numero_linha):
+    """Texto completo de uma cláusula, lido só quando ela é escolhida"""
+    return ler_clausula_completa(caminho, numero_linha)
+
+
+# Carregue a base (relida só quando o arquivo muda)
+versao_base = versao_arquivo(arquivo_base)
+base = carregar_indice(arquivo_base, versao_base)
 # 1º SELEÇÃO: SINDICATO
-sindicatos = sorted(df[col_sindicato].dropna().unique())
+sindicatos = base["sindicatos"]
 sindicato_escolhido = st.selectbox(
     "Selecione o sindicato:",
     ["Selecione"] + sindicatos,
@@ -60,8 +109,7 @@ sindicato_escolhido = st.selectbox(
 )
 if sindicato_escolhido and sindicato_escolhido != "Selecione":
     # 2º SELEÇÃO: CCT/acordo, filtrado pelo sindicato
-    filtra_cct = df[df[col_sindicato]==sindicato_escolhido]
-    cct_unicos = sorted(filtra_cct[col_cct].dropna().unique())
+    cct_unicos = base["ccts"][sindicato_escolhido]
     cct_escolhida = st.selectbox(
         "Selecione a convenção/acordo coletivo:",
         ["Selecione"] + cct_unicos,
@@ -69,8 +117,8 @@ if sindicato_escolhido and sindicato_escolhido != "Selecione":
     )
     if cct_escolhida and cct_escolhida != "Selecione":
         # 3º SELEÇÃO: Cláusula, filtrada pelo sindicato+acordo escolhido
-        filtra_clausulas = filtra_cct[filtra_cct[col_cct] == cct_escolhida]
-        clausulas_lista = filtra_clausulas[col_nome].dropna().tolist()
+        clausulas_da_cct = base["clausulas"][sindicato_escolhido][cct_escolhida]
+        clausulas_lista = list(clausulas_da_cct)
         clausula_escolhida = st.selectbox(
             "Escolha a cláusula:",
             ["Selecione"] + clausulas_lista,
@@ -78,12 +126,13 @@ if sindicato_escolhido and sindicato_escolhido != "Selecione":
             help="Selecione o nome da cláusula desejada"
         )
         if clausula_escolhida and clausula_escolhida != "Selecione":
-            linha = filtra_clausulas[filtra_clausulas[col_nome]==clausula_escolhida].iloc[0]
+            linha = clausulas_da_cct[clausula_escolhida]
             st.markdown(f"<h3 style='margin-bottom: 0'>{linha[col_nome]}</h3>", unsafe_allow_html=True)
-            if col_resumo in df.columns:
+            if base["tem_resumo"]:
                 st.markdown(f"<div style='color:#666; font-size:1.1rem; margin-bottom:0.5rem;'><b>Resumo:</b> {linha[col_resumo]}</div>", unsafe_allow_html=True)
             # Lógica para negrito nos parágrafos (mantida da nossa conversa anterior)
-            conteudo_completo_formatado = str(linha[col_completa]) # Garante que é string
+            conteudo_completo = carregar_clausula_completa(arquivo_base, versao_base, linha["_linha"])
+            conteudo_completo_formatado = str(conteudo_completo) # Garante que é string
             conteudo_completo_formatado = re.sub(
                 r'(PARÁGRAFO\s+(?:[A-ZÀ-Ú\s]+))',
                 r'<b>\1</b>',
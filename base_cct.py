@@ -0,0 +1,143 @@
+"""
+Armazenamento colunar da base de CCTs.
+
+A base mestre fica em Parquet (CCTs_Extraidas.parquet) ao lado do CSV, que
+continua sendo gerado como formato de exportação. Quem só precisa navegar lê
+as colunas pequenas (Sindicato, Convenção, Título, Resumo); o texto longo da
+"Cláusula Completa" é lido sob demanda, só do grupo de linhas da cláusula
+escolhida.
+
+Se o CSV for mais novo que o Parquet (editado à mão ou integrado por outra
+ferramenta), o Parquet é refeito a partir dele na próxima leitura.
+
+Uso: python base_cct.py [CCTs_Extraidas.csv] [--exportar-csv]
+"""
+
+import os
+import sys
+import argparse
+from pathlib import Path
+
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PARQUET_DISPONIVEL = True
+except ImportError:
+    PARQUET_DISPONIVEL = False
+
+ARQUIVO_CSV = "CCTs_Extraidas.csv"
+COLUNAS = ["Sindicato", "Convenção", "Título da Cláusula", "Resumo", "Cláusula Completa"]
+COLUNAS_NAVEGACAO = ["Sindicato", "Convenção", "Título da Cláusula", "Resumo"]
+COLUNA_COMPLETA = "Cláusula Completa"
+
+# Grupos pequenos: buscar uma cláusula lê só ~128 textos completos
+LINHAS_POR_GRUPO = 128
+
+
+def caminho_colunar(caminho_csv):
+    """Arquivo Parquet correspondente ao CSV"""
+    return Path(caminho_csv).with_suffix(".parquet")
+
+
+def colunar_atualizado(caminho_csv):
+    """True se o Parquet existe e não é mais antigo que o CSV"""
+    parquet = caminho_colunar(caminho_csv)
+    if not PARQUET_DISPONIVEL or not parquet.exists():
+        return False
+    if not os.path.exists(caminho_csv):
+        return True
+    return os.stat(parquet).st_mtime_ns >= os.stat(caminho_csv).st_mtime_ns
+
+
+def _gravar_parquet(df, destino):
+    """Grava o Parquet em arquivo temporário e renomeia (nunca deixa arquivo pela metade)"""
+    tabela = pa.Table.from_pandas(df, preserve_index=False)
+    temporario = destino.with_suffix(".parquet.tmp")
+    pq.write_table(tabela, temporario, row_group_size=LINHAS_POR_GRUPO, compression="zstd")
+    os.replace(temporario, destino)
+
+
+def salvar_base(df, caminho_csv=ARQUIVO_CSV, exportar_csv=True):
+    """Salva a base no Parquet e, por padrão, exporta o CSV"""
+    df = df.reset_index(drop=True)
+    if exportar_csv:
+        df.to_csv(caminho_csv, index=False, encoding="utf-8")
+    # O Parquet é gravado por último para ficar mais novo que o CSV exportado
+    if PARQUET_DISPONIVEL:
+        _gravar_parquet(df, caminho_colunar(caminho_csv))
+
+
+def sincronizar(caminho_csv=ARQUIVO_CSV):
+    """Refaz o Parquet a partir do CSV se ele estiver ausente ou desatualizado"""
+    if PARQUET_DISPONIVEL and not colunar_atualizado(caminho_csv):
+        _gravar_parquet(pd.read_csv(caminho_csv, encoding="utf-8"), caminho_colunar(caminho_csv))
+
+
+def carregar_base(caminho_csv=ARQUIVO_CSV, colunas=None):
+    """
+    Lê a base (todas as colunas ou só as pedidas que existirem no arquivo),
+    pelo Parquet quando possível
+    """
+    if not PARQUET_DISPONIVEL:
+        usecols = (lambda coluna: coluna in colunas) if colunas else None
+        return pd.read_csv(caminho_csv, encoding="utf-8", usecols=usecols)
+
+    sincronizar(caminho_csv)
+    parquet = caminho_colunar(caminho_csv)
+    if colunas:
+        existentes = pq.read_schema(parquet).names
+        colunas = [coluna for coluna in colunas if coluna in existentes]
+    return pd.read_parquet(parquet, columns=colunas)
+
+
+def carregar_navegacao(caminho_csv=ARQUIVO_CSV):
+    """Colunas pequenas usadas para navegar (sem a Cláusula Completa)"""
+    return carregar_base(caminho_csv, COLUNAS_NAVEGACAO)
+
+
+def ler_clausula_completa(caminho_csv, linha):
+    """Texto completo de uma linha da base, lendo só o grupo de linhas que a contém"""
+    if not PARQUET_DISPONIVEL:
+        return pd.read_csv(caminho_csv, encoding="utf-8", usecols=[COLUNA_COMPLETA])[COLUNA_COMPLETA].iloc[linha]
+
+    sincronizar(caminho_csv)
+    arquivo = pq.ParquetFile(caminho_colunar(caminho_csv))
+    inicio = 0
+    for grupo in range(arquivo.num_row_groups):
+        linhas_grupo = arquivo.metadata.row_group(grupo).num_rows
+        if linha < inicio + linhas_grupo:
+            coluna = arquivo.read_row_group(grupo, columns=[COLUNA_COMPLETA]).column(0)
+            return coluna[linha - inicio].as_py()
+        inicio += linhas_grupo
+    raise IndexError(f"Linha {linha} fora da base ({inicio} linhas)")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Converte a base de CCTs entre CSV e Parquet")
+    parser.add_argument("csv", nargs="?", default=ARQUIVO_CSV)
+    parser.add_argument("--exportar-csv", action="store_true",
+                        help="Regera o CSV a partir do Parquet (padrão: Parquet a partir do CSV)")
+    args = parser.parse_args(argv)
+
+    if not PARQUET_DISPONIVEL:
+        print("❌ pyarrow não instalado: pip install pyarrow")
+        return 1
+
+    parquet = caminho_colunar(args.csv)
+    if args.exportar_csv:
+        df = pd.read_parquet(parquet)
+        df.to_csv(args.csv, index=False, encoding="utf-8")
+        # Mantém o Parquet como a cópia mais nova
+        os.utime(parquet)
+        print(f"✅ CSV exportado: {args.csv} ({len(df)} linhas)")
+    else:
+        df = pd.read_csv(args.csv, encoding="utf-8")
+        _gravar_parquet(df, parquet)
+        print(f"✅ Parquet gerado: {parquet} ({len(df)} linhas)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,20 +2,119 @@ import pdfplumber
 import pandas as pd
 import re
 import os
+import json
+import queue
+import hashlib
+import threading
 from pathlib import Path
-from typing import List, Dict
+from typing import List, Dict, Tuple
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, wait, FIRST_COMPLETED
 import warnings
 warnings.filterwarnings('ignore')
 
+try:
+    import pyarrow  # noqa: F401 - habilita a cópia colunar (Parquet) da base
+    PARQUET_DISPONIVEL = True
+except ImportError:
+    PARQUET_DISPONIVEL = False
+
+# Mesmo tamanho de grupo do base_cct.py: buscar uma cláusula lê só ~128 textos completos
+LINHAS_POR_GRUPO = 128
+
+
+def caminho_colunar(caminho_csv: str) -> Path:
+    """Arquivo Parquet mantido ao lado do CSV"""
+    return Path(caminho_csv).with_suffix('.parquet')
+
+
+def ler_base(caminho_csv: str) -> pd.DataFrame:
+    """Lê a base pelo Parquet quando ele existe e não é mais antigo que o CSV"""
+    parquet = caminho_colunar(caminho_csv)
+    if PARQUET_DISPONIVEL and parquet.exists() and (
+            not os.path.exists(caminho_csv) or
+            os.stat(parquet).st_mtime_ns >= os.stat(caminho_csv).st_mtime_ns):
+        return pd.read_parquet(parquet)
+    return pd.read_csv(caminho_csv, encoding='utf-8')
+
+
+def gravar_parquet(df: pd.DataFrame, destino: Path) -> None:
+    """Grava o Parquet em arquivo temporário e renomeia (nunca deixa arquivo pela metade)"""
+    temporario = destino.with_suffix('.parquet.tmp')
+    df.reset_index(drop=True).to_parquet(temporario, index=False,
+                                         row_group_size=LINHAS_POR_GRUPO, compression='zstd')
+    os.replace(temporario, destino)
+
+
+COLUNAS_CHAVE = ['Sindicato', 'Convenção', 'Título da Cláusula']
+
+
+def hash_arquivo(caminho: str) -> str:
+    """SHA-256 do conteúdo do arquivo"""
+    h = hashlib.sha256()
+    with open(caminho, 'rb') as f:
+        for bloco in iter(lambda: f.read(1024 * 1024), b''):
+            h.update(bloco)
+    return h.hexdigest()
+
+
+def gravar_json(caminho: Path, dados) -> None:
+    """Grava JSON em arquivo temporário e renomeia (nunca deixa arquivo pela metade)"""
+    temporario = caminho.with_suffix(caminho.suffix + '.tmp')
+    with open(temporario, 'w', encoding='utf-8') as f:
+        json.dump(dados, f, ensure_ascii=False)
+    os.replace(temporario, caminho)
+
+
+def extrair_texto_pdf(caminho_pdf: str) -> str:
+    """
+    Extrai todo o texto do PDF (função de módulo: roda nos processos do pool).
+    Erros de leitura são propagados: um PDF bloqueado ou copiado pela metade
+    não pode virar "zero cláusulas" guardado pelo hash do arquivo.
+    """
+    texto_completo = ""
+    with pdfplumber.open(caminho_pdf) as pdf:
+        for pagina in pdf.pages:
+            texto = pagina.extract_text()
+            if texto:
+                texto_completo += texto + "\n"
+    return texto_completo
+
+
+# Marca de fim de fila entre as etapas do pipeline
+FIM = None
+
+
+def _colocar(fila: queue.Queue, item, parar: threading.Event) -> None:
+    """put() em fila limitada que desiste se o pipeline for interrompido"""
+    while not parar.is_set():
+        try:
+            fila.put(item, timeout=0.1)
+            return
+        except queue.Full:
+            continue
+
+
+def chave_linha(linha: Dict) -> tuple:
+    """Identificador de uma linha extraída (a mesma chave usada para remover duplicatas)"""
+    return tuple(linha[coluna] for coluna in COLUNAS_CHAVE)
+
 
 class ExtractorClausulasCCT:
     """
     Extrator de cláusulas de Convenções Coletivas de Trabalho (CCT) em PDF
     """
     
-    def __init__(self, pasta_pdfs: str = "pdfs_entrada"):
+    ARQ_MANIFESTO = '.manifesto.json'
+    PASTA_CACHE = '.extracao'
+    
+    def __init__(self, pasta_pdfs: str = "pdfs_entrada", workers: int = None, workers_resumo: int = 4):
         self.pasta_pdfs = pasta_pdfs
+        # Processos para extrair texto (padrão: um por núcleo) e threads para os resumos
+        self.workers = max(1, workers or os.cpu_count() or 1)
+        self.workers_resumo = max(1, workers_resumo)
         self.dados_extraidos = []
+        # Chaves das linhas de PDFs apagados ou alterados desde a última execução
+        self.chaves_removidas = set()
         
         # Criar pasta se não existir
         if not os.path.exists(pasta_pdfs):
@@ -24,17 +123,7 @@ class ExtractorClausulasCCT:
     
     def extrair_texto_pdf(self, caminho_pdf: str) -> str:
         """Extrai todo o texto do PDF"""
-        texto_completo = ""
-        try:
-            with pdfplumber.open(caminho_pdf) as pdf:
-                for pagina in pdf.pages:
-                    texto = pagina.extract_text()
-                    if texto:
-                        texto_completo += texto + "\n"
-            return texto_completo
-        except Exception as e:
-            print(f"❌ Erro ao ler {caminho_pdf}: {str(e)}")
-            return ""
+        return extrair_texto_pdf(caminho_pdf)
     
     def identificar_sindicato(self, texto: str) -> str:
         """Identifica o nome do sindicato no texto"""
@@ -76,8 +165,8 @@ class ExtractorClausulasCCT:
         
         return "CONVENÇÃO COLETIVA"
     
-    def extrair_clausulas(self, texto: str) -> List[Dict]:
-        """Extrai as cláusulas do texto"""
+    def extrair_clausulas(self, texto: str, com_resumo: bool = True) -> List[Dict]:
+        """Extrai as cláusulas do texto (com_resumo=False deixa o resumo para depois)"""
         clausulas = []
         
         # Padrões para identificar cláusulas
@@ -108,7 +197,7 @@ class ExtractorClausulasCCT:
             conteudo = re.sub(r'\s+', ' ', conteudo)
             
             # Gerar resumo (primeiras 150 caracteres ou primeira frase)
-            resumo = self.gerar_resumo(conteudo)
+            resumo = self.gerar_resumo(conteudo) if com_resumo else None
             
             clausulas.append({
                 'titulo': titulo,
@@ -137,93 +226,337 @@ class ExtractorClausulasCCT:
         
         return resumo + "..."
     
-    def processar_pdf(self, caminho_pdf: str) -> int:
-        """Processa um único PDF e retorna número de cláusulas extraídas"""
-        print(f"\n📄 Processando: {os.path.basename(caminho_pdf)}")
+    def segmentar_pdf(self, texto: str, nome_arquivo: str, com_resumo: bool = True) -> Tuple[str, str, List[Dict]]:
+        """Identifica sindicato e convenção e extrai as cláusulas de um PDF já lido"""
+        print(f"\n📄 Processando: {nome_arquivo}")
         
-        # Extrair texto
-        texto = self.extrair_texto_pdf(caminho_pdf)
         if not texto:
             print(f"   ⚠️ Nenhum texto extraído")
-            return 0
+            return "", "", []
         
         # Identificar sindicato e convenção
         sindicato = self.identificar_sindicato(texto)
-        convencao = self.identificar_convencao(texto, os.path.basename(caminho_pdf))
+        convencao = self.identificar_convencao(texto, nome_arquivo)
         
         print(f"   📌 Sindicato: {sindicato}")
         print(f"   📌 Convenção: {convencao}")
         
         # Extrair cláusulas
-        clausulas = self.extrair_clausulas(texto)
+        clausulas = self.extrair_clausulas(texto, com_resumo)
         
         if not clausulas:
             print(f"   ⚠️ Nenhuma cláusula encontrada")
-            return 0
+        else:
+            print(f"   ✅ {len(clausulas)} cláusulas extraídas")
         
-        print(f"   ✅ {len(clausulas)} cláusulas extraídas")
+        return sindicato, convencao, clausulas
+    
+    @staticmethod
+    def montar_linhas(sindicato: str, convencao: str, clausulas: List[Dict]) -> List[Dict]:
+        """Linhas no formato do CSV"""
+        return [{
+            'Sindicato': sindicato,
+            'Convenção': convencao,
+            'Título da Cláusula': clausula['titulo'],
+            'Resumo': clausula['resumo'],
+            'Cláusula Completa': clausula['conteudo_completo']
+        } for clausula in clausulas]
+    
+    def resumir_linhas(self, sindicato: str, convencao: str, clausulas: List[Dict]) -> List[Dict]:
+        """Etapa de resumo de um PDF (roda no pool de threads de resumo)"""
+        for clausula in clausulas:
+            clausula['resumo'] = self.gerar_resumo(clausula['conteudo_completo'])
+        return self.montar_linhas(sindicato, convencao, clausulas)
+    
+    def processar_pdf(self, caminho_pdf: str) -> int:
+        """Processa um único PDF e retorna número de cláusulas extraídas"""
+        texto = self.extrair_texto_pdf(caminho_pdf)
+        sindicato, convencao, clausulas = self.segmentar_pdf(texto, os.path.basename(caminho_pdf))
         
         # Adicionar aos dados
-        for clausula in clausulas:
-            self.dados_extraidos.append({
-                'Sindicato': sindicato,
-                'Convenção': convencao,
-                'Título da Cláusula': clausula['titulo'],
-                'Resumo': clausula['resumo'],
-                'Cláusula Completa': clausula['conteudo_completo']
-            })
+        self.dados_extraidos.extend(self.montar_linhas(sindicato, convencao, clausulas))
         
         return len(clausulas)
     
+    def _ler_manifesto(self) -> Dict:
+        caminho = Path(self.pasta_pdfs) / self.ARQ_MANIFESTO
+        try:
+            with open(caminho, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+    
+    def carregar_manifesto(self) -> Dict:
+        """
+        Manifesto dos PDFs já processados: nome -> tamanho, mtime, hash do conteúdo
+        e chaves das linhas emitidas (as linhas ficam em .extracao/<hash>.json)
+        """
+        return self._ler_manifesto().get('arquivos', {})
+    
+    def carregar_remocoes_pendentes(self) -> set:
+        """Chaves de linhas de PDFs apagados ou alterados que ainda não saíram do CSV mesclado"""
+        return set(map(tuple, self._ler_manifesto().get('removidas_pendentes', [])))
+    
+    def salvar_manifesto(self, arquivos: Dict) -> None:
+        """Grava o manifesto com as remoções ainda não aplicadas (self.chaves_removidas)"""
+        gravar_json(Path(self.pasta_pdfs) / self.ARQ_MANIFESTO, {
+            'versao': 1,
+            'arquivos': arquivos,
+            'removidas_pendentes': sorted(map(list, self.chaves_removidas)),
+        })
+        
+        # Remove as linhas guardadas de PDFs que saíram do manifesto
+        hashes = {entrada['hash'] for entrada in arquivos.values()}
+        for cache in (Path(self.pasta_pdfs) / self.PASTA_CACHE).glob('*.json'):
+            if cache.stem not in hashes:
+                cache.unlink()
+    
+    def _linhas_guardadas(self, hash_pdf: str):
+        """Linhas já extraídas de um PDF com esse conteúdo, ou None"""
+        try:
+            with open(Path(self.pasta_pdfs) / self.PASTA_CACHE / f"{hash_pdf}.json", 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+    
+    def _guardar_linhas(self, hash_pdf: str, linhas: List[Dict]) -> None:
+        pasta = Path(self.pasta_pdfs) / self.PASTA_CACHE
+        pasta.mkdir(exist_ok=True)
+        gravar_json(pasta / f"{hash_pdf}.json", linhas)
+    
+    def _descobrir(self, arquivos_pdf: List[Path], manifesto: Dict,
+                   fila_arquivos: queue.Queue, fila_textos: queue.Queue, parar: threading.Event,
+                   erros: List[Exception]) -> None:
+        """
+        Etapa 1 (thread): compara cada PDF com o manifesto. Os inalterados vão
+        direto para o fim do pipeline com as linhas guardadas; os demais seguem
+        para a extração de texto.
+        """
+        try:
+            for posicao, pdf in enumerate(arquivos_pdf):
+                info = pdf.stat()
+                entrada = manifesto.get(pdf.name)
+                linhas = None
+                
+                # Mesmo tamanho e data: nem precisa ler o arquivo
+                if entrada and entrada['tamanho'] == info.st_size and entrada['mtime_ns'] == info.st_mtime_ns:
+                    hash_pdf = entrada['hash']
+                    linhas = self._linhas_guardadas(hash_pdf)
+                else:
+                    hash_pdf = hash_arquivo(str(pdf))
+                    if entrada and entrada['hash'] == hash_pdf:
+                        linhas = self._linhas_guardadas(hash_pdf)
+                
+                item = {'posicao': posicao, 'pdf': pdf, 'tamanho': info.st_size,
+                        'mtime_ns': info.st_mtime_ns, 'hash': hash_pdf}
+                if linhas is None:
+                    _colocar(fila_arquivos, item, parar)
+                else:
+                    item['linhas'] = linhas
+                    _colocar(fila_textos, item, parar)
+        except Exception as erro:
+            erros.append(erro)
+        finally:
+            _colocar(fila_arquivos, FIM, parar)
+    
+    def _extrair_textos(self, pool: ProcessPoolExecutor, limite: int,
+                        fila_arquivos: queue.Queue, fila_textos: queue.Queue, parar: threading.Event,
+                        erros: List[Exception]) -> None:
+        """Etapa 2 (thread): extração de texto no pool de processos, no máximo `limite` PDFs por vez"""
+        em_andamento = {}
+        fim = False
+        try:
+            while (not fim or em_andamento) and not parar.is_set():
+                while not fim and len(em_andamento) < limite:
+                    try:
+                        item = fila_arquivos.get(block=not em_andamento, timeout=0.1)
+                    except queue.Empty:
+                        break
+                    if item is FIM:
+                        fim = True
+                    else:
+                        em_andamento[pool.submit(extrair_texto_pdf, str(item['pdf']))] = item
+                
+                prontos, _ = wait(em_andamento, timeout=0.1, return_when=FIRST_COMPLETED)
+                for futuro in prontos:
+                    item = em_andamento.pop(futuro)
+                    try:
+                        item['texto'] = futuro.result()
+                    except Exception as erro:
+                        # Falha de leitura: o PDF fica fora do manifesto e do cache e é lido de novo na próxima execução
+                        print(f"❌ Erro ao ler {item['pdf'].name}: {erro}")
+                        item['erro'] = str(erro)
+                    _colocar(fila_textos, item, parar)
+        except Exception as erro:
+            erros.append(erro)
+        finally:
+            _colocar(fila_textos, FIM, parar)
+    
     def processar_todos_pdfs(self) -> pd.DataFrame:
-        """Processa todos os PDFs da pasta"""
-        arquivos_pdf = list(Path(self.pasta_pdfs).glob("*.pdf"))
+        """
+        Processa os PDFs da pasta em um pipeline: descoberta (manifesto) ->
+        extração de texto (pool de processos) -> segmentação das cláusulas ->
+        resumos (pool de threads). As etapas são ligadas por filas limitadas,
+        então só alguns textos de PDF ficam em memória ao mesmo tempo.
+        
+        Só PDFs novos ou alterados são lidos de novo; os demais reaproveitam as
+        linhas da execução anterior (pelo manifesto).
+        """
+        arquivos_pdf = sorted(Path(self.pasta_pdfs).glob("*.pdf"))
+        manifesto = self.carregar_manifesto()
+        # Remoções de execuções anteriores ainda não aplicadas por uma mescla
+        self.chaves_removidas = self.carregar_remocoes_pendentes()
         
-        if not arquivos_pdf:
+        if not arquivos_pdf and not manifesto:
             print(f"❌ Nenhum arquivo PDF encontrado na pasta '{self.pasta_pdfs}'")
-            return pd.DataFrame()
+            return pd.DataFrame(columns=COLUNAS_CHAVE + ['Resumo', 'Cláusula Completa'])
         
         print(f"\n🔍 Encontrados {len(arquivos_pdf)} arquivos PDF\n")
         print("="*60)
         
-        total_clausulas = 0
-        for pdf in arquivos_pdf:
-            num_clausulas = self.processar_pdf(str(pdf))
-            total_clausulas += num_clausulas
+        limite = 2 * self.workers
+        fila_arquivos = queue.Queue(maxsize=limite)
+        fila_textos = queue.Queue(maxsize=limite)
+        parar = threading.Event()
+        erros = []
+        concluidos = {}
+        falhas = []
+        processados = 0
+        
+        with ProcessPoolExecutor(max_workers=self.workers) as pool_textos, \
+                ThreadPoolExecutor(max_workers=self.workers_resumo) as pool_resumos:
+            etapas = [
+                threading.Thread(target=self._descobrir, daemon=True,
+                                 args=(arquivos_pdf, manifesto, fila_arquivos, fila_textos, parar, erros)),
+                threading.Thread(target=self._extrair_textos, daemon=True,
+                                 args=(pool_textos, limite, fila_arquivos, fila_textos, parar, erros)),
+            ]
+            for etapa in etapas:
+                etapa.start()
+            
+            resumos = {}
+            
+            def coletar(futuros):
+                for futuro in futuros:
+                    item = resumos.pop(futuro)
+                    item['linhas'] = futuro.result()
+                    self._guardar_linhas(item['hash'], item['linhas'])
+                    concluidos[item['posicao']] = item
+            
+            try:
+                # Etapa 3 (esta thread): segmentação; etapa 4: resumos no pool de threads
+                while True:
+                    item = fila_textos.get()
+                    if item is FIM:
+                        break
+                    if 'linhas' in item:
+                        concluidos[item['posicao']] = item
+                        continue
+                    if 'erro' in item:
+                        falhas.append(item)
+                        continue
+                    
+                    sindicato, convencao, clausulas = self.segmentar_pdf(
+                        item.pop('texto'), item['pdf'].name, com_resumo=False)
+                    processados += 1
+                    
+                    if len(resumos) >= limite:
+                        coletar(wait(resumos, return_when=FIRST_COMPLETED).done)
+                    resumos[pool_resumos.submit(self.resumir_linhas, sindicato, convencao, clausulas)] = item
+                
+                coletar(list(resumos))
+            finally:
+                parar.set()
+                for etapa in etapas:
+                    etapa.join()
+        
+        # Falha na descoberta ou na extração interrompe o processamento
+        if erros:
+            raise erros[0]
+        
+        novo_manifesto = {}
+        chaves_antigas = set()
+        for posicao in sorted(concluidos):
+            item = concluidos[posicao]
+            entrada = manifesto.get(item['pdf'].name)
+            if entrada and entrada['hash'] != item['hash']:
+                chaves_antigas.update(map(tuple, entrada['linhas']))
+            
+            self.dados_extraidos.extend(item['linhas'])
+            novo_manifesto[item['pdf'].name] = {
+                'tamanho': item['tamanho'],
+                'mtime_ns': item['mtime_ns'],
+                'hash': item['hash'],
+                'linhas': [list(chave_linha(linha)) for linha in item['linhas']],
+            }
+        
+        # PDFs que não puderam ser lidos mantêm a entrada anterior (as linhas
+        # deles não são removidas) e são lidos de novo na próxima execução
+        for item in falhas:
+            if item['pdf'].name in manifesto:
+                novo_manifesto[item['pdf'].name] = manifesto[item['pdf'].name]
+        
+        # PDFs apagados da pasta
+        apagados = [nome for nome in manifesto if nome not in novo_manifesto]
+        for nome in apagados:
+            chaves_antigas.update(map(tuple, manifesto[nome]['linhas']))
+        
+        # Linhas que ainda são emitidas por algum PDF não são removidas; as
+        # remoções ficam pendentes no manifesto até uma mescla aplicá-las
+        self.chaves_removidas = ((self.chaves_removidas | chaves_antigas)
+                                 - {chave_linha(linha) for linha in self.dados_extraidos})
+        self.salvar_manifesto(novo_manifesto)
         
         print("\n" + "="*60)
         print(f"\n✅ PROCESSAMENTO CONCLUÍDO!")
-        print(f"   📊 Total de cláusulas extraídas: {total_clausulas}")
-        print(f"   📁 Total de PDFs processados: {len(arquivos_pdf)}")
+        print(f"   📊 Total de cláusulas extraídas: {len(self.dados_extraidos)}")
+        print(f"   📁 Total de PDFs processados: {processados} "
+              f"(reaproveitados: {len(arquivos_pdf) - processados - len(falhas)}, removidos: {len(apagados)})")
+        if falhas:
+            print(f"   ⚠️ PDFs com erro de leitura (tentados de novo na próxima execução): {len(falhas)}")
         
-        return pd.DataFrame(self.dados_extraidos)
+        return pd.DataFrame(self.dados_extraidos, columns=COLUNAS_CHAVE + ['Resumo', 'Cláusula Completa'])
     
-    def salvar_csv(self, df: pd.DataFrame, nome_arquivo: str = "clausulas_extraidas.csv"):
-        """Salva o DataFrame em CSV"""
-        if df.empty:
+    def salvar_csv(self, df: pd.DataFrame, nome_arquivo: str = "clausulas_extraidas.csv",
+                   aceitar_vazio: bool = False) -> bool:
+        """Salva o DataFrame em CSV; False se não havia dados (e aceitar_vazio é falso)"""
+        if df.empty and not aceitar_vazio:
             print("\n❌ Nenhum dado para salvar")
-            return
+            return False
         
         df.to_csv(nome_arquivo, index=False, encoding='utf-8')
+        # Cópia colunar gravada depois do CSV (fica mais nova que ele)
+        if PARQUET_DISPONIVEL:
+            gravar_parquet(df, caminho_colunar(nome_arquivo))
         print(f"\n💾 Arquivo salvo: {nome_arquivo}")
         print(f"   📈 Total de linhas: {len(df)}")
+        return True
+    
+    def confirmar_remocoes(self) -> None:
+        """Depois que a mescla foi gravada, as remoções pendentes deixam o manifesto"""
+        self.chaves_removidas = set()
+        self.salvar_manifesto(self.carregar_manifesto())
     
     def mesclar_com_csv_existente(self, df_novo: pd.DataFrame, 
                                   csv_existente: str = "clausulas_farmaceuticos.csv"):
-        """Mescla novos dados com CSV existente"""
-        if os.path.exists(csv_existente):
-            df_existente = pd.read_csv(csv_existente, encoding='utf-8')
-            df_final = pd.concat([df_existente, df_novo], ignore_index=True)
+        """
+        Mescla novos dados com CSV existente: linhas com a mesma chave são
+        substituídas e as de PDFs apagados ou alterados são removidas
+        """
+        if os.path.exists(csv_existente) or os.path.exists(caminho_colunar(csv_existente)):
+            df_existente = ler_base(csv_existente)
+            df_novo = df_novo.drop_duplicates(subset=COLUNAS_CHAVE, keep='last')
             
-            # Remover duplicatas
-            df_final = df_final.drop_duplicates(
-                subset=['Sindicato', 'Convenção', 'Título da Cláusula'],
-                keep='last'
-            )
+            chaves_existentes = pd.MultiIndex.from_frame(df_existente[COLUNAS_CHAVE])
+            substituidas = chaves_existentes.isin(pd.MultiIndex.from_frame(df_novo[COLUNAS_CHAVE]))
+            removidas = chaves_existentes.isin(list(self.chaves_removidas)) & ~substituidas
+            
+            df_final = pd.concat([df_existente[~(substituidas | removidas)], df_novo], ignore_index=True)
             
             print(f"\n🔄 Mesclando com arquivo existente...")
             print(f"   📊 Registros existentes: {len(df_existente)}")
             print(f"   ➕ Novos registros: {len(df_novo)}")
+            print(f"   ➖ Removidos (PDFs apagados ou alterados): {int(removidas.sum())}")
             print(f"   📈 Total final: {len(df_final)}")
             
             return df_final
@@ -243,15 +576,21 @@ def main():
     # Processar PDFs
     df = extrator.processar_todos_pdfs()
     
-    if not df.empty:
+    # Mesmo sem linhas novas, PDFs apagados ou alterados ainda podem ter linhas a remover
+    if not df.empty or extrator.chaves_removidas:
         # Salvar novo arquivo
-        extrator.salvar_csv(df, "clausulas_extraidas.csv")
+        if not df.empty:
+            extrator.salvar_csv(df, "clausulas_extraidas.csv")
+        else:
+            print("\n⚠️ Nenhum dado foi extraído, mas há cláusulas de PDFs apagados ou alterados a remover")
         
-        # Opção: mesclar com arquivo existente
+        # Opção: mesclar com arquivo existente (sem mescla, as remoções ficam pendentes)
         resposta = input("\n❓ Deseja mesclar com 'clausulas_farmaceuticos.csv'? (s/n): ")
         if resposta.lower() == 's':
             df_final = extrator.mesclar_com_csv_existente(df)
-            extrator.salvar_csv(df_final, "clausulas_farmaceuticos.csv")
+            # Vazia se todas as cláusulas saíram com os PDFs apagados: gravar mesmo assim
+            if extrator.salvar_csv(df_final, "clausulas_farmaceuticos.csv", aceitar_vazio=True):
+                extrator.confirmar_remocoes()
         
         print("\n✅ Processo concluído com sucesso!")
     else: